@@ -5,13 +5,18 @@ Every other guard scenario resolves by provider reference (`resolve_provider`),
 the `find_provider` lookup that by-type resolution pays on each call. G16 isolates that lookup
 on a small graph; G17 repeats it against a 200-provider registry so the cost is guarded at the
 scale a real application registers, not just at the 2-11 providers the other scenarios use.
+G16m resolves a handler's markers through the integration kit, as every marker-based
+integration does per call. G16r calls a `container.resolver(Service)` handle instead, the
+hot-loop form of G16, and G16s reads `Service` from `container.snapshot_singletons()`.
 Containers are built and warmed in setup; only the resolve is timed. See benchmarks/README.md.
 """
 
 import dataclasses
+import typing
 
-from benchmarks._pinned import ITER_UNDER_300NS, ROUNDS
+from benchmarks._pinned import ITER_UNDER_1US, ITER_UNDER_300NS, ROUNDS
 from modern_di import Container, Group, Scope, providers
+from modern_di.integrations import Marker, parse_markers, resolve_markers
 
 
 # --- G16 subject graph: the G1/G2 shape, resolved by type ------------------
@@ -39,6 +44,44 @@ def test_g16_resolve_by_type(benchmark):
     assert isinstance(result.dep, Dep)
 
 
+def test_g16r_resolver_handle(benchmark):
+    container = Container(scope=Scope.APP, groups=[ByTypeGroup])
+    container.open()
+    handle = container.resolver(Service)
+    handle()  # warm the cache and the compiled resolver
+    result = benchmark.pedantic(handle, rounds=ROUNDS, iterations=ITER_UNDER_300NS)
+    assert isinstance(result, Service)
+    assert isinstance(result.dep, Dep)
+
+
+def test_g16s_singleton_snapshot_read(benchmark):
+    container = Container(scope=Scope.APP, groups=[ByTypeGroup])
+    container.open()
+    container.resolve(Service)  # the snapshot holds only instances already created
+    singletons = container.snapshot_singletons()
+    result = benchmark.pedantic(singletons.__getitem__, args=(Service,), rounds=ROUNDS, iterations=ITER_UNDER_300NS)
+    assert isinstance(result, Service)
+    assert isinstance(result.dep, Dep)
+
+
+# --- G16m: the same graph injected into a handler, one marker by type and one by provider ---
+def _handler(
+    svc: typing.Annotated[Service, Marker(Service)], dep: typing.Annotated[Dep, Marker(ByTypeGroup.dep)]
+) -> None:
+    pass  # pragma: no cover
+
+
+def test_g16m_resolve_markers(benchmark):
+    # `parse_markers` runs once at decoration time; only the per-call `resolve_markers` is timed.
+    container = Container(scope=Scope.APP, groups=[ByTypeGroup])
+    container.open()
+    markers = parse_markers(_handler)
+    resolve_markers(container, markers)  # warm the caches and the injector's binding
+    result = benchmark.pedantic(resolve_markers, args=(container, markers), rounds=ROUNDS, iterations=ITER_UNDER_1US)
+    assert isinstance(result["svc"], Service)
+    assert result["dep"] is result["svc"].dep
+
+
 # --- G17 subject graph: the same resolve against a 200-provider registry ----
 _REGISTRY_SIZE = 200
 _FILLER_TYPES = [
@@ -7,10 +7,15 @@ the first resolve compiles the whole provider graph from scratch. Every other
 guard file builds/warms in setup and times only the steady-state call; this one
 deliberately measures construction + compile + resolve as a single unit, the
 cost paid once per container in short-lived processes (serverless, CLI, tests)
-and at every app startup. See benchmarks/README.md.
+and at every app startup. G8d compiles a 300-deep transient chain node by node, where a
+compile that walks its whole subgraph shows up as quadratic. G19 is G8's late-registration
+counterpart: one `add_providers` on a warm 500-provider registry, then every provider resolved
+again. See benchmarks/README.md.
 """
 
 import dataclasses
+import itertools
+import typing
 
 from modern_di import Container, Group, Scope, providers
 
@@ -93,3 +98,101 @@ def test_g8b_cold_first_resolve_cached(benchmark):
     result = benchmark(_cold_build_and_resolve_cached)
     assert isinstance(result, C0)
     assert isinstance(result.c1.c2.c3.c4.c5, C5)
+
+
+# --- G8c: G8's graph compiled eagerly by `compile_all()`, then resolved warm ---
+def _cold_build_compile_all_and_resolve() -> C0:
+    container = Container(scope=Scope.APP, groups=[ChainGroup])
+    container.compile_all()
+    return container.resolve_provider(ChainGroup.c0)
+
+
+def test_g8c_cold_compile_all(benchmark):
+    # G8's unit of work with the compile moved from the first resolve into `compile_all()`. Read
+    # against G8: the difference is the graph walk `compile_all` adds on top of the same compile,
+    # i.e. what a startup hook pays so the first live request hits only warm resolvers.
+    result = benchmark(_cold_build_compile_all_and_resolve)
+    assert isinstance(result, C0)
+    assert isinstance(result.c1.c2.c3.c4.c5, C5)
+
+
+# --- G8d: every node of a 300-deep transient chain compiled on a fresh container ---
+_DEEP_SIZE = 300
+_DEEP_TYPES = [dataclasses.make_dataclass("Deep0", [], slots=True)]
+for _i in range(1, _DEEP_SIZE):
+    _DEEP_TYPES.append(dataclasses.make_dataclass(f"Deep{_i}", [("prev", _DEEP_TYPES[-1])], slots=True))
+_DEEP_NODES = [providers.Factory(creator=t, scope=Scope.APP) for t in _DEEP_TYPES]
+_DEEP_GROUP = type("DeepGroup", (Group,), {f"d{i}": p for i, p in enumerate(_DEEP_NODES)})
+
+
+def _cold_compile_deep_chain() -> typing.Any:  # noqa: ANN401
+    container = Container(scope=Scope.APP, groups=[_DEEP_GROUP])
+    for node in _DEEP_NODES:  # leaf first: each compile finds its dependency already compiled
+        result = container.resolve_provider(node)
+    return result
+
+
+def test_g8d_cold_compile_deep_chain(benchmark):
+    # G8's cold compile at the scale of a generated graph. Nothing here is hot or shared, so no
+    # compile may walk the subgraph below it: a per-compile walk turns the whole into O(n^2)
+    # and reads as a 10x jump against G8's per-node cost.
+    result = benchmark(_cold_compile_deep_chain)
+    assert isinstance(result, _DEEP_TYPES[-1])
+    assert isinstance(result.prev, _DEEP_TYPES[-2])
+
+
+# --- G19: a late registration on a warm 500-provider registry ----------------
+@dataclasses.dataclass(slots=True)
+class Base:
+    pass
+
+
+_WIDE_SIZE = 500
+_NODE_TYPES = [dataclasses.make_dataclass(f"Node{i}", [("base", Base)], slots=True) for i in range(_WIDE_SIZE)]
+_NODES = [providers.Factory(creator=t, scope=Scope.APP) for t in _NODE_TYPES]
+_WIDE_GROUP = type(
+    "WideGroup",
+    (Group,),
+    {
+        "base": providers.Factory(creator=Base, scope=Scope.APP, cache=True),
+        **{f"n{i}": p for i, p in enumerate(_NODES)},
+    },
+)
+_late_ids = itertools.count()
+
+
+def _warm_wide_container() -> Container:
+    container = Container(scope=Scope.APP, groups=[_WIDE_GROUP])
+    for node in _NODES:
+        container.resolve_provider(node)
+    return container
+
+
+def _resolve_every_node(container: Container) -> typing.Any:  # noqa: ANN401
+    for node in _NODES:
+        result = container.resolve_provider(node)
+    return result
+
+
+def _register_late_and_resolve(container: Container, late: type) -> typing.Any:  # noqa: ANN401
+    container.add_providers(providers.Factory(creator=late, scope=Scope.APP))
+    return _resolve_every_node(container)
+
+
+def test_g19w_resolve_wide_registry_warm(benchmark):
+    # Control: every node of the warm 500-provider graph resolved once, no registration.
+    container = _warm_wide_container()
+    result = benchmark(_resolve_every_node, container)
+    assert isinstance(result.base, Base)
+
+
+def test_g19_late_registration_on_a_warm_wide_registry(benchmark):
+    # An integration registering one provider after startup. Only plans that looked up the new type
+    # recompile -- here none -- so read against G19w: the difference is the registration itself,
+    # not a recompile of the 500 resolvers that could not see it.
+    def setup() -> tuple[tuple[Container, type], dict[str, typing.Any]]:
+        late = dataclasses.make_dataclass(f"Late{next(_late_ids)}", [], slots=True)
+        return (_warm_wide_container(), late), {}
+
+    result = benchmark.pedantic(_register_late_and_resolve, setup=setup, rounds=200, iterations=1)
+    assert isinstance(result.base, Base)
@@ -13,6 +13,9 @@ needed). Two sub-cases:
   they contend on the double-checked creation lock (`CacheItem.get_or_create`). Singleton
   creation is serialized by design, so this is expected *not* to scale even free-threaded — the
   measured cost is the contention itself (the known trade-off vs lock-free-slot rivals).
+- G15d disjoint first-resolve: the same K singletons split across the N threads. Creation locks
+  are per provider, so no thread waits on another; on a free-threaded build this is the cold start
+  that can scale.
 
 Read the batch-time-vs-thread-count trend, not the absolutes. The GIL vs free-threaded comparison
 comes from running the whole file under each build (same version/arch), e.g.:
@@ -110,3 +113,24 @@ def test_g15_concurrent_first_resolve(benchmark, n_threads):
         _run_parallel(_worker, n_threads)
 
     benchmark.pedantic(_batch, setup=_setup, rounds=120, iterations=1)
+
+
+@pytest.mark.parametrize("n_threads", _THREAD_COUNTS)
+def test_g15d_concurrent_first_resolve_disjoint(benchmark, n_threads):
+    # G15's K cold singletons split across the N threads, so no two threads ever create the same
+    # one. Each cached provider creates under its own lock, so these creations never wait on each
+    # other; read against G15, where every thread races for the same singletons.
+    def _setup() -> "tuple[tuple[Container, list[list[providers.Factory[object]]]], dict[str, object]]":
+        container = Container(scope=Scope.APP, groups=[_COLD_GROUP])
+        container.open()
+        return (container, [_COLD_PROVIDERS[i::n_threads] for i in range(n_threads)]), {}
+
+    def _batch(container, chunks) -> None:
+        def _worker() -> None:
+            for provider in chunks.pop():  # list.pop is atomic: each thread takes its own chunk
+                container.resolve_provider(provider)
+
+        _run_parallel(_worker, n_threads)
+        assert container.creation_lock_waits().waits == 0
+
+    benchmark.pedantic(_batch, setup=_setup, rounds=120, iterations=1)
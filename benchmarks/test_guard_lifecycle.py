@@ -12,8 +12,9 @@ See benchmarks/README.md.
 
 import asyncio
 import dataclasses
+import time
 
-from benchmarks._pinned import ITER_UNDER_1US, ROUNDS
+from benchmarks._pinned import ITER_UNDER_1US, ITER_UNDER_2US, ROUNDS
 from modern_di import Container, Group, Scope, providers
 
 
@@ -47,6 +48,28 @@ def test_g6b_build_child_container_auto_scope(benchmark):
     assert result.scope is Scope.SESSION
 
 
+def _build_and_close(app: Container) -> Container:
+    request = app.build_child_container(scope=Scope.REQUEST)
+    request.close_sync()
+    return request
+
+
+def test_g6c_child_build_close_cycle(benchmark):
+    # G6 plus the close that ends every request: the unit a child pool recycles. Read G6p against it.
+    app = Container(scope=Scope.APP, groups=[BuildGroup])
+    result = benchmark.pedantic(_build_and_close, args=(app,), rounds=ROUNDS, iterations=ITER_UNDER_2US)
+    assert result.closed
+
+
+def test_g6p_child_build_close_cycle_pooled(benchmark):
+    # G6c on a root built with `child_pool_size`: the close resets the child in place and the next
+    # build hands the same object back, so no Container, registries, lock or scope map is allocated.
+    app = Container(scope=Scope.APP, groups=[BuildGroup], child_pool_size=8)
+    first = _build_and_close(app)
+    result = benchmark.pedantic(_build_and_close, args=(app,), rounds=ROUNDS, iterations=ITER_UNDER_2US)
+    assert result is first
+
+
 # --- G7: cached REQUEST connection, sync create, async finalizer -----------
 @dataclasses.dataclass(slots=True)
 class Connection:
@@ -117,6 +140,67 @@ def test_g7c_event_loop_floor_control(benchmark):
         loop.close()
 
 
+# --- G7s / G7o: concurrent request teardown with a slow sync finalizer ------
+# A sync finalizer that blocks for 1 ms (a Session.close() flushing over the network). G7s runs it
+# inline, so _CONCURRENT requests closing together still take one after another: the loop is blocked
+# for _CONCURRENT ms. G7o sets `offload_finalizer=True`; the finalizers run in the loop's default
+# executor and overlap, and the batch drops towards a single finalizer's time.
+_CONCURRENT = 4
+_SLOW_FINALIZER_SECONDS = 0.001
+
+
+def _slow_close(conn: Connection) -> None:
+    time.sleep(_SLOW_FINALIZER_SECONDS)
+    conn.closed = True
+
+
+class SlowCloseGroup(Group):
+    conn = providers.Factory(
+        creator=Connection, scope=Scope.REQUEST, cache=providers.CacheSettings(finalizer=_slow_close)
+    )
+    offloaded_conn = providers.Factory(
+        creator=Connection,
+        scope=Scope.REQUEST,
+        cache=providers.CacheSettings(finalizer=_slow_close, offload_finalizer=True),
+        bound_type=None,
+    )
+
+
+def _concurrent_teardown(benchmark, provider: providers.Factory[Connection]) -> list[Connection]:
+    app = Container(scope=Scope.APP, groups=[SlowCloseGroup])
+    app.open()
+    loop = asyncio.new_event_loop()
+
+    async def _one_request() -> Connection:
+        req = app.build_child_container(scope=Scope.REQUEST)
+        req.open()
+        conn = req.resolve_provider(provider)
+        await asyncio.sleep(0)  # the requests interleave, as concurrent handlers do
+        await req.close_async()
+        return conn
+
+    async def _batch() -> list[Connection]:
+        return list(await asyncio.gather(*(_one_request() for _ in range(_CONCURRENT))))
+
+    def _run_batch() -> list[Connection]:
+        return loop.run_until_complete(_batch())
+
+    try:
+        return benchmark(_run_batch)
+    finally:
+        loop.close()
+
+
+def test_g7s_slow_sync_finalizer_inline(benchmark):
+    result = _concurrent_teardown(benchmark, SlowCloseGroup.conn)
+    assert all(conn.closed for conn in result)
+
+
+def test_g7o_slow_sync_finalizer_offloaded(benchmark):
+    result = _concurrent_teardown(benchmark, SlowCloseGroup.offloaded_conn)
+    assert all(conn.closed for conn in result)
+
+
 # --- G13: teardown at scale -- 10 cached REQUEST resources, sync finalizers ---
 # G7 finalizes one resource; a real request closes several. G13 measures the per-request cycle
 # with 10 cached REQUEST providers (each a sync finalizer) so the LIFO close loop is exercised.
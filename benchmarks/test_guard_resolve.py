@@ -53,6 +53,18 @@ def test_g2_cached_resolve(benchmark):
     assert isinstance(result, Service)
 
 
+def test_g2p_cached_resolve_pinned(benchmark):
+    # G2 on a root built with `pin_singletons=True`: the APP singleton's resolver closes over its
+    # CacheItem, so the warm hit is one cell read with no navigation and no `_items` lookup. Read
+    # against G2; what remains is the `resolve_provider` dispatch and the override guard.
+    container = Container(scope=Scope.APP, groups=[SingletonGroup], pin_singletons=True)
+    container.resolve_provider(SingletonGroup.svc)  # warm the cache
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(SingletonGroup.svc,), rounds=ROUNDS, iterations=ITER_UNDER_300NS
+    )
+    assert isinstance(result, Service)
+
+
 # --- G3 subject graph: depth-6 chain ---------------------------------------
 @dataclasses.dataclass(slots=True)
 class C5:
@@ -103,6 +115,83 @@ def test_g3_deep_chain(benchmark):
     assert isinstance(result.c1.c2.c3.c4.c5, C5)
 
 
+class HotChainGroup(Group):
+    c5 = providers.Factory(creator=C5, scope=Scope.APP)
+    c4 = providers.Factory(creator=C4, scope=Scope.APP)
+    c3 = providers.Factory(creator=C3, scope=Scope.APP)
+    c2 = providers.Factory(creator=C2, scope=Scope.APP)
+    c1 = providers.Factory(creator=C1, scope=Scope.APP)
+    c0 = providers.Factory(creator=C0, scope=Scope.APP, hot=True)
+
+
+def test_g3h_deep_chain_hot(benchmark):
+    # G3 with its root marked `hot=True`: the whole chain compiles into one fused resolver that
+    # calls the six creators in order, with no per-node resolver frame. Read against G3.
+    container = Container(scope=Scope.APP, groups=[HotChainGroup])
+    container.open()
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(HotChainGroup.c0,), rounds=ROUNDS, iterations=ITER_UNDER_1US
+    )
+    assert isinstance(result, C0)
+    assert isinstance(result.c1.c2.c3.c4.c5, C5)
+
+
+# --- G3d / G3s subject graph: a transient diamond over a two-node subtree ---
+@dataclasses.dataclass(slots=True)
+class DBase:
+    pass
+
+
+@dataclasses.dataclass(slots=True)
+class DShared:
+    base: DBase
+
+
+@dataclasses.dataclass(slots=True)
+class DLeft:
+    shared: DShared
+
+
+@dataclasses.dataclass(slots=True)
+class DRight:
+    shared: DShared
+
+
+@dataclasses.dataclass(slots=True)
+class DTop:
+    left: DLeft
+    right: DRight
+
+
+class DiamondGroup(Group):
+    base = providers.Factory(creator=DBase, scope=Scope.APP)
+    shared = providers.Factory(creator=DShared, scope=Scope.APP)
+    left = providers.Factory(creator=DLeft, scope=Scope.APP)
+    right = providers.Factory(creator=DRight, scope=Scope.APP)
+    top = providers.Factory(creator=DTop, scope=Scope.APP)
+
+
+def test_g3d_transient_diamond(benchmark):
+    # Default transient semantics: each use of `shared` builds its own subtree, 7 creator calls.
+    container = Container(scope=Scope.APP, groups=[DiamondGroup])
+    container.open()
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(DiamondGroup.top,), rounds=ROUNDS, iterations=ITER_UNDER_2US
+    )
+    assert result.left.shared is not result.right.shared
+
+
+def test_g3s_transient_diamond_shared(benchmark):
+    # G3d on a root built with `share_transients=True`: `shared` is built once per resolve, 5 creator
+    # calls in one fused resolver. Read against G3d.
+    container = Container(scope=Scope.APP, groups=[DiamondGroup], share_transients=True)
+    container.open()
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(DiamondGroup.top,), rounds=ROUNDS, iterations=ITER_UNDER_2US
+    )
+    assert result.left.shared is result.right.shared
+
+
 # --- G4 subject graph: one object, 10 sibling deps -------------------------
 @dataclasses.dataclass(slots=True)
 class L0:
@@ -274,8 +363,8 @@ class OverrideChainGroup(Group):
 
 
 def test_g12_override_active_resolve(benchmark):
-    # Override front-guard tax: an UNRELATED override flips has_overrides True, so every node in the
-    # depth-6 chain pays a fetch_override lookup per resolve (the path a test suite with mocks hits).
+    # An UNRELATED tree-wide override, the path a test suite with mocks hits. It is compiled into the
+    # sentinel's resolver alone, so has_overrides stays False and the chain should read level with G3.
     container = Container(scope=Scope.APP, groups=[OverrideChainGroup])
     container.open()
     container.override(OverrideChainGroup.sentinel, Sentinel())
@@ -286,6 +375,20 @@ def test_g12_override_active_resolve(benchmark):
     assert isinstance(result, C0)
 
 
+def test_g12l_local_override_in_another_request(benchmark):
+    # G12's override held in one request's own layer (`local=True`) instead of tree-wide: a sibling
+    # request still shares the root's registry, so its chain pays no fetch_override at all.
+    container = Container(scope=Scope.APP, groups=[OverrideChainGroup])
+    canary = container.build_child_container(scope=Scope.REQUEST)
+    canary.override(OverrideChainGroup.sentinel, Sentinel(), local=True)
+    request = container.build_child_container(scope=Scope.REQUEST)
+    request.resolve_provider(OverrideChainGroup.c0)  # warm
+    result = benchmark.pedantic(
+        request.resolve_provider, args=(OverrideChainGroup.c0,), rounds=ROUNDS, iterations=ITER_UNDER_2US
+    )
+    assert isinstance(result, C0)
+
+
 # --- G18: alias hop, against G2 as the control ---
 class AliasIface: ...
 
@@ -308,3 +411,90 @@ def test_g18_alias_hop(benchmark):
         container.resolve_provider, args=(AliasGroup.alias,), rounds=ROUNDS, iterations=ITER_UNDER_300NS
     )
     assert isinstance(result, Service)
+
+
+# --- G2f / G18f: G2 and G18 on a frozen registry ---
+def test_g2f_cached_resolve_frozen(benchmark):
+    # G2 after `freeze()`: the warm hit indexes the container's dense slot list instead of
+    # `cache_registry._items`. Read against G2.
+    container = Container(scope=Scope.APP, groups=[SingletonGroup])
+    container.freeze()
+    container.resolve_provider(SingletonGroup.svc)  # warm the cache
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(SingletonGroup.svc,), rounds=ROUNDS, iterations=ITER_UNDER_300NS
+    )
+    assert isinstance(result, Service)
+
+
+def test_g18f_alias_hop_frozen(benchmark):
+    # G18 after `freeze()`: the alias calls its compile-time-bound source resolver, with neither of
+    # the two registry lookups G18 pays per hop. Read against G18 and G2f.
+    container = Container(scope=Scope.APP, groups=[AliasGroup])
+    container.freeze()
+    container.resolve_provider(AliasGroup.alias)  # warm the source's cache
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(AliasGroup.alias,), rounds=ROUNDS, iterations=ITER_UNDER_300NS
+    )
+    assert isinstance(result, Service)
+
+
+# --- G1v-G5v: G1-G5 under the production profile ---
+# `validate(production=True)` hands every same-scope Factory dependency its in-scope resolver, which
+# skips the scope compare and the closed check its dependent already made. Each is read against
+# its unsuffixed twin. G2v and G5v are controls: a warm cached hit never reaches its dependency, and
+# G5's only dependency is cross-scope, so neither has an in-scope hop to save.
+def test_g1v_transient_resolve_production(benchmark):
+    container = Container(scope=Scope.APP, groups=[TransientGroup])
+    container.validate(production=True)
+    container.open()
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(TransientGroup.svc,), rounds=ROUNDS, iterations=ITER_UNDER_1US
+    )
+    assert isinstance(result, Service)
+    assert isinstance(result.dep, Dep)
+
+
+def test_g2v_cached_resolve_production(benchmark):
+    container = Container(scope=Scope.APP, groups=[SingletonGroup])
+    container.validate(production=True)
+    container.open()
+    container.resolve_provider(SingletonGroup.svc)  # warm the cache
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(SingletonGroup.svc,), rounds=ROUNDS, iterations=ITER_UNDER_300NS
+    )
+    assert isinstance(result, Service)
+
+
+def test_g3v_deep_chain_production(benchmark):
+    container = Container(scope=Scope.APP, groups=[ChainGroup])
+    container.validate(production=True)
+    container.open()
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(ChainGroup.c0,), rounds=ROUNDS, iterations=ITER_UNDER_1US
+    )
+    assert isinstance(result, C0)
+    assert isinstance(result.c1.c2.c3.c4.c5, C5)
+
+
+def test_g4v_wide_resolve_production(benchmark):
+    container = Container(scope=Scope.APP, groups=[WideGroup])
+    container.validate(production=True)
+    container.open()
+    result = benchmark.pedantic(
+        container.resolve_provider, args=(WideGroup.wide,), rounds=ROUNDS, iterations=ITER_UNDER_2US
+    )
+    assert isinstance(result, Wide)
+    assert isinstance(result.l9, L9)
+
+
+def test_g5v_cross_scope_production(benchmark):
+    app = Container(scope=Scope.APP, groups=[CrossScopeGroup])
+    app.validate(production=True)
+    app.open()
+    req = app.build_child_container(scope=Scope.REQUEST)
+    req.open()
+    result = benchmark.pedantic(
+        req.resolve_provider, args=(CrossScopeGroup.req_svc,), rounds=ROUNDS, iterations=ITER_UNDER_1US
+    )
+    assert isinstance(result, RequestService)
+    assert isinstance(result.app, AppService)
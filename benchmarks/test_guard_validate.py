@@ -6,10 +6,15 @@ checks). It memoizes on the providers registry, so it does full work only once p
 G10/G11 use `benchmark.pedantic` with a per-round setup that builds a fresh unvalidated
 container (untimed) and time `validate()` alone. `validate()` is the only trigger — construction
 never walks the graph — so G10 guards the deep-chain traversal and G11 the wide fan-out.
-See benchmarks/README.md.
+G10p validates a 1,000-provider graph again after one more provider is registered, which walks
+only what the registration changed. The 1k/10k variants repeat G10 and G11 at the size of a
+generated graph (a repository per entity, say), where the walk's per-edge cost has to stay
+constant. See benchmarks/README.md.
 """
 
 import dataclasses
+import itertools
+import typing
 
 from modern_di import Container, Group, Scope, providers
 
@@ -157,3 +162,73 @@ def test_g11_validate_wide(benchmark):
         rounds=3000,
         iterations=1,
     )
+
+
+# --- G10p subject: 100 depth-10 chains, validated, then one provider registered ----
+_CHAINS = 100
+_CHAIN_DEPTH = 10
+
+
+def _chain_group(name: str, depth: int) -> type[Group]:
+    """Build a Group of `depth` providers, each depending on the one before it."""
+    node_types: list[type] = [dataclasses.make_dataclass(f"{name}N0", [], slots=True)]
+    for level in range(1, depth):
+        node_types.append(dataclasses.make_dataclass(f"{name}N{level}", [("below", node_types[-1])], slots=True))
+    members = {f"n{level}": providers.Factory(creator=t, scope=Scope.APP) for level, t in enumerate(node_types)}
+    return type(name, (Group,), members)
+
+
+_PHASE_GROUPS = [_chain_group(f"Phase{i}", _CHAIN_DEPTH) for i in range(_CHAINS)]
+_late_ids = itertools.count()
+
+
+def _validated_with_one_more_provider() -> tuple[tuple[Container], dict[str, object]]:
+    container = Container(scope=Scope.APP, groups=_PHASE_GROUPS)
+    container.validate()
+    late = dataclasses.make_dataclass(f"Late{next(_late_ids)}", [], slots=True)
+    container.add_providers(providers.Factory(creator=late, scope=Scope.APP))
+    return (container,), {}
+
+
+def test_g10p_validate_after_a_registration_phase(benchmark):
+    # A plugin system registering in phases and validating after each. The first validate() is
+    # in the untimed setup; the timed one walks only the provider the last phase registered.
+    benchmark.pedantic(lambda c: c.validate(), setup=_validated_with_one_more_provider, rounds=100, iterations=1)
+
+
+# --- G10/G11 at 1k and 10k providers --------------------------------------
+def _fan_group(name: str, size: int) -> type[Group]:
+    """Build a Group of ~`size` providers as repeated G11 fans: one object over 10 sibling leaves."""
+    members: dict[str, providers.Factory[typing.Any]] = {}
+    for fan in range(size // 11):
+        leaves = [dataclasses.make_dataclass(f"{name}F{fan}L{i}", [], slots=True) for i in range(10)]
+        top = dataclasses.make_dataclass(f"{name}F{fan}", [(f"l{i}", t) for i, t in enumerate(leaves)], slots=True)
+        members.update({f"f{fan}l{i}": providers.Factory(creator=t, scope=Scope.APP) for i, t in enumerate(leaves)})
+        members[f"f{fan}"] = providers.Factory(creator=top, scope=Scope.APP)
+    return type(name, (Group,), members)
+
+
+def _validate_fresh(benchmark, group: type[Group], rounds: int) -> None:
+    Container(scope=Scope.APP, groups=[group]).validate()  # raises if invalid
+    benchmark.pedantic(
+        lambda c: c.validate(),
+        setup=lambda: ((Container(scope=Scope.APP, groups=[group]),), {}),
+        rounds=rounds,
+        iterations=1,
+    )
+
+
+def test_g10_validate_chain_1k(benchmark):
+    _validate_fresh(benchmark, _chain_group("Chain1k", 1_000), rounds=100)
+
+
+def test_g10_validate_chain_10k(benchmark):
+    _validate_fresh(benchmark, _chain_group("Chain10k", 10_000), rounds=10)
+
+
+def test_g11_validate_wide_1k(benchmark):
+    _validate_fresh(benchmark, _fan_group("Fans1k", 1_000), rounds=100)
+
+
+def test_g11_validate_wide_10k(benchmark):
+    _validate_fresh(benchmark, _fan_group("Fans10k", 10_000), rounds=10)
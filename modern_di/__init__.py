@@ -1,14 +1,18 @@
 from modern_di import exceptions, integrations
 from modern_di.container import Container
 from modern_di.group import Group
+from modern_di.injection import inject
+from modern_di.reaper import Reaper
 from modern_di.scope import Scope
 
 
 __all__ = [
     "Container",
     "Group",
+    "Reaper",
     "Scope",
     "exceptions",
+    "inject",
     "integrations",
     "providers",
 ]
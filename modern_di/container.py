@@ -3,9 +3,10 @@ import os
 import pathlib
 import sys
 import threading
+import time
 import typing
 import warnings
-from types import FrameType
+from types import FrameType, MappingProxyType
 
 from modern_di import exceptions, suggester, types
 from modern_di.dependency_graph import (
@@ -17,18 +18,73 @@ from modern_di.dependency_graph import (
     build_cycle_error,
 )
 from modern_di.group import Group
+from modern_di.providers import Factory
 from modern_di.providers.abstract import AbstractProvider
 from modern_di.providers.container_provider import container_provider
 from modern_di.registries.cache_registry import CacheRegistry
 from modern_di.registries.context_registry import ContextRegistry
-from modern_di.registries.overrides_registry import OverrideHandle, OverridesRegistry
+from modern_di.registries.overrides_registry import OverrideContext, OverrideHandle, OverrideLayer, OverridesRegistry
 from modern_di.registries.providers_registry import ProvidersRegistry
 from modern_di.scope import Scope, _next_deeper
 
 
 if typing.TYPE_CHECKING:
+    import concurrent.futures
+
     import typing_extensions
 
+    from modern_di.reaper import Reaper
+
+
+class _ChildPool:
+    """A bounded free list of closed child containers of one (parent, scope), reused by `build_child_container`.
+
+    Guarded by a plain lock, held only around the list operation: no await happens under it, so one
+    pool is safe across threads and tasks alike.
+    """
+
+    __slots__ = ("_free", "_lock", "size")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._free: list[Container] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> "Container | None":
+        with self._lock:
+            return self._free.pop() if self._free else None
+
+    def release(self, child: "Container") -> None:
+        with self._lock:
+            if len(self._free) < self.size:
+                self._free.append(child)
+
+    def drain(self) -> None:
+        with self._lock:
+            self._free.clear()
+
+
+class CompileReport(typing.NamedTuple):
+    """What :meth:`Container.compile_all` built: how many providers, and the wall-clock it took."""
+
+    providers: int
+    seconds: float
+
+
+class WarmUpReport(typing.NamedTuple):
+    """What :meth:`Container.warm_up` created: how many providers, in how many levels, and the wall-clock."""
+
+    providers: int
+    levels: int
+    seconds: float
+
+
+class LockWaitReport(typing.NamedTuple):
+    """What :meth:`Container.creation_lock_waits` counted: creations that waited, and the total wait."""
+
+    waits: int
+    seconds: float
+
 
 def _handle_recursion_error(
     provider: AbstractProvider[typing.Any], container: "Container", exc: RecursionError
@@ -72,7 +128,11 @@ class Container:
     """
 
     __slots__ = (
+        "__weakref__",
+        "_child_pool_size",
+        "_child_pools",
         "_lock",
+        "_pool",
         "_scope_map",
         "cache_registry",
         "closed",
@@ -83,7 +143,7 @@ class Container:
         "scope",
     )
 
-    def __init__(  # noqa: PLR0913, PLR0917
+    def __init__(  # noqa: C901, PLR0913, PLR0917
         self,
         scope: enum.IntEnum = Scope.APP,
         parent_container: typing.Optional["typing_extensions.Self"] = None,
@@ -91,6 +151,9 @@ class Container:
         groups: list[type[Group]] | None = None,
         use_lock: bool = True,
         validate: bool | None = None,
+        pin_singletons: bool = False,
+        share_transients: bool = False,
+        child_pool_size: int = 0,
     ) -> None:
         """Build a container at ``scope``.
 
@@ -106,6 +169,23 @@ class Container:
         ``resolve()`` never trigger it. ``context`` seeds this container's context
         registry. A root container owns fresh registries; a child shares the
         parent's providers/overrides registries and inherits its scope map.
+
+        ``pin_singletons`` (root only; a child shares its root's registry and ignores it) compiles
+        every cached provider of the root's scope to close over its cache entry, so a warm hit
+        skips scope navigation and the cache lookup. The registry reaches the root through a
+        weakref, so the root is still freed by refcounting.
+
+        ``share_transients`` (root only, likewise) makes one top-level :meth:`resolve` build each
+        transient Factory at most once: every use of it inside that resolution gets the same instance.
+        ``Factory(shared=True)`` opts in a single provider instead.
+
+        ``child_pool_size`` (root only; every descendant inherits it) keeps up to that many closed
+        children per (parent, scope) and hands them back out of :meth:`build_child_container`,
+        reset in place, instead of allocating new ones. A pooled child must not be used once
+        closed: the next request may already own it.
+
+        Every ``CacheSettings(eager=True)`` provider of ``scope`` is created before the constructor
+        returns, and on each reuse of a pooled child, so its context must come in ``context``.
         """
         if validate is not None:
             warnings.warn(exceptions.ValidateArgumentWarning(), stacklevel=2)
@@ -127,6 +207,7 @@ class Container:
         )
         self.cache_registry = CacheRegistry()
         self.context_registry = ContextRegistry(context=context or {})
+        self._pool: _ChildPool | None = None  # the pool this child returns to on close, when pooled
         self.providers_registry: ProvidersRegistry
         self.overrides_registry: OverridesRegistry
         # Inlined, not a helper: __init__ is on the per-request child-build path
@@ -135,15 +216,28 @@ class Container:
         if parent_container:
             self.providers_registry = parent_container.providers_registry
             self.overrides_registry = parent_container.overrides_registry
+            self._child_pool_size = parent_container._child_pool_size  # noqa: SLF001
+            slot_count = self.providers_registry._cache_slot_counts.get(scope)  # noqa: SLF001
+            if slot_count:  # frozen registry: this scope's cached providers index a dense slot list
+                self.cache_registry._slots = [None] * slot_count  # noqa: SLF001
         else:
+            self._child_pool_size = child_pool_size
             self.providers_registry = ProvidersRegistry()
             self.providers_registry.register(Container, container_provider)
-            self.overrides_registry = OverridesRegistry()
+            self.overrides_registry = OverridesRegistry(compiled_into=self.providers_registry)
+            if pin_singletons:
+                self.providers_registry.pin_singletons(self)
+            if share_transients:
+                self.providers_registry.share_transients()
+        self._child_pools: dict[enum.IntEnum, _ChildPool] | None = {} if self._child_pool_size else None
         if groups:
             all_providers: list[AbstractProvider[typing.Any]] = []
             for one_group in groups:
                 all_providers.extend(one_group.get_providers())
             self.providers_registry.add_providers(*all_providers)
+        eager = self.providers_registry._eager.get(scope)  # noqa: SLF001
+        if eager:
+            self._create_eager(eager)
 
     def build_child_container(
         self,
@@ -160,8 +254,59 @@ class Container:
 
         # An explicitly-passed scope is not checked here: __init__ rejects a scope that is not
         # deeper than its parent's, raising an identical InvalidChildScopeError.
+        if self._child_pools is not None:
+            return self._build_pooled_child(scope, context)
         return self.__class__(scope=scope, parent_container=self, context=context, use_lock=self._lock is not None)
 
+    def _build_pooled_child(
+        self, scope: enum.IntEnum, context: dict[type[typing.Any], typing.Any] | None
+    ) -> "typing_extensions.Self":
+        """Hand out a pooled child of `scope`, reset on its release; construct one when the pool is empty.
+
+        A pool exists only once a child of its scope was constructed, so `__init__` has already
+        checked the scope by the time one is reused.
+        """
+        pools = typing.cast("dict[enum.IntEnum, _ChildPool]", self._child_pools)
+        pool = pools.get(scope)
+        child = pool.acquire() if pool is not None else None
+        if child is None:
+            child = self.__class__(scope=scope, parent_container=self, context=context, use_lock=self._lock is not None)
+            child._pool = pool or pools.setdefault(scope, _ChildPool(self._child_pool_size))  # noqa: SLF001
+            return child
+        if context:
+            child.context_registry.reset(context)
+        child.overrides_registry = self.overrides_registry  # a layer installed on self since the child was built
+        slot_count = self.providers_registry._cache_slot_counts.get(scope)  # noqa: SLF001
+        if slot_count:  # the registry may have been frozen since this child was built
+            child.cache_registry.size_slots(slot_count)
+        child.closed = False
+        eager = self.providers_registry._eager.get(scope)  # noqa: SLF001
+        if eager:
+            child._create_eager(eager)  # noqa: SLF001
+        return typing.cast("typing_extensions.Self", child)
+
+    def _create_eager(self, eager: "list[Factory[typing.Any]]") -> None:
+        """Create this scope's `CacheSettings(eager=True)` providers, in registration order.
+
+        Each is resolved like any other, so whatever it depends on is created first: the order
+        follows the dependencies whatever the registration order.
+        """
+        for provider in eager:
+            self.resolve_provider(provider)
+
+    def _release_to_pool(self, pool: _ChildPool) -> None:
+        """Reset this closed child in place and offer it back to `pool`; a full pool drops it."""
+        self.cache_registry.reset()
+        if self.context_registry.context:
+            self.context_registry.reset({})  # release the request's context values while pooled
+        pool.release(self)
+
+    def _drain_child_pools(self) -> None:
+        """Drop every pooled child: each references this container, so a closed one stays freeable."""
+        if self._child_pools:
+            for pool in self._child_pools.values():
+                pool.drain()
+
     def find_container(self, scope: enum.IntEnum) -> "typing_extensions.Self":
         if scope == self.scope:
             return self
@@ -244,20 +389,95 @@ class Container:
         except RecursionError as exc:
             _handle_recursion_error(provider, self, exc)
 
-    def _walk_errors(self) -> list[Exception]:
-        """Walk the graph once, returning every wiring error in walk order."""
+    def resolver(self, dependency: "AbstractProvider[types.T] | type[types.T]") -> typing.Callable[[], types.T]:
+        """Return a zero-argument callable that resolves ``dependency`` from this container.
+
+        For hot loops: the type lookup is paid once, here, and each call costs one frame in front
+        of the provider's compiled resolver -- a generation check, the ``closed`` check, and the
+        resolver itself. Any registry mutation, and a tree-wide override set or reset, moves the
+        providers registry's generation; the next call then rebinds to the current resolver, so a
+        handle never resolves past a change. Raises ``ProviderNotRegisteredError`` here, not on
+        the first call, for a type with no provider.
+        """
+        registry = self.providers_registry
+        if isinstance(dependency, AbstractProvider):
+            provider = dependency
+        else:
+            provider = registry._providers.get(dependency)  # noqa: SLF001
+            if provider is None:
+                raise exceptions.ProviderNotRegisteredError(
+                    provider_type=dependency,
+                    suggestions=suggester.suggest(dependency, registry),
+                )
+        container = self
+        generation = registry._generation  # noqa: SLF001 - read before compiling; a mutation during it bumps this
+        try:
+            bound = registry.resolver_for(provider)
+        except RecursionError as exc:
+            _handle_recursion_error(provider, self, exc)
+
+        def resolve() -> types.T:
+            nonlocal generation, bound
+            try:
+                if generation != registry._generation:  # noqa: SLF001
+                    generation = registry._generation  # noqa: SLF001
+                    bound = registry.resolver_for(provider)  # a recompile reports errors as the first compile did
+                if container.closed:
+                    container._prepare()
+                return bound(container)
+            except RecursionError as exc:
+                _handle_recursion_error(provider, container, exc)
+
+        return resolve
+
+    def snapshot_singletons(self) -> "MappingProxyType[type, typing.Any]":
+        """Return a read-only mapping of every instance this container has cached, by bound type.
+
+        For hot code that reads long-lived instances: ``snapshot[Settings]`` is one dict lookup and
+        no resolver frame. The snapshot holds what was cached when it was taken -- resolve first
+        whatever it should contain -- and nothing a parent container cached. It cannot follow an
+        override or a close, so it refuses to go stale quietly: taking one while an override or an
+        override context is active, or from a closed container, raises ``SnapshotStaleError``; and
+        once any override is set in the tree, or this container closes, the snapshot is emptied and
+        reading a key from it raises ``SnapshotStaleError`` too.
+        """
+        if self.closed:
+            raise exceptions.SnapshotStaleError(reason="the container is closed")
+        overrides = self.overrides_registry
+        while isinstance(overrides, OverrideLayer):  # a layer's `has_overrides` is always True: ask its own dict
+            if overrides._overrides:  # noqa: SLF001
+                raise exceptions.SnapshotStaleError(reason="an override is active")
+            overrides = overrides.parent
+        if overrides.has_overrides or overrides._overrides:  # noqa: SLF001
+            raise exceptions.SnapshotStaleError(reason="an override is active")
+        snapshot = self.cache_registry.snapshot(self.providers_registry._providers)  # noqa: SLF001
+        self.providers_registry.track_snapshot(self, snapshot)
+        return MappingProxyType(snapshot)
+
+    def _walk_errors(
+        self,
+        roots: "typing.Iterable[AbstractProvider[typing.Any]] | None" = None,
+        walked: "list[AbstractProvider[typing.Any]] | None" = None,
+    ) -> list[Exception]:
+        """Walk the graph from `roots` (default: every registered provider), returning every wiring error in walk order.
+
+        Each provider the walk enters is appended to `walked` when one is passed.
+        """
         errors: list[Exception] = []
         graph = DependencyGraph()
-        for event in graph.walk(self.providers_registry, self):
+        scopes: dict[int, enum.IntEnum] = {}  # terminal scope by provider_id, one chain-follow per provider
+        for event in graph.walk(self.providers_registry if roots is None else roots, self):
             # Event is a closed 4-variant union — every variant handled below.
             match event:
                 case NodeEntered(provider):
+                    if walked is not None:
+                        walked.append(provider)
                     errors.extend(provider.iter_validation_issues(self))
                 case DependenciesError(_, error):
                     errors.append(error)
                 case Edge(parent, name, dep):
-                    dep_scope = graph.terminal_scope(dep, self)
-                    if dep_scope > graph.terminal_scope(parent, self):
+                    dep_scope = graph.terminal_scope(dep, self, scopes)
+                    if dep_scope > graph.terminal_scope(parent, self, scopes):
                         errors.append(
                             exceptions.InvalidScopeDependencyError(
                                 provider=parent,
@@ -270,22 +490,124 @@ class Container:
                     errors.append(build_cycle_error(providers))
         return errors
 
-    def validate(self) -> None:
+    def validate(self, *, production: bool = False) -> None:
         """Walk the static provider graph and raise on any wiring error.
 
         Checks cycles, transitive scope ordering, and missing/unresolvable dependencies;
         every error found is aggregated into a single :class:`~modern_di.exceptions.ValidationFailedError`
         rather than raising on the first one. This is the only thing that validates —
         construction, :meth:`open`, ``add_providers``, and ``resolve`` never do.
+
+        With ``production=True`` a successful validation also switches the registry to the production
+        compile profile: a Factory resolved as a same-scope dependency skips the scope compare and the
+        ``closed`` check its dependent already made. The next registry mutation drops the profile
+        together with the validated flag; validate again to restore both.
+
+        After a clean validation, the next one walks only what registrations have changed since:
+        the new providers, those whose wiring could pick one of them up, and everything they reach.
+        Should that find an error, the whole graph is walked again, so the reported errors are
+        always those of a full walk.
         """
         reg = self.providers_registry
-        if reg.is_validated():
-            return  # already validated at this registry state — no re-walk
+        if not reg.is_validated():
+            changed = reg.changed_since_validation()
+            walked: list[AbstractProvider[typing.Any]] = []
+            validation_errors = None if changed is None else self._walk_errors(changed, walked)
+            if validation_errors is None or validation_errors:
+                walked.clear()
+                validation_errors = self._walk_errors(walked=walked)
+            if validation_errors:
+                reg.forget_validation()
+                raise exceptions.ValidationFailedError(errors=validation_errors)
+            reg.mark_validated(walked)
+        if production:
+            reg.use_production_profile()
+
+    def compile_all(self) -> CompileReport:
+        """Build every wiring plan and compiled resolver now, instead of on each provider's first resolve.
+
+        Walks the registry with the same traversal :meth:`validate` uses, so providers reachable only
+        through a ``kwargs={...}`` reference are compiled too. Compilation recurses into dependencies
+        before finishing a dependent, so the memo fills in dependency order. Call it from a startup or
+        lifespan hook, after the last ``add_providers``: a later registration drops the part of the
+        memo it can change, and those providers compile lazily again. Creators do not run and caches
+        stay empty; nothing is validated, and a broken node compiles to its always-raising resolver
+        as it would lazily.
+        """
+        registry = self.providers_registry
+        started = time.perf_counter()
+        compiled = 0
+        for event in DependencyGraph().walk(registry, self):
+            if isinstance(event, NodeEntered):
+                registry.resolver_for(event.provider)
+                compiled += 1
+        return CompileReport(providers=compiled, seconds=time.perf_counter() - started)
+
+    def warm_up(
+        self,
+        *,
+        executor: "concurrent.futures.Executor | None" = None,
+        scopes: typing.Iterable[enum.IntEnum] | None = None,
+    ) -> WarmUpReport:
+        """Create every cached provider of ``scopes`` (default: this container's scope) now.
+
+        Providers are grouped into topological levels of the dependency graph and created level by
+        level: none depends on another of its level, so with an ``executor`` (a thread pool) each
+        level's creators run concurrently; without one they run in turn on the calling thread. Each
+        is created by resolving it, through the same creation lock a live resolve takes, so a
+        request racing the warm-up still gets the one instance. An ancestor's scope warms that
+        ancestor's cache; a scope this container cannot reach raises as a resolve would. The first
+        creator error propagates, and later levels are not started.
+        """
+        started = time.perf_counter()
+        targets = set(scopes) if scopes is not None else {self.scope}
+        for scope in targets:
+            self.find_container(scope)
+
+        def is_target(provider: AbstractProvider[typing.Any]) -> bool:
+            return isinstance(provider, Factory) and provider.cache_settings is not None and provider.scope in targets
+
+        levels = DependencyGraph().levels(self.providers_registry, self, is_target)
+        for level in levels:
+            if executor is None:
+                for provider in level:
+                    self.resolve_provider(provider)
+            else:
+                list(executor.map(self.resolve_provider, level))  # drained, so a creator error raises here
+        return WarmUpReport(
+            providers=sum(len(level) for level in levels),
+            levels=len(levels),
+            seconds=time.perf_counter() - started,
+        )
 
-        validation_errors = self._walk_errors()
-        if validation_errors:
-            raise exceptions.ValidationFailedError(errors=validation_errors)
-        reg.mark_validated()
+    def creation_lock_waits(self) -> LockWaitReport:
+        """Report how often creating one of this container's cached providers waited for its lock.
+
+        Each cached provider creates under its own lock, so only threads creating the *same* provider
+        at once wait, and only those waits are counted. Covers this container's own cache; a
+        child's cached providers are reported by the child.
+        """
+        waits, wait_ns = self.cache_registry.lock_wait_totals()
+        return LockWaitReport(waits=waits, seconds=wait_ns / 1e9)
+
+    def freeze(self) -> CompileReport:
+        """Make the providers registry permanently read-only, then compile the whole graph against it.
+
+        Every cached Factory in the graph gets a dense per-scope slot, so its warm hit indexes a
+        list on the resolving container instead of looking up ``cache_registry``'s dict, and every
+        ``Alias`` binds its source's resolver directly. Containers built from here on size their slot
+        list at construction; this container and its ancestors are sized now. Any later registration
+        raises :class:`~modern_di.exceptions.RegistryFrozenError`. Freezing is one-way and shared
+        tree-wide, like the registry; a repeat call only recompiles. Returns the
+        :meth:`compile_all` report.
+        """
+        registry = self.providers_registry
+        registry.freeze(
+            [event.provider for event in DependencyGraph().walk(registry, self) if isinstance(event, NodeEntered)]
+        )
+        for container in (self, *self._scope_map.values()):
+            container.cache_registry.size_slots(registry._cache_slot_counts.get(container.scope, 0))  # noqa: SLF001
+        return self.compile_all()
 
     def add_providers(self, *providers: AbstractProvider[typing.Any]) -> None:
         """Register providers on this (root) container after construction.
@@ -296,44 +618,170 @@ class Container:
         it mutates is shared tree-wide. Registration does not validate; the mutation clears
         the registry's validated flag, so a later :meth:`validate` re-walks the new graph.
         Registration is a startup-time operation: concurrent calls on the same root are not
-        coordinated beyond the registry's internal lock.
+        coordinated beyond the registry's internal lock. After :meth:`freeze` it raises
+        :class:`~modern_di.exceptions.RegistryFrozenError`. A ``CacheSettings(eager=True)``
+        provider of the root's own scope is created before this returns.
         """
         if self.parent_container is not None:
             raise exceptions.ChildContainerRegistrationError(scope=self.scope)
-        self.providers_registry.add_providers(*providers)
-
-    async def close_async(self) -> None:
+        registry = self.providers_registry
+        known = len(registry._eager.get(self.scope, ()))  # noqa: SLF001
+        registry.add_providers(*providers)
+        added = registry._eager.get(self.scope, [])[known:]  # noqa: SLF001
+        if added:  # a root is already built: create its scope's new eager providers now
+            self._create_eager(added)
+
+    async def close_async(
+        self, *, concurrently: bool = False, finalizer_timeout: float | None = None, reaper: "Reaper | None" = None
+    ) -> None:
+        """Run this container's async and sync finalizers, LIFO, and mark it closed.
+
+        With ``concurrently=True`` the cached providers are grouped into dependency levels of the
+        provider graph and each level's finalizers run at the same time, dependents' levels first,
+        so a dependent still closes before what it depends on. ``finalizer_timeout`` bounds each
+        awaited finalizer in seconds; one that overruns is cancelled and reported in the
+        :class:`~modern_di.exceptions.FinalizerError` with the other finalizer errors.
+
+        With a :class:`~modern_di.reaper.Reaper` the container is closed as soon as its created
+        objects are queued there: the finalizers run later, in the reaper's background task, and
+        their errors go to its ``error_sink`` instead of raising here. The call waits only while
+        the reaper's queue is full.
+        """
         if not self.parent_container:
             self.overrides_registry.reset_override()
+            self.providers_registry.unpin_singletons()
+        elif self._has_override_layer():
+            self.overrides_registry = typing.cast("OverrideLayer", self.overrides_registry).parent
+        if self.providers_registry._snapshots:  # noqa: SLF001
+            self.providers_registry.drop_snapshots("its container was closed", owner=self)
+        self._drain_child_pools()
+        was_closed = self.closed  # a second close must not pool the same child twice
+        levels = None
+        if concurrently:
+            created = self.cache_registry._items  # noqa: SLF001
+            levels = [
+                kept
+                for level in self.providers_registry.finalizer_levels(self.scope, self._group_cached_providers)
+                if (kept := [provider_id for provider_id in level if provider_id in created])
+            ]
         try:
-            await self.cache_registry.close_async()
+            if reaper is None:
+                await self.cache_registry.close_async(levels=levels, timeout=finalizer_timeout)
+            else:
+                await reaper.submit(self.cache_registry.detach(), levels=levels, timeout=finalizer_timeout)
         finally:
             self.closed = True
+        if self._pool is not None and not was_closed:
+            self._release_to_pool(self._pool)
+
+    def _group_cached_providers(self) -> list[list[int]]:
+        """Group every cached provider of this container's scope into dependency levels, as provider_ids."""
+        scope = self.scope
+        return [
+            [provider.provider_id for provider in level]
+            for level in DependencyGraph().levels(
+                self.providers_registry,
+                self,
+                lambda provider: (
+                    isinstance(provider, Factory) and provider.scope == scope and provider.cache_settings is not None
+                ),
+            )
+        ]
 
     def close_sync(self) -> None:
         if not self.parent_container:
             self.overrides_registry.reset_override()
+            self.providers_registry.unpin_singletons()
+        elif self._has_override_layer():
+            self.overrides_registry = typing.cast("OverrideLayer", self.overrides_registry).parent
+        if self.providers_registry._snapshots:  # noqa: SLF001
+            self.providers_registry.drop_snapshots("its container was closed", owner=self)
+        self._drain_child_pools()
+        was_closed = self.closed  # a second close must not pool the same child twice
         try:
             self.cache_registry.close_sync()
         finally:
             self.closed = True
+        if self._pool is not None and not was_closed:
+            self._release_to_pool(self._pool)
 
-    def override(self, provider: AbstractProvider[types.T], override_object: types.T) -> OverrideHandle[types.T]:
+    def override(
+        self, provider: AbstractProvider[types.T], override_object: types.T, *, local: bool = False
+    ) -> OverrideHandle[types.T]:
         """Apply an override immediately.
 
         Use the returned handle as a context manager to auto-restore the prior state.
+
+        An override is tree-wide by default. With ``local=True`` on a child it goes into that child's
+        own override layer instead: only resolves from the child and the children built from it
+        afterwards see it, and closing the child drops the layer. On a root, ``local`` changes nothing.
+        Without it the override is tree-wide even when called on a child that has a layer.
         """
-        prior = self.overrides_registry.fetch_override(provider.provider_id)
-        self.overrides_registry.override(provider.provider_id, override_object)
+        self.providers_registry.drop_snapshots("an override was set after it was taken")
+        registry = self._override_layer() if local else self._tree_overrides()
+        prior = registry.fetch_own_override(provider.provider_id)
+        registry.override(provider.provider_id, override_object)
         return OverrideHandle(
-            registry=self.overrides_registry,
+            registry=registry,
             provider_id=provider.provider_id,
             prior=prior,
             override_object=override_object,
         )
 
-    def reset_override(self, provider: AbstractProvider[types.T] | None = None) -> None:
-        self.overrides_registry.reset_override(provider.provider_id if provider else None)
+    def override_many(
+        self, overrides: "dict[AbstractProvider[typing.Any], typing.Any]", *, local: bool = False
+    ) -> None:
+        """Apply every ``provider: override_object`` pair of `overrides` at once.
+
+        Like calling :meth:`override` for each, except that the affected resolvers recompile once
+        for the whole batch instead of once per provider. Nothing is returned to restore from: undo
+        with :meth:`reset_override`.
+        """
+        self.providers_registry.drop_snapshots("an override was set after it was taken")
+        registry = self._override_layer() if local else self._tree_overrides()
+        registry.override_many({provider.provider_id: obj for provider, obj in overrides.items()})
+
+    def override_context(self, overrides: "dict[AbstractProvider[typing.Any], typing.Any]") -> OverrideContext:
+        """Return a context manager applying ``provider: override_object`` pairs to the current context only.
+
+        Inside ``with container.override_context({...}):`` resolves from anywhere in this container's
+        tree see the overrides, but only in the thread or asyncio task that entered the block, and in
+        tasks started inside it, so concurrent tests can share one warm root, each with its own
+        overrides. Contexts nest, the inner one winning, and a context override beats a tree-wide one.
+        A local override layer still beats both. While any context is entered, every resolve in the
+        tree checks for an override at each node.
+        """
+        return OverrideContext(
+            registry=self._tree_overrides(),
+            overrides={provider.provider_id: obj for provider, obj in overrides.items()},
+        )
+
+    def reset_override(self, provider: AbstractProvider[types.T] | None = None, *, local: bool = False) -> None:
+        """Drop `provider`'s override, or every override; with ``local=True``, only from this child's layer."""
+        provider_id = provider.provider_id if provider else None
+        if not local:
+            self._tree_overrides().reset_override(provider_id)
+        elif self._has_override_layer():
+            self.overrides_registry.reset_override(provider_id)
+
+    def _tree_overrides(self) -> OverridesRegistry:
+        """Return the tree-wide registry beneath every override layer this container resolves through."""
+        registry = self.overrides_registry
+        while isinstance(registry, OverrideLayer):
+            registry = registry.parent
+        return registry
+
+    def _has_override_layer(self) -> bool:
+        registry = self.overrides_registry
+        return isinstance(registry, OverrideLayer) and registry.owner == id(self)
+
+    def _override_layer(self) -> OverridesRegistry:
+        """Return this child's own override layer, installing it over the inherited registry on first use."""
+        if self.parent_container is None or self._has_override_layer():
+            return self.overrides_registry
+        layer = OverrideLayer(parent=self.overrides_registry, owner=id(self))
+        self.overrides_registry = layer
+        return layer
 
     def set_context(self, context_type: type[types.T], obj: types.T) -> None:
         """Register a runtime context value on *this* container.
@@ -346,6 +794,14 @@ class Container:
         """
         self.context_registry.set_context(context_type, obj)
 
+    def set_contexts(self, context: dict[type[typing.Any], typing.Any]) -> None:
+        """Register several runtime context values on *this* container at once.
+
+        Equivalent to :meth:`set_context` for each ``type: value`` pair of ``context``, with the
+        same rules, at the cost of one write.
+        """
+        self.context_registry.set_contexts(context)
+
     def __repr__(self) -> str:
         n_providers = len(self.providers_registry)
         n_cached = self.cache_registry.cached_count()
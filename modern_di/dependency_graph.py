@@ -1,6 +1,6 @@
 """Iterative depth-first walk of the static provider graph, emitted as an event stream.
 
-``DependencyGraph.walk`` is the single traversal that other capabilities (validation,
+``DependencyGraph.walk`` is the single traversal that other capabilities (validation, warm-up,
 the runtime cycle guard) consume. It is deliberately *explicit-stack* — no recursion —
 because a later caller runs it inside a ``RecursionError`` handler near CPython's stack
 limit, where headroom for a recursive walk is not guaranteed.
@@ -41,7 +41,11 @@ class Edge(NamedTuple):
 
 
 class Cycle(NamedTuple):
-    """A cycle closing on the active path; ``providers`` repeats the first node last."""
+    """A strongly connected component's cycle, through its first-entered node; ``providers`` repeats it last.
+
+    Emitted once per cyclic component -- more than one provider, or one depending on itself --
+    when the walk finishes the component's first-entered node.
+    """
 
     providers: "list[AbstractProvider[typing.Any]]"
 
@@ -77,6 +81,50 @@ def build_cycle_error(
     )
 
 
+class _WalkState:
+    """One walk's bookkeeping, shared across its roots: the DFS marks plus Tarjan's per-node numbering."""
+
+    __slots__ = ("component", "index", "low", "on_component", "successors", "visited", "visiting")
+
+    def __init__(self) -> None:
+        self.visiting: set[int] = set()  # on the active DFS path
+        self.visited: set[int] = set()  # finished
+        self.index: dict[int, int] = {}  # entry order
+        self.low: dict[int, int] = {}  # lowest entry order reachable while still on `component`
+        self.component: list[AbstractProvider[typing.Any]] = []  # Tarjan's stack: entered, not yet in an emitted SCC
+        self.on_component: set[int] = set()
+        self.successors: dict[int, list[AbstractProvider[typing.Any]]] = {}  # edges of the nodes on `component`
+
+
+def _cycle_through(
+    head: "AbstractProvider[typing.Any]",
+    members: set[int],
+    successors: "dict[int, list[AbstractProvider[typing.Any]]]",
+) -> "list[AbstractProvider[typing.Any]]":
+    """Return a shortest cycle from ``head`` back to itself inside one strongly connected component.
+
+    Breadth-first over the component's own edges, so linear in its size; one always exists, since
+    every member reaches every other.
+    """
+    came_from: dict[int, AbstractProvider[typing.Any]] = {}
+    frontier = [head]
+    while frontier:
+        following: list[AbstractProvider[typing.Any]] = []
+        for node in frontier:
+            for dep in successors[node.provider_id]:
+                if dep.provider_id == head.provider_id:
+                    ring = [node]
+                    while ring[-1].provider_id != head.provider_id:
+                        ring.append(came_from[ring[-1].provider_id])
+                    return [*reversed(ring), head]
+                if dep.provider_id in members and dep.provider_id not in came_from:
+                    came_from[dep.provider_id] = node
+                    following.append(dep)
+        frontier = following
+    msg = "a strongly connected component always closes a cycle through its head"  # pragma: no cover
+    raise AssertionError(msg)  # pragma: no cover
+
+
 class DependencyGraph:
     """Stateless walker over the static provider graph rooted at a container's registry."""
 
@@ -87,14 +135,15 @@ class DependencyGraph:
     ) -> "typing.Iterator[Event]":
         """Pre-order DFS from each root, emitting the event stream.
 
-        ``visiting``/``visited`` are shared across all roots: a node reached under an
-        earlier root is neither re-entered nor re-descended when it reappears, and a root
-        already visited is skipped entirely. All bookkeeping is keyed on ``provider_id``.
+        The bookkeeping is shared across all roots: a node reached under an earlier root is
+        neither re-entered nor re-descended when it reappears, and a root already visited is
+        skipped entirely. Cycles come from Tarjan's algorithm run along the same DFS, so one pass
+        reports every cyclic strongly connected component, each once, in O(V + E). All
+        bookkeeping is keyed on ``provider_id``.
         """
-        visiting: set[int] = set()
-        visited: set[int] = set()
+        state = _WalkState()
         for root in roots:
-            yield from self._walk_from(root, container, visiting, visited)
+            yield from self._walk_from(root, container, state)
 
     def find_cycle_from(
         self,
@@ -111,34 +160,114 @@ class DependencyGraph:
                 return event.providers
         return None
 
-    def terminal_scope(self, provider: "AbstractProvider[typing.Any]", container: "Container") -> enum.IntEnum:
+    def levels(
+        self,
+        roots: "typing.Iterable[AbstractProvider[typing.Any]]",
+        container: "Container",
+        select: "typing.Callable[[AbstractProvider[typing.Any]], bool]",
+    ) -> "list[list[AbstractProvider[typing.Any]]]":
+        """Group the ``select``-ed providers reachable from ``roots`` into topological levels.
+
+        A selected provider's level is the number of selected providers on the longest dependency
+        chain below it, unselected ones passed through: level 0 depends on no other selected
+        provider, and no two providers of one level depend on each other. Built on ``walk``, then
+        an explicit-stack post-order over its edges; a cycle's back edge is ignored (``walk``
+        reports the cycle itself).
+        """
+        nodes: dict[int, AbstractProvider[typing.Any]] = {}
+        deps: dict[int, list[int]] = {}
+        for event in self.walk(roots, container):
+            if isinstance(event, NodeEntered):
+                nodes[event.provider.provider_id] = event.provider
+                deps[event.provider.provider_id] = []
+            elif isinstance(event, Edge):
+                deps[event.parent.provider_id].append(event.dep.provider_id)
+
+        height = self._selected_heights(nodes, deps, select)
+        grouped: list[list[AbstractProvider[typing.Any]]] = []
+        for pid, provider in nodes.items():
+            if select(provider):
+                level = height[pid] - 1
+                grouped.extend([] for _ in range(level + 1 - len(grouped)))
+                grouped[level].append(provider)
+        return grouped
+
+    @staticmethod
+    def _selected_heights(
+        nodes: "dict[int, AbstractProvider[typing.Any]]",
+        deps: dict[int, list[int]],
+        select: "typing.Callable[[AbstractProvider[typing.Any]], bool]",
+    ) -> dict[int, int]:
+        """Count the selected providers on the longest chain at or below each node, itself included."""
+        height: dict[int, int] = {}
+        for start in nodes:
+            if start in height:
+                continue
+            on_path = {start}
+            stack = [(start, iter(deps[start]))]
+            while stack:
+                pid, pending = stack[-1]
+                dep = next(pending, None)
+                if dep is not None:
+                    if dep not in height and dep not in on_path:
+                        on_path.add(dep)
+                        stack.append((dep, iter(deps[dep])))
+                    continue
+                stack.pop()
+                on_path.discard(pid)
+                below = max((height.get(dep, 0) for dep in deps[pid]), default=0)
+                height[pid] = below + select(nodes[pid])
+        return height
+
+    def terminal_scope(
+        self,
+        provider: "AbstractProvider[typing.Any]",
+        container: "Container",
+        memo: dict[int, enum.IntEnum] | None = None,
+    ) -> enum.IntEnum:
         """Follow ``redirect_target`` hops to the terminal provider and return its scope.
 
         A redirect cycle is broken via the ``seen`` guard, falling back to the starting
         provider's own scope instead of looping forever; ``walk()`` reports that cycle separately.
+        With a ``memo`` (one per walk), every hop of a chain that terminates is answered from it
+        afterwards, so each provider's chain is followed once.
         """
-        seen: set[int] = set()
+        if memo is not None and (known := memo.get(provider.provider_id)) is not None:
+            return known
+        start = provider
+        hops: list[int] = []
         while (nxt := provider.redirect_target(container)) is not None:
-            if provider.provider_id in seen:
-                break
-            seen.add(provider.provider_id)
+            if provider.provider_id in hops:
+                if memo is not None:
+                    memo[start.provider_id] = start.scope
+                return start.scope
+            hops.append(provider.provider_id)
             provider = nxt
-        return provider.scope
+            if memo is not None and (known := memo.get(provider.provider_id)) is not None:
+                break
+        else:
+            known = provider.scope
+            if memo is not None:
+                memo[provider.provider_id] = known
+        if memo is not None:
+            for hop in hops:
+                memo[hop] = known
+        return known
 
     def _walk_from(
         self,
         start: "AbstractProvider[typing.Any]",
         container: "Container",
-        visiting: set[int],
-        visited: set[int],
+        state: _WalkState,
     ) -> "typing.Iterator[Event]":
         """Explicit-stack DFS from ``start``; skip immediately if already seen."""
-        if start.provider_id in visited or start.provider_id in visiting:
+        if start.provider_id in state.visited or start.provider_id in state.visiting:
             return
 
         path: list[AbstractProvider[typing.Any]] = []
         stack: list[typing.Iterator[tuple[str, AbstractProvider[typing.Any]]]] = []
-        yield from self._enter(start, container, visiting, path, stack)
+        low = state.low
+        yield from self._enter(start, container, state, path, stack)
 
         while stack:
             try:
@@ -146,33 +275,65 @@ class DependencyGraph:
             except StopIteration:
                 finished = path.pop()
                 stack.pop()
-                visiting.discard(finished.provider_id)
-                visited.add(finished.provider_id)
+                state.visiting.discard(finished.provider_id)
+                state.visited.add(finished.provider_id)
+                if path:
+                    parent_id = path[-1].provider_id
+                    low[parent_id] = min(low[parent_id], low[finished.provider_id])
+                if low[finished.provider_id] == state.index[finished.provider_id]:
+                    cycle = self._close_component(finished, state)
+                    if cycle is not None:
+                        yield Cycle(cycle)
                 continue
 
-            yield Edge(path[-1], name, dep)
-            if dep.provider_id in visiting:
-                cycle_start = next(i for i, p in enumerate(path) if p.provider_id == dep.provider_id)
-                yield Cycle([*path[cycle_start:], path[cycle_start]])
+            parent = path[-1]
+            yield Edge(parent, name, dep)
+            state.successors[parent.provider_id].append(dep)
+            if dep.provider_id in state.on_component:  # a back or cross edge inside an open component
+                low[parent.provider_id] = min(low[parent.provider_id], state.index[dep.provider_id])
                 continue
-            if dep.provider_id in visited:
+            if dep.provider_id in state.visited:
                 continue
-            yield from self._enter(dep, container, visiting, path, stack)
+            yield from self._enter(dep, container, state, path, stack)
+
+    @staticmethod
+    def _close_component(
+        head: "AbstractProvider[typing.Any]", state: _WalkState
+    ) -> "list[AbstractProvider[typing.Any]] | None":
+        """Pop ``head``'s strongly connected component; return a cycle through it, or None if it is acyclic."""
+        members: set[int] = set()
+        while True:
+            node = state.component.pop()
+            state.on_component.discard(node.provider_id)
+            members.add(node.provider_id)
+            if node.provider_id == head.provider_id:
+                break
+        successors = state.successors
+        cyclic = len(members) > 1 or any(dep.provider_id == head.provider_id for dep in successors[head.provider_id])
+        cycle = _cycle_through(head, members, successors) if cyclic else None
+        for provider_id in members:
+            del successors[provider_id]
+        return cycle
 
     def _enter(
         self,
         provider: "AbstractProvider[typing.Any]",
         container: "Container",
-        visiting: set[int],
+        state: _WalkState,
         path: "list[AbstractProvider[typing.Any]]",
         stack: "list[typing.Iterator[tuple[str, AbstractProvider[typing.Any]]]]",
     ) -> "typing.Iterator[Event]":
-        """Push ``provider`` onto the active path: emit NodeEntered, then read its deps.
+        """Push ``provider`` onto the active path and Tarjan's stack: emit NodeEntered, then read its deps.
 
         A ``ResolutionError`` from ``get_dependencies`` is emitted as ``DependenciesError``
         and the node is treated as having no dependencies (the walk continues).
         """
-        visiting.add(provider.provider_id)
+        provider_id = provider.provider_id
+        state.visiting.add(provider_id)
+        state.index[provider_id] = state.low[provider_id] = len(state.index)
+        state.component.append(provider)
+        state.on_component.add(provider_id)
+        state.successors[provider_id] = []
         path.append(provider)
         yield NodeEntered(provider)
         try:
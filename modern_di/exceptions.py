@@ -247,6 +247,22 @@ class ContainerClosedError(ContainerError):
         )
 
 
+class SnapshotStaleError(ContainerError):
+    """A singleton snapshot was taken or read when it could no longer be trusted. Attr: ``reason``."""
+
+    docs_slug = "snapshot-stale-error"
+
+    __slots__ = ("reason",)
+
+    def __init__(self, *, reason: str) -> None:
+        self.reason = reason
+        super().__init__(
+            f"The singleton snapshot cannot be used: {reason}. A snapshot holds the instances cached when "
+            "it was taken and cannot follow an override or a close; resolve through the container, or take "
+            "a new snapshot once no override is active and the container is open."
+        )
+
+
 class ContainerClosedWarning(RuntimeWarning):
     """A closed container was reused implicitly and has been reopened. Attr: ``container_scope``.
 
@@ -516,6 +532,23 @@ class ChildContainerRegistrationError(RegistrationError):
         )
 
 
+class RegistryFrozenError(RegistrationError):
+    """A provider was registered after ``Container.freeze()``. Inspect ``.provider_types``."""
+
+    docs_slug = "registry-frozen-error"
+
+    __slots__ = ("provider_types",)
+
+    def __init__(self, *, provider_types: list[type]) -> None:
+        self.provider_types = provider_types
+        rendered = ", ".join(getattr(t, "__name__", repr(t)) for t in provider_types) or "reference-only providers"
+        super().__init__(
+            f"Cannot register {rendered}: the providers registry is frozen. Container.freeze() makes the "
+            "registry permanently read-only so compiled resolvers can bind fixed slots. Register every "
+            "provider before calling freeze()."
+        )
+
+
 class ProviderScopeFrozenError(RegistrationError):
     """A group tried to change the scope of a provider that is already registered.
 
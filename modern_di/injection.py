@@ -0,0 +1,139 @@
+"""`inject`: resolve a plain function's `Annotated` markers on every call.
+
+For the code no framework integration wraps — background loops, service functions, CLI
+subcommands. The function is scanned once, at decoration time, by `parse_markers`; the
+wrapper resolves through that `Injector`'s compiled binding and never through
+`resolve_dependency`.
+"""
+
+import functools
+import inspect
+import typing
+
+from modern_di import types
+from modern_di.container import Container, _handle_recursion_error
+from modern_di.integrations import Injector, mark_injected, parse_markers
+
+
+_POSITIONAL = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+
+
+class _Injection:
+    """One decorated function's call-time state: where its container comes from and how its values bind."""
+
+    __slots__ = ("_container", "_getter", "_injector", "_leading", "_positional")
+
+    def __init__(
+        self,
+        source: "Container | typing.Callable[[], Container]",
+        injector: Injector,
+        signature: inspect.Signature,
+    ) -> None:
+        self._container = source if isinstance(source, Container) else None
+        self._getter = None if isinstance(source, Container) else source
+        positional = [p.name for p in signature.parameters.values() if p.kind in _POSITIONAL]
+        # Each positional parameter in order, and whether it is marked: the caller's positional
+        # arguments fill the unmarked ones only, as the advertised signature says.
+        self._positional = [(name, name in injector) for name in positional]
+        # Ordered by signature: when the markers are exactly the trailing positional parameters,
+        # a call passing every other positional argument and no keywords appends their values.
+        self._injector = Injector({name: injector[name] for name in signature.parameters if name in injector})
+        leading = len(positional) - len(injector)
+        self._leading = leading if leading >= 0 and all(name in injector for name in positional[leading:]) else -1
+
+    def arguments(
+        self, args: tuple[typing.Any, ...], kwargs: dict[str, typing.Any]
+    ) -> tuple[typing.Sequence[typing.Any], dict[str, typing.Any]]:
+        """Return the call's arguments with every marked parameter the caller left out resolved."""
+        container = self._container if self._getter is None else self._getter()
+        registry = container.providers_registry
+        binding = self._injector._binding  # noqa: SLF001 - `Injector.resolve`'s check, inlined
+        if binding is None or binding[0] is not registry or binding[1] != registry._generation:  # noqa: SLF001
+            binding = self._injector._bind(container)  # noqa: SLF001
+        if container.closed:
+            container._prepare()  # noqa: SLF001
+        if len(args) == self._leading and not kwargs:
+            values = list(args)
+            try:
+                for _, provider, resolver in binding[2]:  # noqa: B007 - `provider` is read by the handler
+                    values.append(resolver(container))
+            except RecursionError as exc:
+                _handle_recursion_error(provider, container, exc)
+            return values, kwargs
+        return self._fill(args, kwargs, binding[2], container), kwargs
+
+    def _fill(
+        self,
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+        entries: "typing.Iterable[tuple[str, typing.Any, typing.Callable[[Container], typing.Any]]]",
+        container: Container,
+    ) -> list[typing.Any]:
+        """Lay the caller's positional `args` over the unmarked positional parameters, then resolve the rest.
+
+        A marked parameter ahead of one the caller filled is passed positionally too; every later
+        one goes into `kwargs`. An argument the caller passed for a marked parameter by keyword wins.
+        """
+        values: list[typing.Any] = []
+        taken = 0
+        remaining = iter(entries)
+        try:
+            for name, marked in self._positional:
+                if taken == len(args):
+                    break
+                if not marked:
+                    values.append(args[taken])
+                    taken += 1
+                    continue
+                _, provider, resolver = next(remaining)
+                values.append(kwargs.pop(name) if name in kwargs else resolver(container))
+            for name, provider, resolver in remaining:  # noqa: B007
+                if name not in kwargs:
+                    kwargs[name] = resolver(container)
+        except RecursionError as exc:
+            _handle_recursion_error(provider, container, exc)
+        values.extend(args[taken:])
+        return values
+
+
+def inject(
+    container: "Container | typing.Callable[[], Container]",
+) -> typing.Callable[[typing.Callable[..., types.T]], typing.Callable[..., types.T]]:
+    """Decorate a function so its `Annotated[T, from_di(...)]` parameters are resolved on each call.
+
+    ``container`` is the container to resolve from, or a zero-argument callable returning it
+    per call (a context variable's ``get``, say). The marked parameters are dropped from the
+    wrapper's ``__signature__``, and positional arguments fill the remaining parameters in order;
+    an argument the caller passes for a marked one by keyword is used as is.
+    Works on sync and async functions alike.
+    """
+
+    def decorator(func: typing.Callable[..., types.T]) -> typing.Callable[..., types.T]:
+        injector = parse_markers(func)
+        signature = inspect.signature(func)
+        injection = _Injection(container, injector, signature)
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:  # noqa: ANN401
+                call_args, call_kwargs = injection.arguments(args, kwargs)
+                return await func(*call_args, **call_kwargs)
+
+            wrapper: typing.Callable[..., typing.Any] = async_wrapper
+        else:
+
+            @functools.wraps(func)
+            def sync_wrapper(*args: typing.Any, **kwargs: typing.Any) -> typing.Any:  # noqa: ANN401
+                call_args, call_kwargs = injection.arguments(args, kwargs)
+                return func(*call_args, **call_kwargs)
+
+            wrapper = sync_wrapper
+
+        wrapper.__signature__ = signature.replace(  # ty: ignore[unresolved-attribute]
+            parameters=[p for p in signature.parameters.values() if p.name not in injector]
+        )
+        mark_injected(wrapper)
+        return typing.cast(typing.Callable[..., types.T], wrapper)
+
+    return decorator
@@ -4,8 +4,8 @@ Layer 1 (`bind`, `classify_connection`) derives a child container's scope and
 context from one or more `ContextProvider`s. Neither wraps
 `build_child_container` — the caller's own call to it stays the single
 blessed way to open a child; these functions only decide what to pass it.
-Layer 2 (`Marker`, `from_di`, `parse_markers`, `resolve_markers`) is the
-`Annotated`-marker injector shared by every integration without a native
+Layer 2 (`Marker`, `from_di`, `parse_markers`, `Injector`, `resolve_markers`)
+is the `Annotated`-marker injector shared by every integration without a native
 per-handler injection seam. `is_injected`/`mark_injected` guard against
 double-wrapping a handler an auto-inject sweep visits more than once.
 """
@@ -14,7 +14,9 @@ import dataclasses
 import enum
 import typing
 
-from modern_di import types
+from modern_di import exceptions, suggester, types
+from modern_di.container import _handle_recursion_error
+from modern_di.providers.abstract import AbstractProvider
 
 
 _INJECTED_ATTR = "__modern_di_injected__"
@@ -22,8 +24,8 @@ _INJECTED_ATTR = "__modern_di_injected__"
 
 if typing.TYPE_CHECKING:
     from modern_di.container import Container
-    from modern_di.providers.abstract import AbstractProvider
     from modern_di.providers.context_provider import ContextProvider
+    from modern_di.registries.providers_registry import ProvidersRegistry
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -79,7 +81,76 @@ def from_di(dependency: "AbstractProvider[types.T] | type[types.T]") -> types.T:
     return typing.cast(types.T, Marker(dependency))
 
 
-def parse_markers(func: typing.Callable[..., typing.Any]) -> dict[str, Marker[typing.Any]]:
+_Binding = tuple[
+    "ProvidersRegistry",
+    int,
+    tuple[tuple[str, AbstractProvider[typing.Any], "typing.Callable[[Container], typing.Any]"], ...],
+]
+
+
+class Injector(dict[str, Marker[typing.Any]]):
+    """A handler's markers by parameter name, compiled to resolve in one call.
+
+    What `parse_markers` returns: still a plain mapping of name to `Marker`, so it
+    can be read or passed anywhere a `dict` is expected. `resolve(container)`
+    binds every marker to its provider's compiled resolver on first use against a
+    providers registry and keeps that binding until the registry's generation
+    moves (a registration, or a tree-wide override set or reset). A call then
+    costs one `closed` check and one resolver call per parameter, instead of
+    `Marker.resolve` → `resolve_dependency` → `resolve`/`resolve_provider` for each.
+    Overrides are honoured by the resolvers' own guards, as for any resolve.
+
+    Built once at decoration time and read-only thereafter: the binding is not
+    refreshed by mutating the mapping.
+    """
+
+    __slots__ = ("_binding",)
+
+    def __init__(self, markers: dict[str, Marker[typing.Any]] | None = None) -> None:
+        super().__init__(markers or {})
+        self._binding: _Binding | None = None
+
+    def resolve(self, container: "Container") -> dict[str, typing.Any]:
+        """Resolve every marker from `container`, keyed by parameter name, as `resolve_markers` does."""
+        registry = container.providers_registry
+        binding = self._binding
+        if binding is None or binding[0] is not registry or binding[1] != registry._generation:  # noqa: SLF001
+            binding = self._bind(container)
+        if container.closed:
+            container._prepare()  # noqa: SLF001
+        kwargs: dict[str, typing.Any] = {}
+        try:
+            for name, provider, resolver in binding[2]:  # noqa: B007 - `provider` is read by the handler
+                kwargs[name] = resolver(container)
+        except RecursionError as exc:
+            _handle_recursion_error(provider, container, exc)
+        return kwargs
+
+    def _bind(self, container: "Container") -> _Binding:
+        """Bind every marker to its provider's compiled resolver for `container`'s registry, and keep the binding."""
+        registry = container.providers_registry
+        generation = registry._generation  # noqa: SLF001 - read before binding; a mutation during it bumps this
+        entries: list[tuple[str, AbstractProvider[typing.Any], typing.Callable[[Container], typing.Any]]] = []
+        for name, marker in self.items():
+            dependency = marker.dependency
+            if isinstance(dependency, AbstractProvider):
+                provider = dependency
+            else:
+                provider = registry._providers.get(dependency)  # noqa: SLF001
+                if provider is None:  # the error `Container.resolve` raises
+                    raise exceptions.ProviderNotRegisteredError(
+                        provider_type=dependency, suggestions=suggester.suggest(dependency, registry)
+                    )
+            try:  # as in `resolve_provider`: a RecursionError while compiling is a cycle too
+                entries.append((name, provider, registry.resolver_for(provider)))
+            except RecursionError as exc:
+                _handle_recursion_error(provider, container, exc)
+        binding = (registry, generation, tuple(entries))
+        self._binding = binding
+        return binding
+
+
+def parse_markers(func: typing.Callable[..., typing.Any]) -> Injector:
     """Scan `func`'s `Annotated` parameter hints for `Marker`s.
 
     Call once at decoration time, not per call. The first `Marker` found in a
@@ -87,7 +158,7 @@ def parse_markers(func: typing.Callable[..., typing.Any]) -> dict[str, Marker[ty
     references propagate `get_type_hints`'s own error unchanged.
     """
     hints = typing.get_type_hints(func, include_extras=True)
-    markers: dict[str, Marker[typing.Any]] = {}
+    markers = Injector()
     for name, hint in hints.items():
         if name == "return":
             continue
@@ -100,7 +171,12 @@ def parse_markers(func: typing.Callable[..., typing.Any]) -> dict[str, Marker[ty
 
 
 def resolve_markers(container: "Container", markers: typing.Mapping[str, Marker[typing.Any]]) -> dict[str, typing.Any]:
-    """Resolve every marker in `markers` from `container`, keyed by parameter name."""
+    """Resolve every marker in `markers` from `container`, keyed by parameter name.
+
+    An `Injector` (what `parse_markers` returns) resolves through its compiled binding.
+    """
+    if type(markers) is Injector:
+        return markers.resolve(container)
     return {name: marker.resolve(container) for name, marker in markers.items()}
 
 
@@ -19,6 +19,11 @@ if typing.TYPE_CHECKING:
 class CacheSettings(typing.Generic[types.T_co]):
     clear_cache: bool = True
     finalizer: typing.Callable[[types.T_co], typing.Awaitable[None] | None] | None = None
+    # Run a sync finalizer in the event loop's default executor during `close_async`, so a blocking
+    # teardown does not stall the loop. Ignored by `close_sync` and for async finalizers.
+    offload_finalizer: bool = False
+    # Create the instance as soon as a container of the provider's scope is built, not on first resolve.
+    eager: bool = False
     is_async_finalizer: bool = dataclasses.field(init=False)
 
     def __post_init__(self) -> None:
@@ -33,6 +38,8 @@ class Factory(AbstractProvider[types.T_co]):
         "_kwargs",
         "_parsed_kwargs",
         "cache_settings",
+        "hot",
+        "shared",
     )
 
     def __init__(  # noqa: PLR0913
@@ -44,6 +51,8 @@ class Factory(AbstractProvider[types.T_co]):
         kwargs: dict[str, typing.Any] | None = None,
         cache: bool | CacheSettings[types.T_co] | None = None,
         skip_creator_parsing: bool = False,
+        hot: bool = False,
+        shared: bool = False,
     ) -> None:
         if cache is True:
             resolved_cache: CacheSettings[types.T_co] | None = CacheSettings()
@@ -84,6 +93,8 @@ class Factory(AbstractProvider[types.T_co]):
         super().__init__(scope=scope, bound_type=parsed_type if isinstance(bound_type, types.UnsetType) else bound_type)
         self._creator = creator
         self.cache_settings = resolved_cache
+        self.hot = hot
+        self.shared = shared
         self._kwargs = kwargs
         self._cached_definition_site: str | types.UnsetType | None = types.UNSET
 
@@ -0,0 +1,98 @@
+import asyncio
+import typing
+
+from modern_di import exceptions
+from modern_di.registries.cache_registry import CacheRegistry
+
+
+if typing.TYPE_CHECKING:
+    import typing_extensions
+
+
+_Teardown = tuple[CacheRegistry, "list[list[int]] | None", "float | None"]
+
+
+def _report(error: BaseException, message: str) -> None:
+    asyncio.get_running_loop().call_exception_handler({"message": message, "exception": error})
+
+
+class Reaper:
+    """Finalizes closed containers' caches in a background task, off the path that closed them.
+
+    ``Container.close_async(reaper=...)`` detaches the container's created items and queues them
+    here instead of awaiting their finalizers. One task drains the queue on the running event loop,
+    finalizing up to ``batch_size`` queued teardowns at a time, each in its own LIFO order. A
+    teardown's :class:`~modern_di.exceptions.FinalizerError` goes to ``error_sink`` rather than to
+    whoever closed the container; by default it is reported through the loop's exception handler.
+    At most ``max_pending`` teardowns wait in the queue: a close that finds it full waits for room.
+
+    Start it with ``async with Reaper() as reaper:`` (or let the first teardown start it) and leave
+    the block, or ``await reaper.aclose()``, to finalize everything still queued.
+    """
+
+    __slots__ = ("_batch_size", "_error_sink", "_queue", "_task")
+
+    def __init__(
+        self,
+        *,
+        max_pending: int = 1024,
+        batch_size: int = 32,
+        error_sink: typing.Callable[[exceptions.FinalizerError], None] | None = None,
+    ) -> None:
+        self._queue: asyncio.Queue[_Teardown | None] = asyncio.Queue(maxsize=max_pending)
+        self._batch_size = batch_size
+        self._error_sink = error_sink
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background task on the running loop; a no-op while it runs."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def submit(
+        self, registry: CacheRegistry, *, levels: list[list[int]] | None = None, timeout: float | None = None
+    ) -> None:
+        """Queue `registry` for finalization, waiting while `max_pending` teardowns are already queued."""
+        self.start()
+        await self._queue.put((registry, levels, timeout))
+
+    async def aclose(self) -> None:
+        """Finalize every queued teardown, then stop the background task."""
+        if self._task is None:
+            return
+        await self._queue.put(None)  # queued behind every pending teardown
+        await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        running = True
+        while running:
+            batch: list[_Teardown] = []
+            teardown = await self._queue.get()
+            while teardown is not None:
+                batch.append(teardown)
+                if len(batch) == self._batch_size or self._queue.empty():
+                    break
+                teardown = self._queue.get_nowait()
+            else:  # reached the stop marker `aclose` queued
+                running = False
+            results = await asyncio.gather(*(self._finalize(*teardown) for teardown in batch), return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):  # a failing sink, or a finalizer's cancellation: keep reaping
+                    _report(result, "modern-di: a deferred teardown failed")
+
+    async def _finalize(self, registry: CacheRegistry, levels: list[list[int]] | None, timeout: float | None) -> None:
+        try:
+            await registry.close_async(levels=levels, timeout=timeout)
+        except exceptions.FinalizerError as e:
+            if self._error_sink is None:
+                _report(e, "modern-di: deferred finalizers failed")
+            else:
+                self._error_sink(e)
+
+    async def __aenter__(self) -> "typing_extensions.Self":
+        self.start()
+        return self
+
+    async def __aexit__(self, *_: object) -> None:
+        await self.aclose()
@@ -1,5 +1,8 @@
+import asyncio
 import dataclasses
 import inspect
+import threading
+import time
 import typing
 
 from modern_di import exceptions, types
@@ -7,7 +10,7 @@ from modern_di.providers import CacheSettings, Factory
 
 
 if typing.TYPE_CHECKING:
-    import threading
+    from modern_di.providers.abstract import AbstractProvider
 
 
 _R = typing.TypeVar("_R")
@@ -19,11 +22,11 @@ class CacheItem:
     settings: CacheSettings[typing.Any] | None
     cache: typing.Any = types.UNSET
     finalized: bool = False
-
-    def _clear(self) -> None:
-        if self.settings and self.settings.clear_cache:
-            self.cache = types.UNSET
-            self.finalized = False
+    # This item's own creation lock, installed by its first locked creation. Waits for it are
+    # counted here, written only while it is held.
+    _lock: "threading.RLock | None" = dataclasses.field(init=False, default=None)
+    lock_waits: int = dataclasses.field(init=False, default=0)
+    lock_wait_ns: int = dataclasses.field(init=False, default=0)
 
     def get_or_create(
         self,
@@ -31,19 +34,32 @@ class CacheItem:
         resolve: typing.Callable[[], _R],
         create: typing.Callable[[_R], _V],
     ) -> tuple[_V, bool]:
-        """Return the memoized singleton, or resolve-and-create it once under `lock`.
+        """Return the memoized singleton, or resolve-and-create it once under this item's lock.
 
         Two phases: `resolve()` runs unlocked (recursive dependency resolution must not
-        hold the lock); creation and the store run under `lock`, double-checked so at
-        most one caller creates. `lock` is the resolving container's `RLock` (or None
-        when the container was built with `use_lock=False`). Returns `(value, created)`;
-        `created` is True only when this call ran `create`.
+        hold the lock); creation and the store run under the item's own `RLock`, double-checked
+        so at most one caller creates, while unrelated items create in parallel. `lock` is the
+        resolving container's `RLock`, held only to install the item's lock once (None when the
+        container was built with `use_lock=False`: no locking at all). A creator that has to wait
+        adds to `lock_waits` / `lock_wait_ns`. Returns `(value, created)`; `created` is True only
+        when this call ran `create`.
         """
         if self.cache is not types.UNSET:
             return self.cache, False
         resolved = resolve()
+        item_lock = None
         if lock is not None:
-            lock.acquire()
+            item_lock = self._lock
+            if item_lock is None:
+                with lock:  # install once; racing first creators must all end up on the same lock
+                    item_lock = self._lock
+                    if item_lock is None:
+                        item_lock = self._lock = threading.RLock()
+            if not item_lock.acquire(blocking=False):
+                started = time.perf_counter_ns()
+                item_lock.acquire()
+                self.lock_waits += 1
+                self.lock_wait_ns += time.perf_counter_ns() - started
         try:
             if self.cache is not types.UNSET:
                 return self.cache, False
@@ -51,40 +67,104 @@ class CacheItem:
             self.cache = value
             return value, True
         finally:
-            if lock is not None:
-                lock.release()
+            if item_lock is not None:
+                item_lock.release()
 
     async def close_async(self) -> None:
-        if self.cache is not types.UNSET and not self.finalized and self.settings and self.settings.finalizer:
-            result = self.settings.finalizer(self.cache)
-            if inspect.isawaitable(result):
+        settings = self.settings
+        if settings is None:
+            return
+        if settings.finalizer is not None and not self.finalized and self.cache is not types.UNSET:
+            if settings.offload_finalizer and not settings.is_async_finalizer:
+                # The default executor bounds how many offloaded finalizers run at once.
+                result = await asyncio.to_thread(settings.finalizer, self.cache)
+            else:
+                result = settings.finalizer(self.cache)
+            if result is not None and inspect.isawaitable(result):
                 await result
             self.finalized = True
-
-        self._clear()
+        if settings.clear_cache:
+            self.cache = types.UNSET
+            self.finalized = False
 
     def close_sync(self) -> None:
-        if self.cache is not types.UNSET and not self.finalized and self.settings and self.settings.finalizer:
-            if self.settings.is_async_finalizer:
+        settings = self.settings
+        if settings is None:
+            return
+        if settings.finalizer is not None and not self.finalized and self.cache is not types.UNSET:
+            if settings.is_async_finalizer:
                 raise exceptions.AsyncFinalizerInSyncCloseError(finalizer_type=type(self.cache))
-            result = self.settings.finalizer(self.cache)
-            if inspect.isawaitable(result):
+            result = settings.finalizer(self.cache)
+            if result is not None and inspect.isawaitable(result):
                 if inspect.iscoroutine(result):
                     result.close()  # suppress "never awaited" warning
                 raise exceptions.AsyncFinalizerInSyncCloseError(finalizer_type=type(self.cache))
             self.finalized = True
+        if settings.clear_cache:
+            self.cache = types.UNSET
+            self.finalized = False
+
+
+def _keep_finalizer_errors(interrupted: BaseException, finalizer_errors: list[BaseException]) -> None:
+    """Chain the finalizer errors collected so far under `interrupted`, a cancellation cutting the close short.
+
+    The close re-raises the cancellation rather than a `FinalizerError`, so the errors ride along as
+    its `__cause__` instead of being lost.
+    """
+    if finalizer_errors:
+        interrupted.__cause__ = exceptions.FinalizerError(finalizer_errors=list(finalizer_errors), is_async=True)
 
-        self._clear()
+
+async def _close_item(cache_item: CacheItem, timeout: float | None) -> None:
+    if timeout is None:
+        await cache_item.close_async()
+    else:
+        await asyncio.wait_for(cache_item.close_async(), timeout)
+
+
+class SingletonSnapshot(dict[type, typing.Any]):
+    """The instances a container had cached when `Container.snapshot_singletons` ran, by bound type.
+
+    Handed out behind a `MappingProxyType`, so a read is one dict lookup. `invalidate` empties it
+    and records why; from then on a read raises `SnapshotStaleError` instead of `KeyError`.
+    """
+
+    __slots__ = ("__weakref__", "reason")
+
+    def __init__(self, instances: dict[type, typing.Any]) -> None:
+        super().__init__(instances)
+        self.reason: str | None = None
+
+    def __missing__(self, key: type) -> typing.NoReturn:
+        if self.reason is not None:
+            raise exceptions.SnapshotStaleError(reason=self.reason)
+        raise KeyError(key)
+
+    def invalidate(self, reason: str) -> None:
+        self.reason = reason
+        self.clear()
 
 
 @dataclasses.dataclass(kw_only=True, slots=True)
 class CacheRegistry:
     _items: dict[int, CacheItem] = dataclasses.field(init=False, default_factory=dict)
+    # The close plan, split at creation: `_creation_order` holds the created items with a finalizer,
+    # finalized LIFO; `_clear_only` the ones that merely drop their cache. A created item with
+    # neither a finalizer nor `clear_cache` needs nothing at close and is in neither list.
     _creation_order: list[CacheItem] = dataclasses.field(init=False, default_factory=list)
+    _clear_only: list[CacheItem] = dataclasses.field(init=False, default_factory=list)
+    # Frozen-registry storage: the same CacheItems as `_items`, at each provider's dense slot. Sized at
+    # construction (or by `Container.freeze()`); empty -- and never read -- while the registry is unfrozen.
+    _slots: list[CacheItem | None] = dataclasses.field(init=False, default_factory=list)
 
     def cached_count(self) -> int:
         return sum(1 for item in self._items.values() if item.cache is not types.UNSET)
 
+    def lock_wait_totals(self) -> tuple[int, int]:
+        """Return how many creations had to wait for an item's lock, and for how many nanoseconds in all."""
+        items = list(self._items.values())
+        return sum(item.lock_waits for item in items), sum(item.lock_wait_ns for item in items)
+
     def fetch_cache_item(self, provider: Factory[types.T_co]) -> CacheItem:
         # Get before setdefault: a plain setdefault eagerly builds a throwaway CacheItem on every
         # hit (architecture/performance.md). The creation path keeps setdefault, whose atomicity is
@@ -96,22 +176,137 @@ class CacheRegistry:
             return item
         return self._items.setdefault(provider.provider_id, CacheItem(settings=provider.cache_settings))
 
+    def snapshot(self, providers: "dict[type, AbstractProvider[typing.Any]]") -> SingletonSnapshot:
+        """Return every created instance of `providers`, keyed by the type it is registered under."""
+        items = self._items
+        instances: dict[type, typing.Any] = {}
+        for bound_type, provider in list(providers.items()):
+            item = items.get(provider.provider_id)
+            if item is not None and item.cache is not types.UNSET:
+                instances[bound_type] = item.cache
+        return SingletonSnapshot(instances)
+
+    def mirror_slot(self, slot: int, cache_item: CacheItem) -> None:
+        """Publish `cache_item` at `slot` once `fetch_cache_item` has settled which item is shared.
+
+        A no-op when this container's slot list predates the freeze that assigned `slot`.
+        """
+        if slot < len(self._slots):
+            self._slots[slot] = cache_item
+
+    def size_slots(self, count: int) -> None:
+        """Grow the slot list to `count` empty slots; an item already in `_items` is mirrored on its next miss."""
+        self._slots.extend([None] * (count - len(self._slots)))
+
+    def reset(self) -> None:
+        """Empty the registry in place, as if newly constructed, for a pooled child's next owner.
+
+        Called only once a close finalized everything, so no item dropped here still owes a finalizer.
+        """
+        self._items.clear()
+        self._creation_order.clear()
+        self._clear_only.clear()
+        if self._slots:
+            self._slots[:] = [None] * len(self._slots)
+
+    def detach(self) -> "CacheRegistry":
+        """Move the created items into a new registry for a `Reaper` to finalize, leaving this one as if closed.
+
+        An item with `clear_cache=False` stays cached here as well, exactly as a close leaves it; the
+        detached registry still runs its finalizer.
+        """
+        detached = CacheRegistry()
+        detached._items = self._items
+        detached._creation_order = self._creation_order
+        detached._clear_only = self._clear_only
+        self._items = {
+            pid: item for pid, item in detached._items.items() if item.settings and not item.settings.clear_cache
+        }
+        self._creation_order = []
+        self._clear_only = []
+        if self._slots:
+            self._slots[:] = [None] * len(self._slots)  # a kept item is mirrored again on its next miss
+        return detached
+
     def mark_created(self, cache_item: CacheItem) -> None:
-        """Record creation completion; close finalizes in reverse of this order (LIFO)."""
-        self._creation_order.append(cache_item)
+        """Record creation completion in the close plan; close finalizes in reverse of this order (LIFO)."""
+        settings = cache_item.settings
+        if settings is None:
+            return
+        if settings.finalizer is not None:
+            self._creation_order.append(cache_item)
+        elif settings.clear_cache:
+            self._clear_only.append(cache_item)
 
-    async def close_async(self) -> None:
+    def _drop_clear_only(self) -> None:
+        for cache_item in self._clear_only:
+            cache_item.cache = types.UNSET  # never finalized: no flag to reset
+        self._clear_only.clear()
+
+    async def close_async(self, *, levels: list[list[int]] | None = None, timeout: float | None = None) -> None:
+        """Finalize every created item, LIFO, collecting finalizer errors into one `FinalizerError`.
+
+        With `levels` -- provider ids grouped by dependency level, lowest first -- the items of one
+        level are finalized concurrently, highest level first, so a dependent still closes before
+        its dependency. An item no level covers depends on nothing registered and closes first, in
+        turn. `timeout` bounds each awaited finalizer; one that overruns counts as its error.
+        """
+        if self._clear_only:
+            self._drop_clear_only()
+        if not self._creation_order:
+            return  # nothing created needs a finalizer
         finalizer_errors: list[BaseException] = []
-        for cache_item in reversed(self._creation_order):
-            try:
-                await cache_item.close_async()
-            except Exception as e:  # noqa: BLE001, PERF203
-                finalizer_errors.append(e)
+        if levels is None:
+            for cache_item in reversed(self._creation_order):
+                try:
+                    if timeout is None:
+                        await cache_item.close_async()  # the default close: no wrapper coroutine per item
+                    else:
+                        await _close_item(cache_item, timeout)
+                except Exception as e:  # noqa: BLE001, PERF203
+                    finalizer_errors.append(e)
+                except BaseException as e:
+                    _keep_finalizer_errors(e, finalizer_errors)
+                    raise
+        else:
+            await self._close_levels(levels, timeout, finalizer_errors)
         self._creation_order.clear()
         if finalizer_errors:
             raise exceptions.FinalizerError(finalizer_errors=finalizer_errors, is_async=True)
 
+    async def _close_levels(
+        self, levels: list[list[int]], timeout: float | None, finalizer_errors: list[BaseException]
+    ) -> None:
+        for batch in self._finalization_batches(levels):
+            results = await asyncio.gather(*(_close_item(item, timeout) for item in batch), return_exceptions=True)
+            interrupted: BaseException | None = None
+            for result in results:
+                if isinstance(result, Exception):
+                    finalizer_errors.append(result)
+                elif isinstance(result, BaseException) and interrupted is None:
+                    interrupted = result  # re-raised once the level's errors are all collected
+            if interrupted is not None:
+                _keep_finalizer_errors(interrupted, finalizer_errors)
+                raise interrupted
+
+    def _finalization_batches(self, levels: list[list[int]]) -> list[list[CacheItem]]:
+        """Split the created items into the batches `close_async` finalizes concurrently, in order."""
+        created = {id(item) for item in self._creation_order}
+        batches: list[list[CacheItem]] = []
+        leveled: set[int] = set()
+        for level in reversed(levels):
+            batch = [item for pid in level if (item := self._items.get(pid)) is not None and id(item) in created]
+            leveled.update(id(item) for item in batch)
+            if batch:
+                batches.append(batch)
+        unleveled = [[item] for item in reversed(self._creation_order) if id(item) not in leveled]
+        return unleveled + batches
+
     def close_sync(self) -> None:
+        if self._clear_only:
+            self._drop_clear_only()
+        if not self._creation_order:
+            return  # nothing created needs a finalizer
         finalizer_errors: list[BaseException] = []
         remaining: list[CacheItem] = []
         for cache_item in reversed(self._creation_order):
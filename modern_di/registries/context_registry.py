@@ -7,6 +7,12 @@ from modern_di import types
 @dataclasses.dataclass(kw_only=True, slots=True)
 class ContextRegistry:
     context: dict[type[typing.Any], typing.Any]
+    # What compiled resolvers read instead of hashing a type: every context type a resolver reads
+    # has a slot number in its scope (`ProvidersRegistry.context_slot`), and `values[slot]` is its
+    # value, UNSET when not set. Empty until the first such read and emptied again by every write,
+    # so `context` stays the single source of truth. `tuple()` is the shared empty tuple: a new
+    # container allocates nothing for it.
+    values: list[typing.Any] | tuple[()] = dataclasses.field(init=False, default_factory=tuple)
 
     def find_context(self, context_type: type[types.T]) -> "types.T | types.UnsetType":
         # `in` + `[]` rather than `.get(key, UNSET)`: two specialized opcodes beat one method call
@@ -15,5 +21,30 @@ class ContextRegistry:
             return self.context[context_type]
         return types.UNSET
 
+    def refill(self, slot_types: list[type[typing.Any]]) -> list[typing.Any]:
+        """Rebuild `values` from `context`, one entry per type of `slot_types` in slot order, and return it.
+
+        A compiled resolver's miss path: it reads past the end of `values` after any write, and after
+        a slot was numbered since the last refill.
+        """
+        context = self.context
+        values = [  # `in` + `[]` as in `find_context`
+            context[context_type] if context_type in context else types.UNSET  # noqa: SIM401
+            for context_type in slot_types
+        ]
+        self.values = values
+        return values
+
     def set_context(self, context_type: type[types.T], obj: types.T) -> None:
         self.context[context_type] = obj
+        self.values = ()
+
+    def set_contexts(self, context: dict[type[typing.Any], typing.Any]) -> None:
+        """Set every value in `context` at once, invalidating `values` once."""
+        self.context.update(context)
+        self.values = ()
+
+    def reset(self, context: dict[type[typing.Any], typing.Any]) -> None:
+        """Replace every context value with `context`, as a pooled child's reuse does."""
+        self.context = context
+        self.values = ()
@@ -1,33 +1,136 @@
+import contextvars
 import dataclasses
+import threading
 import typing
 from types import TracebackType
 
 from modern_di import types
 
 
+if typing.TYPE_CHECKING:
+    from modern_di.registries.providers_registry import ProvidersRegistry
+
+
+def _new_context() -> "contextvars.ContextVar[dict[int, typing.Any]]":
+    # The default is never mutated: entering an override context sets a fresh merged dict.
+    return contextvars.ContextVar("modern_di_overrides", default={})  # noqa: B039
+
+
 @dataclasses.dataclass(kw_only=True, slots=True)
 class OverridesRegistry:
+    """The overrides shared by a container tree.
+
+    With ``compiled_into`` (what a root container builds) an override is compiled into that
+    providers registry: the overridden provider's resolver is swapped for one returning the
+    override, its dependents are recompiled, and ``has_overrides`` stays False, so every other
+    resolver skips the ``fetch_override`` lookup. Without it, ``has_overrides`` turns True and
+    every compiled resolver checks ``fetch_override`` on each resolve.
+
+    Overrides entered with ``enter_context`` live in a ``ContextVar`` instead, so each task or
+    thread sees only its own. ``has_overrides`` is True while any context is entered, anywhere, and
+    ``fetch_override`` checks the current context's overrides before the shared ones.
+    """
+
     _overrides: dict[int, typing.Any] = dataclasses.field(init=False, default_factory=dict)
     # default_factory (not default): a slots=True dataclass strips the class-level default of an
     # init=False field, so a plain `default=False` never lands on the instance. `bool()` is False.
     has_overrides: bool = dataclasses.field(init=False, default_factory=bool)
+    compiled_into: "ProvidersRegistry | None" = None
+    _context: "contextvars.ContextVar[dict[int, typing.Any]]" = dataclasses.field(
+        init=False, default_factory=_new_context
+    )
+    _contexts: int = dataclasses.field(init=False, default_factory=int)  # entered and not yet exited, in any task
+    _lock: threading.Lock = dataclasses.field(init=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        if self.compiled_into is not None:
+            self.compiled_into._overridden = self._overrides  # noqa: SLF001 - the compiler reads this very dict
 
     def override(self, provider_id: int, override_object: object) -> None:
-        self._overrides[provider_id] = override_object
-        self.has_overrides = True
+        self.override_many({provider_id: override_object})
+
+    def override_many(self, overrides: dict[int, object]) -> None:
+        """Apply every override in `overrides` at once: a compiled registry recompiles once for all of them."""
+        self._overrides.update(overrides)
+        if self.compiled_into is not None:
+            self.compiled_into.recompile_overridden(overrides)
+        else:
+            self._refresh()
 
     def reset_override(self, provider_id: int | None = None) -> None:
         if provider_id is None:
+            dropped = list(self._overrides)
             self._overrides.clear()
+        elif provider_id in self._overrides:
+            dropped = [provider_id]
+            del self._overrides[provider_id]
         else:
-            self._overrides.pop(provider_id, None)
-        self.has_overrides = bool(self._overrides)
+            dropped = []
+        if self.compiled_into is None:
+            self._refresh()
+        elif dropped:
+            self.compiled_into.recompile_overridden(dropped)
+
+    def enter_context(self, overrides: dict[int, object]) -> "contextvars.Token[dict[int, typing.Any]]":
+        """Apply `overrides` in the current context only, over any context entered around it."""
+        if self.compiled_into is not None:
+            self.compiled_into.drop_snapshots("an override context was entered after it was taken")
+        token = self._context.set({**self._context.get(), **overrides})
+        with self._lock:
+            self._contexts += 1
+            self._refresh()
+        return token
+
+    def exit_context(self, token: "contextvars.Token[dict[int, typing.Any]]") -> None:
+        """Restore the context `enter_context` returned `token` for."""
+        self._context.reset(token)
+        with self._lock:
+            self._contexts -= 1
+            self._refresh()
+
+    def _refresh(self) -> None:
+        """Recompute `has_overrides`; a compiled registry's own overrides never need the guard."""
+        self.has_overrides = self._contexts > 0 or (self.compiled_into is None and bool(self._overrides))
 
     def fetch_override(self, provider_id: int) -> object:
+        if self._contexts:
+            override = self._context.get().get(provider_id, types.UNSET)
+            if override is not types.UNSET:
+                return override
         if not self._overrides:
             return types.UNSET
         return self._overrides.get(provider_id, types.UNSET)
 
+    def fetch_own_override(self, provider_id: int) -> object:
+        """Return the override set on this registry itself, ignoring any layer beneath it."""
+        return self._overrides.get(provider_id, types.UNSET)
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class OverrideLayer(OverridesRegistry):
+    """One child container's own overrides, over the registry it would otherwise share with its parent.
+
+    Installed by ``Container.override(..., local=True)`` and inherited by that child's descendants,
+    so it is consulted only by resolves inside that subtree; every other container keeps the shared
+    registry and pays nothing for it. ``has_overrides`` stays True while the layer exists, since the
+    registry beneath it can gain an override at any time.
+    """
+
+    parent: OverridesRegistry
+    # `id()` of the container that installed the layer: its descendants share the layer but must
+    # install their own. An id, not a reference, so the layer adds no container reference cycle.
+    owner: int
+
+    def __post_init__(self) -> None:
+        self.has_overrides = True
+
+    def _refresh(self) -> None:
+        self.has_overrides = True
+
+    def fetch_override(self, provider_id: int) -> object:
+        value = self._overrides.get(provider_id, types.UNSET)
+        return self.parent.fetch_override(provider_id) if value is types.UNSET else value
+
 
 class OverrideHandle(typing.Generic[types.T]):
     """Context-manager handle returned by ``Container.override``.
@@ -64,3 +167,30 @@ class OverrideHandle(typing.Generic[types.T]):
             self._registry.reset_override(self._provider_id)
         else:
             self._registry.override(self._provider_id, self._prior)
+
+
+class OverrideContext:
+    """Context manager returned by ``Container.override_context``.
+
+    Unlike ``OverrideHandle`` the overrides apply from ``__enter__``, and only in the entering
+    context: the current thread, or the current asyncio task and the tasks it starts inside the
+    block. ``__exit__`` restores the context's previous overrides. Single-use contract.
+    """
+
+    __slots__ = ("_overrides", "_registry", "_token")
+
+    def __init__(self, *, registry: OverridesRegistry, overrides: dict[int, object]) -> None:
+        self._registry = registry
+        self._overrides = overrides
+        self._token: contextvars.Token[dict[int, typing.Any]] | None = None
+
+    def __enter__(self) -> None:
+        self._token = self._registry.enter_context(self._overrides)
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self._registry.exit_context(typing.cast("contextvars.Token[dict[int, typing.Any]]", self._token))
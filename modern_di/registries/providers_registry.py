@@ -1,29 +1,104 @@
+import enum
 import threading
 import typing
+import weakref
 
 from modern_di import exceptions, types
 from modern_di.providers.abstract import AbstractProvider
-from modern_di.resolver_compiler import compile_resolver
-from modern_di.wiring import WiringPlan
+from modern_di.providers.factory import Factory
+from modern_di.resolver_compiler import compile_in_scope_resolver, compile_resolver
+from modern_di.wiring import WiringPlan, lookup_types
 
 
 if typing.TYPE_CHECKING:
     from modern_di import Container
-    from modern_di.providers.factory import Factory
+    from modern_di.registries.cache_registry import SingletonSnapshot
+    from modern_di.resolver_compiler import _FusedProgram
     from modern_di.types_parser import SignatureItem
 
 
 class ProvidersRegistry:
-    __slots__ = ("_building", "_generation", "_lock", "_plans", "_providers", "_resolvers", "_validated")
+    __slots__ = (
+        "_building",
+        "_cache_slot_counts",
+        "_cache_slots",
+        "_checked",
+        "_context_slots",
+        "_dependents",
+        "_eager",
+        "_finalizer_levels",
+        "_frozen",
+        "_fused_programs",
+        "_generation",
+        "_in_scope_resolvers",
+        "_lock",
+        "_overridden",
+        "_pin_root",
+        "_plans",
+        "_production",
+        "_providers",
+        "_readers",
+        "_resolvers",
+        "_share_transients",
+        "_sharing",
+        "_snapshots",
+        "_unchecked",
+        "_unpin_hooks",
+        "_validated",
+    )
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
         self._providers: dict[type, AbstractProvider[typing.Any]] = {}
         self._plans: dict[int, WiringPlan] = {}
         self._resolvers: dict[int, typing.Callable[[Container], typing.Any]] = {}
+        self._in_scope_resolvers: dict[int, typing.Callable[[Container], typing.Any]] = {}
         self._building = threading.local()  # per-thread compile-in-flight set; the cycle guard is per-call-stack
         self._validated = False
+        self._production = False  # the production compile profile; only ever set on a validated graph
         self._generation = 0
+        self._frozen = False
+        # Filled by `freeze()`: each cached Factory's dense index into its scope's per-container slot
+        # list, and how long that list is per scope. Empty while the registry can still mutate.
+        self._cache_slots: dict[int, int] = {}
+        self._cache_slot_counts: dict[enum.IntEnum, int] = {}
+        # Set by `pin_singletons`: a weak reference, so the root stays freeable by refcount -- the
+        # registry is owned by the root, and a strong back-reference would make every root a cycle.
+        self._pin_root: weakref.ref[Container] | None = None
+        self._unpin_hooks: dict[int, list[typing.Callable[[], None]]] = {}
+        self._share_transients = False  # every transient Factory builds once per resolution
+        # Whether resolving each provider can build a shared transient, by provider_id: filled as
+        # resolvers compile, cleared with them, since a registration or an override can change it.
+        self._sharing: dict[int, bool] = {}
+        # Each hot or sharing transient's fused program (None: nothing fuses), by provider_id: built once
+        # for its full and its in-scope resolver, and dropped with them.
+        self._fused_programs: dict[int, _FusedProgram | None] = {}
+        # Each scope's cached providers in dependency levels, as provider_ids, with the generation they
+        # were grouped at: a concurrent close reuses them until a registration or override bumps it.
+        self._finalizer_levels: dict[enum.IntEnum, tuple[int, list[list[int]]]] = {}
+        # Eager cached providers by scope, in registration order: each container of that scope
+        # creates them on construction. Appended once per registration, so never invalidated.
+        self._eager: dict[enum.IntEnum, list[Factory[typing.Any]]] = {}
+        # The root's tree-wide overrides, by provider_id: the very dict its `OverridesRegistry` holds,
+        # compiled into the resolvers. The reverse-dependency index maps each provider_id to the
+        # providers whose plan names it, recorded as plans are built and dropped with them.
+        self._overridden: dict[int, typing.Any] = {}
+        # Each scope's context types in slot order, numbered as compiled resolvers first read them.
+        # Append-only and never invalidated: a number, once handed out, is read by live resolvers.
+        self._context_slots: dict[enum.IntEnum, list[type]] = {}
+        self._dependents: dict[int, set[int]] = {}
+        # The by-type lookups behind each plan, hits and misses alike: type -> provider_ids whose plan
+        # asked for it. A registration only adds types, so it can change only these plans.
+        self._readers: dict[type, set[int]] = {}
+        # Live `Container.snapshot_singletons` results, weakly, keyed by a weak reference to the container
+        # that took them: an override empties them all, a close only its own container's. A collected
+        # container's reference equals no other, so a new container reusing its id inherits nothing.
+        self._snapshots: dict[weakref.ref[Container], list[weakref.ref[SingletonSnapshot]]] = {}
+        # Every provider the last clean `validate()` walk covered, by provider_id, minus those a
+        # registration has changed since, which wait in `_unchecked` for the next walk. None until a
+        # walk comes back clean, and again after one finds errors: then the whole graph is walked.
+        self._checked: dict[int, AbstractProvider[typing.Any]] | None = None
+        self._unchecked: dict[int, AbstractProvider[typing.Any]] = {}
 
     def __len__(self) -> int:
         return len(self._providers)
@@ -35,10 +110,126 @@ class ProvidersRegistry:
         """Return whether the graph was validated with no registry mutation since."""
         return self._validated
 
-    def mark_validated(self) -> None:
-        """Mark the graph validated; any later mutation clears this."""
+    def mark_validated(self, walked: "typing.Iterable[AbstractProvider[typing.Any]] | None" = None) -> None:
+        """Mark the graph validated; any later mutation clears this.
+
+        `walked` are the providers a clean walk just covered: recorded, so that after the next
+        registration only what it changed needs walking (`changed_since_validation`).
+        """
+        if walked is not None:
+            checked = {} if self._checked is None else self._checked
+            for provider in walked:
+                checked[provider.provider_id] = provider
+            self._checked = checked
+            self._unchecked.clear()
         self._validated = True
 
+    def changed_since_validation(self) -> "list[AbstractProvider[typing.Any]] | None":
+        """Return the providers registered, or rewired, since the last clean walk; None if there is none.
+
+        Any error a registration can introduce is reachable from these: every other provider keeps
+        the edges, scope and lookups the clean walk checked.
+        """
+        if self._checked is None:
+            return None
+        return list(self._unchecked.values())
+
+    def forget_validation(self) -> None:
+        """Drop the clean-walk record after a walk found errors, so the next walk covers the whole graph."""
+        self._checked = None
+        self._unchecked.clear()
+
+    def is_production(self) -> bool:
+        """Return whether resolvers compile under the production profile; any mutation clears this."""
+        return self._production
+
+    def use_production_profile(self) -> None:
+        """Recompile under the production profile: same-scope dependencies get in-scope resolvers.
+
+        Licensed by validation alone, so it is only ever switched on for a validated graph, and the
+        mutation that clears the validated flag clears this with it. See architecture/performance.md.
+        """
+        with self._lock:
+            if self._production or not self._validated:
+                return
+            self._recompile()
+            self._production = True
+
+    def is_frozen(self) -> bool:
+        """Return whether `freeze` has run; a frozen registry rejects every further registration."""
+        return self._frozen
+
+    def freeze(self, providers: "typing.Iterable[AbstractProvider[typing.Any]]") -> None:
+        """Stop accepting registrations and give each cached Factory in `providers` a dense cache slot.
+
+        Slots are numbered per scope, so a container allocates a list only as long as its own scope's
+        cached providers. The memoized resolvers are dropped so the next compile binds the slots;
+        the validated flag survives, since freezing changes what is compiled, not the graph.
+        """
+        with self._lock:
+            if self._frozen:
+                return
+            for provider in providers:
+                if type(provider) is Factory and provider.cache_settings is not None:
+                    slot = self._cache_slot_counts.get(provider.scope, 0)
+                    self._cache_slots[provider.provider_id] = slot
+                    self._cache_slot_counts[provider.scope] = slot + 1
+            self._recompile()
+            self._frozen = True
+
+    def pin_singletons(self, root: "Container") -> None:
+        """Compile root-scope cached factories to close over the root's `CacheItem` from here on.
+
+        One registry belongs to exactly one root, so a root-scope singleton's item never moves; the
+        compiled resolver binds it and its warm hit reads it without navigating or looking it up.
+        """
+        with self._lock:
+            self._pin_root = weakref.ref(root)
+            self._recompile()
+
+    def share_transients(self) -> None:
+        """Compile every transient Factory to be built at most once per top-level resolution from here on.
+
+        A transient diamond below any resolved provider then yields one instance, where by
+        default each use gets its own. Changes what is compiled, not the graph, so validation survives.
+        """
+        with self._lock:
+            self._share_transients = True
+            self._recompile()
+
+    def add_unpin_hook(self, provider_id: int, hook: typing.Callable[[], None]) -> None:
+        """Register a pinned resolver's hook that drops its bound item until the next slow-path resolve.
+
+        Kept under `provider_id` and dropped with that provider's resolver, so recompiling does not
+        pile up hooks for resolvers no one can reach.
+        """
+        self._unpin_hooks.setdefault(provider_id, []).append(hook)
+
+    def unpin_singletons(self) -> None:
+        """Send every pinned resolver back through its scope target; called when the root closes.
+
+        A closed root must still warn and reopen on reuse, which only the slow path checks. Each
+        resolver re-binds its item on its next resolve, once the root is open again.
+        """
+        for hooks in list(self._unpin_hooks.values()):
+            for hook in hooks:
+                hook()
+
+    def finalizer_levels(self, scope: enum.IntEnum, group: typing.Callable[[], list[list[int]]]) -> list[list[int]]:
+        """Return `scope`'s cached providers grouped into dependency levels, calling `group` once per generation.
+
+        Published only if no mutation landed while `group` ran, as `resolver_for` publishes.
+        """
+        generation = self._generation
+        memo = self._finalizer_levels.get(scope)
+        if memo is not None and memo[0] == generation:
+            return memo[1]
+        levels = group()
+        with self._lock:
+            if self._generation == generation:
+                self._finalizer_levels[scope] = (generation, levels)
+        return levels
+
     def find_provider(self, dependency_type: type[types.T]) -> AbstractProvider[types.T] | None:
         return self._providers.get(dependency_type)
 
@@ -51,7 +242,8 @@ class ProvidersRegistry:
         """Return `provider`'s memoized wiring plan, building it on a miss.
 
         A plan is a pure function of the provider and this registry's contents, memoized per
-        `provider_id` and cleared whenever the registry mutates (`register` / `add_providers`).
+        `provider_id` and dropped when a registration adds a type it looks up (`register` /
+        `add_providers`; see `_invalidate`).
         Shared tree-wide: a container and every child share one registry, so a
         deeper-scope provider builds its plan once, not once per child. Build inputs are passed
         by value (not a closure) so the hot cache-hit path allocates nothing.
@@ -63,10 +255,87 @@ class ProvidersRegistry:
         generation = self._generation  # read before building; a mutation during it bumps this
         plan = WiringPlan.build(parsed_kwargs=parsed_kwargs, kwargs=kwargs, registry=self, owner=provider)
         with self._lock:
+            for dependency in plan.edges.values():
+                self._note_dependency(provider_id, dependency.provider_id)
+            for looked_up in lookup_types(parsed_kwargs, kwargs):
+                self._readers.setdefault(looked_up, set()).add(provider_id)
             if self._generation == generation:
                 self._plans[provider_id] = plan
         return plan
 
+    def context_slot(self, scope: enum.IntEnum, context_type: type) -> tuple[int, list[type]]:
+        """Return `context_type`'s slot number in `scope`, numbering it on first use, and the scope's slot list.
+
+        The list is the one `ContextRegistry.refill` lays `values` out by: append-only, so a
+        container's `values` stays valid for every slot numbered before its last refill.
+        """
+        with self._lock:
+            slot_types = self._context_slots.setdefault(scope, [])
+            if context_type not in slot_types:
+                slot_types.append(context_type)
+            return slot_types.index(context_type), slot_types
+
+    def track_snapshot(self, owner: "Container", snapshot: "SingletonSnapshot") -> None:
+        """Record `snapshot`, taken from `owner`, so `drop_snapshots` can invalidate it.
+
+        Forgets every snapshot collected since the last call, and every container left with none, so
+        a long-lived root taking snapshots over and over keeps only the live ones.
+        """
+        with self._lock:
+            for key, owned in list(self._snapshots.items()):
+                owned[:] = [ref for ref in owned if ref() is not None]
+                if not owned:
+                    del self._snapshots[key]
+            self._snapshots.setdefault(weakref.ref(owner), []).append(weakref.ref(snapshot))
+
+    def drop_snapshots(self, reason: str, owner: "Container | None" = None) -> None:
+        """Invalidate the live snapshots `owner` took, or every one when `owner` is None, and forget them."""
+        with self._lock:
+            if owner is None:
+                refs = [ref for owned in self._snapshots.values() for ref in owned]
+                self._snapshots.clear()
+            else:
+                refs = self._snapshots.pop(weakref.ref(owner), [])
+        for ref in refs:
+            snapshot = ref()
+            if snapshot is not None:
+                snapshot.invalidate(reason)
+
+    def _note_dependency(self, dependent_id: int, dependency_id: int) -> None:
+        """Record that `dependent_id`'s resolver is compiled against `dependency_id`'s; see `recompile_overridden`."""
+        self._dependents.setdefault(dependency_id, set()).add(dependent_id)
+
+    def recompile_overridden(self, provider_ids: typing.Iterable[int]) -> None:
+        """Drop the resolvers of `provider_ids` and of every provider compiled against them, and nothing else.
+
+        Called when a tree-wide override is set or reset: the next resolve of an overridden provider
+        compiles to its override, and each dependent recompiles around the new resolver. Plans and
+        every other resolver survive; the generation bump stops a compile already in flight from
+        publishing a resolver built before the change.
+        """
+        with self._lock:
+            self._drop_resolvers(provider_ids)
+
+    def _drop_resolvers(self, provider_ids: typing.Iterable[int]) -> None:
+        """Drop the resolvers of `provider_ids` and of every provider compiled against them; bump the generation.
+
+        Called under `self._lock`.
+        """
+        stale = set(provider_ids)
+        pending = list(stale)
+        while pending:
+            for dependent_id in self._dependents.get(pending.pop(), ()):
+                if dependent_id not in stale:
+                    stale.add(dependent_id)
+                    pending.append(dependent_id)
+        for provider_id in stale:
+            self._resolvers.pop(provider_id, None)
+            self._in_scope_resolvers.pop(provider_id, None)
+            self._unpin_hooks.pop(provider_id, None)
+            self._fused_programs.pop(provider_id, None)
+        self._sharing.clear()  # reachability runs the other way: any provider reaching `stale` may change
+        self._generation += 1
+
     def _building_set(self) -> set[int]:
         """Return the current thread's in-flight-compile set (the cycle guard).
 
@@ -82,7 +351,7 @@ class ProvidersRegistry:
     def resolver_for(self, provider: "AbstractProvider[typing.Any]") -> "typing.Callable[[Container], typing.Any]":
         """Return `provider`'s memoized compiled resolver, building it cycle-safely on a miss.
 
-        Memoized per `provider_id` and cleared on registry mutation, exactly like `plan_for`. A
+        Memoized per `provider_id` and dropped with its plan, or any plan it is compiled against. A
         back-edge to a provider whose resolver is still being built (a cycle) captures a thunk that
         routes through the runtime `resolve_provider`, so a genuine cycle still raises
         `RecursionError` -> `CircularDependencyError`.
@@ -108,13 +377,43 @@ class ProvidersRegistry:
                 self._resolvers[pid] = resolver
         return resolver
 
+    def in_scope_resolver_for(
+        self, provider: "AbstractProvider[typing.Any]"
+    ) -> "typing.Callable[[Container], typing.Any]":
+        """Return `provider`'s memoized in-scope resolver, or its full one where none applies.
+
+        The production profile's counterpart of `resolver_for`, memoized and cleared the same way.
+        """
+        pid = provider.provider_id
+        cached = self._in_scope_resolvers.get(pid)
+        if cached is not None:
+            return cached
+        building = self._building_set()
+        if pid in building:
+            return lambda c: c.resolve_provider(provider)  # back-edge, as in `resolver_for`
+        building.add(pid)
+        generation = self._generation
+        try:
+            resolver = compile_in_scope_resolver(provider, self)
+        finally:
+            building.discard(pid)
+        if resolver is None:
+            resolver = self.resolver_for(provider)
+        with self._lock:
+            if self._generation == generation:
+                self._in_scope_resolvers[pid] = resolver
+        return resolver
+
     def register(self, provider_type: type, provider: AbstractProvider[typing.Any]) -> None:
         with self._lock:
+            if self._frozen:
+                raise exceptions.RegistryFrozenError(provider_types=[provider_type])
             if provider_type in self._providers:
                 raise exceptions.DuplicateProviderTypeError(provider_type=provider_type)
             self._providers[provider_type] = provider
             provider._registered = True  # noqa: SLF001
-            self._invalidate()
+            self._note_eager(provider)
+            self._invalidate((provider_type,), (provider,))
 
     def add_providers(self, *args: AbstractProvider[typing.Any]) -> None:
         new_providers: dict[type, AbstractProvider[typing.Any]] = {}
@@ -126,6 +425,8 @@ class ProvidersRegistry:
             new_providers[provider.bound_type] = provider
 
         with self._lock:
+            if self._frozen:
+                raise exceptions.RegistryFrozenError(provider_types=list(new_providers))
             for provider_type in new_providers:
                 if provider_type in self._providers:
                     raise exceptions.DuplicateProviderTypeError(provider_type=provider_type)
@@ -135,16 +436,58 @@ class ProvidersRegistry:
             # resolver is still compiled and still captures its scope.
             for provider in args:
                 provider._registered = True  # noqa: SLF001
-            self._invalidate()
+                self._note_eager(provider)
+            self._invalidate(new_providers, args)
 
-    def _invalidate(self) -> None:
-        """Drop the memoized plans/resolvers and the validation flag — the registry changed.
+    def _note_eager(self, provider: AbstractProvider[typing.Any]) -> None:
+        """Record a newly registered `CacheSettings(eager=True)` provider under its scope. Called under `self._lock`."""
+        if isinstance(provider, Factory) and provider.cache_settings and provider.cache_settings.eager:
+            self._eager.setdefault(provider.scope, []).append(provider)
 
-        Called under `self._lock` by every mutation. Clearing has the same breadth the old version
-        bump did (a bump invalidated every memo anyway) and frees stale entries eagerly. Sound
-        because mutation is a single-threaded configure-phase operation (architecture/concurrency.md).
+    def _invalidate(
+        self, added_types: typing.Iterable[type], added: typing.Iterable[AbstractProvider[typing.Any]]
+    ) -> None:
+        """Drop what registering `added` under `added_types` can change, and the validation flag.
+
+        Called under `self._lock` by every registration. A registration only adds types (a duplicate
+        is refused), so the plans it can change are the ones that looked up an added type -- a miss
+        until now -- and `_readers` names them. Those plans go, and `added`'s own in case one was
+        compiled while unregistered; their resolvers go with every resolver compiled against them.
+        Every other plan and resolver stays warm. The production profile ends with any mutation, so
+        under it everything recompiles. Sound because mutation is a single-threaded configure-phase
+        operation (architecture/concurrency.md).
+        """
+        stale = {provider.provider_id for provider in added}
+        for added_type in added_types:
+            stale.update(self._readers.pop(added_type, ()))
+        if self._checked is not None:  # the next validate() walks from these
+            self._unchecked.update((provider.provider_id, provider) for provider in added)
+            for provider_id in stale:
+                provider = self._checked.pop(provider_id, None)
+                if provider is not None:
+                    self._unchecked[provider_id] = provider
+        if self._production:
+            self._recompile()
+        else:
+            for provider_id in stale:
+                self._plans.pop(provider_id, None)
+            self._drop_resolvers(stale)
+        self._validated = False
+        self._production = False
+
+    def _recompile(self) -> None:
+        """Drop the memoized plans/resolvers so the next resolve compiles afresh; the graph is unchanged.
+
+        Called under `self._lock`. Validation and the production profile survive: what changed is
+        how the graph compiles, not the graph.
         """
         self._plans.clear()
+        self._dependents.clear()  # recorded by the plans just dropped
+        # `_readers` stays: the graph is unchanged, so the rebuilt plans look up the very same types,
+        # and incremental validation needs to know which of them a later registration changes.
         self._resolvers.clear()
-        self._validated = False
+        self._in_scope_resolvers.clear()
+        self._sharing.clear()
+        self._fused_programs.clear()
+        self._unpin_hooks.clear()
         self._generation += 1
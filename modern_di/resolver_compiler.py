@@ -6,8 +6,13 @@ dependencies' resolvers by reference. Behavior-sensitive helpers (`_resolution_s
 `prepend_step`) are reused, not reimplemented. Context kwargs are folded at compile time --
 `ContextProvider.scope` and `.context_type` are fixed once registered, see
 architecture/providers.md -- so the whole context lookup is inline here and owns its behaviour.
+
+A root's tree-wide overrides are compiled in rather than guarded: an overridden provider compiles
+to `_compile_overridden`, and the registry recompiles its dependents on every override change. The
+front-guard fires only under a local override layer; see architecture/testing-and-overrides.md.
 """
 
+import contextvars
 import functools
 import typing
 
@@ -17,6 +22,7 @@ from modern_di.providers.alias import Alias
 from modern_di.providers.container_provider import container_provider
 from modern_di.providers.context_provider import ContextProvider
 from modern_di.providers.factory import Factory
+from modern_di.registries.cache_registry import CacheItem
 from modern_di.wiring import _Absent, absent_disposition
 
 
@@ -27,12 +33,37 @@ if typing.TYPE_CHECKING:
     from modern_di.wiring import WiringPlan
 
     _ProvResolvers: typing.TypeAlias = tuple[tuple[str, typing.Callable[[Container], typing.Any]], ...]
-    #: name, ContextProvider.provider_id, its scope, its context_type, absent disposition, item.
-    #: Folded at compile time; the identity of a registered ContextProvider does not change.
-    _CtxBindings: typing.TypeAlias = tuple[tuple[str, int, typing.Any, type, _Absent, SignatureItem], ...]
+    #: name, ContextProvider.provider_id, its scope, its context type's slot in that scope and the
+    #: scope's slot list, absent disposition, item. Folded at compile time; the identity of a
+    #: registered ContextProvider does not change.
+    _CtxBindings: typing.TypeAlias = tuple[tuple[str, int, typing.Any, int, list[type], _Absent, SignatureItem], ...]
+    _StepFactory: typing.TypeAlias = typing.Callable[[], exceptions.ResolutionStep]
+    #: A fused program step: the callable; how many values it pops (-1: a dependency's own resolver,
+    #: called with the target; -2/-3: store/load a shared node's value, the callable being its slot);
+    #: its fused ancestors' resolution steps, nearest first, and its own (None for a resolver step,
+    #: which wraps its own errors, and for a store or load).
+    _FusedStep: typing.TypeAlias = tuple[
+        typing.Callable[..., typing.Any], int, tuple[tuple[_StepFactory, ...], _StepFactory | None]
+    ]
+    #: The program and how many stack slots it reserves for shared nodes.
+    _FusedProgram: typing.TypeAlias = tuple[tuple[_FusedStep, ...], int]
 
 _SCOPE_ERRORS = (exceptions.ScopeNotInitializedError, exceptions.ScopeSkippedError)
 _STEP_ERRORS = (exceptions.ResolutionError, *_SCOPE_ERRORS)
+#: What an unpinned resolver reads until it re-binds: a CacheItem no one ever fills.
+_UNPINNED = CacheItem(settings=None)
+#: Most creator calls one fused resolver may hold. A transient diamond is expanded per use, so the
+#: program can grow exponentially in the graph's depth; past this, the per-node path is kept.
+_FUSE_MAX_STEPS = 64
+#: The current top-level resolve's shared transients, by provider_id. None outside a resolve that can
+#: share: the first resolver whose subgraph holds a shared node sets a fresh dict, and resets it on return.
+_SHARED: "contextvars.ContextVar[dict[int, typing.Any] | None]" = contextvars.ContextVar(
+    "modern_di_shared", default=None
+)
+
+
+class _FuseAbortedError(Exception):
+    """Raised while building a fused program that outgrew `_FUSE_MAX_STEPS`; never escapes the compiler."""
 
 
 def _can_call_positionally(f: "Factory[typing.Any]", plan: "WiringPlan") -> bool:
@@ -59,12 +90,15 @@ def compile_resolver(
     provider: "AbstractProvider[typing.Any]", registry: "ProvidersRegistry"
 ) -> "typing.Callable[[Container], typing.Any]":
     """Return `provider`'s compiled resolver. All provider types compile; no interpreted fallback ships."""
+    override = registry._overridden.get(provider.provider_id, types.UNSET)
+    if override is not types.UNSET:
+        return _compile_overridden(provider.provider_id, override)
     if type(provider) is Factory:
         if provider.cache_settings is None:
-            return _compile_transient_factory(provider, registry)
+            return _compile_fused_factory(provider, registry)  # the per-node resolver unless something fuses
         return _compile_cached_factory(provider, registry)
     if type(provider) is Alias:
-        return _compile_alias(provider)
+        return _compile_alias(provider, registry)
     if provider is container_provider:
         return _compile_container_provider()
     if type(provider) is ContextProvider:
@@ -73,18 +107,151 @@ def compile_resolver(
     raise TypeError(msg)  # every provider type is compiled; a new type must add a branch here
 
 
+def compile_in_scope_resolver(
+    provider: "AbstractProvider[typing.Any]", registry: "ProvidersRegistry"
+) -> "typing.Callable[[Container], typing.Any] | None":
+    """Return `provider`'s in-scope resolver, or None when only its full resolver applies.
+
+    Production profile only (see architecture/performance.md). An in-scope resolver is what a
+    dependent in the same scope calls: it is handed the target that dependent already navigated to
+    and opened, so it neither compares scopes nor checks `closed`. The override guard and every
+    error handler stay -- they are free until something raises, and keep the error text identical.
+    Covers transient factories called positionally and not fused, and cached factories that are
+    neither pinned nor slotted; everything else returns None before compiling anything.
+    """
+    if type(provider) is not Factory or provider.provider_id in registry._overridden:
+        return None
+    plan = registry.plan_for(provider, provider._parsed_kwargs, provider._kwargs)
+    if plan.unwireable:
+        return None
+    if provider.cache_settings is None:
+        if (
+            not _can_call_positionally(provider, plan)
+            or _reaches_shared(provider, registry)  # sharing runs only through the full resolver
+            or (provider.hot and _fused_program_for(provider, registry) is not None)  # and so does a hot program
+        ):
+            return None
+        return _compile_in_scope_transient(provider, plan, registry)
+    pin_root = registry._pin_root() if registry._pin_root is not None else None
+    if (pin_root is not None and provider.scope == pin_root.scope) or provider.provider_id in registry._cache_slots:
+        return None
+    return _compile_in_scope_cached(provider, plan, registry)
+
+
+def _context_bindings(
+    plan: "WiringPlan", registry: "ProvidersRegistry"
+) -> "tuple[dict[str, typing.Any], _CtxBindings, tuple[tuple[str, int], ...]]":
+    """Fold `plan`'s context kwargs: a tree-wide override's value joins the static kwargs.
+
+    Returns the static kwargs, the context bindings left to look up on each resolve, and the
+    ``(name, provider_id)`` of each folded one, which a local override layer still gets to replace.
+    """
+    static = plan.static_kwargs
+    ctx: list[tuple[str, int, typing.Any, int, list[type], _Absent, SignatureItem]] = []
+    folded: list[tuple[str, int]] = []
+    for name, (cp, item) in plan.context_kwargs.items():
+        override = registry._overridden.get(cp.provider_id, types.UNSET)
+        if override is types.UNSET:
+            slot, slot_types = registry.context_slot(cp.scope, cp.context_type)
+            ctx.append((name, cp.provider_id, cp.scope, slot, slot_types, absent_disposition(item), item))
+        else:
+            static = {**static, name: override}
+            folded.append((name, cp.provider_id))
+    return static, tuple(ctx), tuple(folded)
+
+
+def _dependency_resolver(
+    dependency: "AbstractProvider[typing.Any]", scope: typing.Any, registry: "ProvidersRegistry"
+) -> "typing.Callable[[Container], typing.Any]":
+    """Return the resolver a dependent in `scope` calls for `dependency`.
+
+    Under the production profile a same-scope Factory gets its in-scope resolver: the dependent
+    calls it with the target it already navigated to and opened. Anything else gets the full one.
+    """
+    if registry._production and type(dependency) is Factory and dependency.scope == scope:
+        return registry.in_scope_resolver_for(dependency)
+    return registry.resolver_for(dependency)
+
+
+def _shares(node: "AbstractProvider[typing.Any]", registry: "ProvidersRegistry") -> bool:
+    """Whether `node` is a transient Factory built at most once per top-level resolve."""
+    return type(node) is Factory and node.cache_settings is None and (registry._share_transients or node.shared)
+
+
+def _reaches_shared(provider: "AbstractProvider[typing.Any]", registry: "ProvidersRegistry") -> bool:
+    """Whether resolving `provider` can build a shared transient, `provider` itself included.
+
+    Depth-first over the plans' provider edges and alias sources, stopping at an override's compiled
+    value. A search that finds none records every provider it crossed in `registry._sharing`, so
+    when nothing shares, each provider is searched once until the next mutation clears the record.
+    """
+    memo = registry._sharing
+    crossed: set[int] = set()
+    pending = [provider]
+    while pending:
+        node = pending.pop()
+        pid = node.provider_id
+        if pid in crossed or pid in registry._overridden or memo.get(pid) is False:
+            continue
+        if memo.get(pid) or _shares(node, registry):
+            memo[provider.provider_id] = True
+            return True
+        crossed.add(pid)
+        if type(node) is Factory:
+            pending.extend(registry.plan_for(node, node._parsed_kwargs, node._kwargs).provider_kwargs.values())
+        elif type(node) is Alias and (source := registry._providers.get(node._source_type)) is not None:
+            pending.append(source)
+    for pid in crossed:
+        memo[pid] = False
+    return False
+
+
+def _open_sharing(resolve: "typing.Callable[[Container], types.T]") -> "typing.Callable[[Container], types.T]":
+    """Wrap `resolve`, whose subgraph holds a shared node, to run inside a per-resolution memo.
+
+    Opens a fresh memo when none is open -- the resolve started here -- and otherwise joins the
+    caller's, so a shared node reached along two paths is built once either way.
+    """
+
+    def resolve_sharing(container: "Container") -> types.T:
+        if _SHARED.get() is not None:
+            return resolve(container)
+        token = _SHARED.set({})
+        try:
+            return resolve(container)
+        finally:
+            _SHARED.reset(token)
+
+    return resolve_sharing
+
+
+def _memoize_shared(
+    pid: int, resolve: "typing.Callable[[Container], typing.Any]"
+) -> "typing.Callable[[Container], typing.Any]":
+    """Wrap a shared transient's `resolve` to build it once per open memo; outside one it is an ordinary transient."""
+
+    def resolve_shared(container: "Container") -> typing.Any:
+        memo = _SHARED.get()
+        if memo is None:
+            return resolve(container)
+        value = memo.get(pid, types.UNSET)
+        if value is types.UNSET:
+            value = memo[pid] = resolve(container)
+        return value
+
+    return resolve_shared
+
+
 def _compile_transient_factory(  # noqa: C901, PLR0915 (two hot-path closures: positional + kwargs, each flat to hold the per-node frame at 1)
     f: "Factory[typing.Any]", registry: "ProvidersRegistry"
 ) -> "typing.Callable[[Container], typing.Any]":
     plan = registry.plan_for(f, f._parsed_kwargs, f._kwargs)
     if plan.unwireable:
         return _compile_unwireable_factory(f, plan)
-    prov: _ProvResolvers = tuple((name, registry.resolver_for(p)) for name, p in plan.provider_kwargs.items())
-    static = plan.static_kwargs
-    ctx: _CtxBindings = tuple(
-        (name, cp.provider_id, cp.scope, cp.context_type, absent_disposition(item), item)
-        for name, (cp, item) in plan.context_kwargs.items()
+    prov: _ProvResolvers = tuple(
+        (name, _dependency_resolver(p, f.scope, registry)) for name, p in plan.provider_kwargs.items()
     )
+    static, ctx, folded = _context_bindings(plan, registry)
     pure = plan.pure_provider
     scope = f.scope
     pid = f.provider_id
@@ -199,9 +366,14 @@ def _compile_transient_factory(  # noqa: C901, PLR0915 (two hot-path closures: p
             kwargs = {name: r(target) for name, r in prov}
             if not pure:
                 kwargs.update(static)
+                if overrides.has_overrides:
+                    for name, cpid in folded:  # a local override beats the tree-wide one folded into `static`
+                        override = overrides.fetch_override(cpid)
+                        if override is not types.UNSET:
+                            kwargs[name] = override
                 # `find_container`, never `_navigate`: that helper prepends a resolution step and
                 # the `except` below prepends this factory's own, rendering the caller twice.
-                for name, cpid, cscope, ctype, disp, item in ctx:
+                for name, cpid, cscope, slot, slot_types, disp, item in ctx:
                     if overrides.has_overrides:
                         override = overrides.fetch_override(cpid)
                         if override is not types.UNSET:
@@ -210,7 +382,10 @@ def _compile_transient_factory(  # noqa: C901, PLR0915 (two hot-path closures: p
                     holder = target if target.scope == cscope else target.find_container(cscope)
                     if holder.closed:
                         holder._prepare()
-                    value = holder.context_registry.find_context(ctype)
+                    try:  # a list index, not a lookup by type; a miss refills the holder's slots once
+                        value = holder.context_registry.values[slot]
+                    except IndexError:
+                        value = holder.context_registry.refill(slot_types)[slot]
                     if value is not types.UNSET:
                         kwargs[name] = value
                     elif disp is _Absent.NULL:
@@ -233,22 +408,448 @@ def _compile_transient_factory(  # noqa: C901, PLR0915 (two hot-path closures: p
     return resolve
 
 
-def _compile_cached_factory(  # noqa: C901, PLR0915 (cold-miss builder pair: positional + kwargs, plus the warm-hit resolve closure)
+def _fuse_program(  # noqa: C901 (the fusability check and the post-order emit share one program)
+    f: "Factory[typing.Any]", registry: "ProvidersRegistry"
+) -> "_FusedProgram | None":
+    """Flatten `f`'s same-scope transient subgraph into a post-order program, or None if nothing fuses.
+
+    A node fuses when it is a transient Factory of `f`'s scope called positionally. Post-order means
+    a step's arguments are always the last values the program produced, so it runs as a stack. A
+    transient diamond is expanded once per use, exactly as the per-node path creates it once per use
+    -- unless the node shares per resolution: then its first use is stored in a reserved slot at the
+    bottom of the stack, and every later use loads it. Without sharing, only a hot `f` is fused.
+
+    A slot is private to one run, so nothing fuses when an unfused dependency's own resolver can
+    reach a shared node too: that subgraph shares through the per-resolution memo instead.
+    """
+    scope = f.scope
+    program: list[_FusedStep] = []
+    uses: dict[int, int] = {}
+    steps = 0  # the running total of `uses`
+    slots: dict[int, int] = {}
+
+    def fusable(node: "AbstractProvider[typing.Any]", path: tuple[int, ...]) -> "WiringPlan | None":
+        if type(node) is not Factory or node.cache_settings is not None or node.scope != scope:
+            return None
+        if node.provider_id in registry._overridden:
+            return None  # its own resolver returns the override
+        if node.provider_id in path:
+            return None  # a cycle: the per-node path reports it
+        plan = registry.plan_for(node, node._parsed_kwargs, node._kwargs)
+        if plan.unwireable or not _can_call_positionally(node, plan):
+            return None
+        return plan
+
+    def count(node: "Factory[typing.Any]", plan: "WiringPlan", path: tuple[int, ...]) -> None:
+        nonlocal steps
+        steps += 1
+        if steps > _FUSE_MAX_STEPS:
+            raise _FuseAbortedError  # checked before descending, so an oversized graph is never walked
+        pid = node.provider_id
+        uses[pid] = uses.get(pid, 0) + 1
+        if uses[pid] > 1 and _shares(node, registry):
+            return  # a shared node's subgraph is built once, so it is counted once
+        path = (*path, pid)
+        for dependency in plan.provider_kwargs.values():
+            dependency_plan = fusable(dependency, path)
+            if dependency_plan is not None:
+                count(typing.cast("Factory[typing.Any]", dependency), dependency_plan, path)
+            elif _reaches_shared(dependency, registry):
+                raise _FuseAbortedError
+
+    def emit(
+        node: "Factory[typing.Any]", plan: "WiringPlan", path: tuple[int, ...], parents: "tuple[_StepFactory, ...]"
+    ) -> None:
+        pid = node.provider_id
+        if pid in slots:
+            program.append((slots[pid], -3, (parents, None)))
+            return
+        path = (*path, pid)
+        own = (node._resolution_step, *parents)
+        for dependency in plan.provider_kwargs.values():
+            dependency_plan = fusable(dependency, path)
+            if dependency_plan is None:
+                program.append((_dependency_resolver(dependency, scope, registry), -1, (own, None)))
+            else:
+                emit(typing.cast("Factory[typing.Any]", dependency), dependency_plan, path, own)
+        program.append((node._creator, len(plan.provider_kwargs), (parents, node._resolution_step)))
+        if uses[pid] > 1 and _shares(node, registry):
+            slots[pid] = len(slots)
+            program.append((slots[pid], -2, (parents, None)))
+
+    root_plan = fusable(f, ())
+    if root_plan is None:
+        return None
+    try:
+        count(f, root_plan, ())  # bounds the expansion before emitting anything
+    except _FuseAbortedError:
+        return None
+    emit(f, root_plan, (), ())
+    if len(program) > _FUSE_MAX_STEPS:
+        return None
+    if not slots and (not f.hot or all(argc < 0 for _fn, argc, _info in program[:-1])):
+        return None  # nothing shared, and nothing fused that the per-node path does not already do
+    return tuple(program), len(slots)
+
+
+def _fused_program_for(f: "Factory[typing.Any]", registry: "ProvidersRegistry") -> "_FusedProgram | None":
+    """Return `_fuse_program(f)`, built once for the full and the in-scope resolver alike.
+
+    Memoized in `registry._fused_programs` and dropped with `f`'s resolvers; published only if no
+    mutation landed while it was built, as `resolver_for` publishes.
+    """
+    pid = f.provider_id
+    memo = registry._fused_programs
+    if pid in memo:
+        return memo[pid]
+    generation = registry._generation
+    fused = _fuse_program(f, registry)
+    with registry._lock:
+        if registry._generation == generation:
+            memo[pid] = fused
+    return fused
+
+
+def _compile_fused_factory(
+    f: "Factory[typing.Any]", registry: "ProvidersRegistry"
+) -> "typing.Callable[[Container], typing.Any]":
+    """Compile a transient Factory's subgraph into one resolver that calls the creators in order.
+
+    The nodes inside the program cost no resolver frame. A dependency that cannot be fused --
+    cached, cross-scope, kwargs-called -- is one step calling its own resolver. Errors carry the
+    same breadcrumb the per-node path would build, one ancestor at a time.
+
+    Sharing runs through the per-resolution memo (`_SHARED`): a shared `f` is memoized in it, and
+    an `f` whose subgraph holds a shared node opens one. A program's private slots stand in for the
+    memo only when the resolve starts at `f` with no override active; otherwise the per-node
+    resolver runs inside the memo, and every shared node on it joins the one instance.
+    """
+    per_node = _compile_transient_factory(f, registry)
+    plan = registry.plan_for(f, f._parsed_kwargs, f._kwargs)
+    sharing = any(_reaches_shared(dependency, registry) for dependency in plan.provider_kwargs.values())
+    if sharing:
+        per_node = _open_sharing(per_node)
+    shared = _shares(f, registry)
+    if shared:
+        per_node = _memoize_shared(f.provider_id, per_node)
+    if not f.hot and not shared and not sharing:
+        return per_node  # nothing to fuse: skip the walk, the common cold compile
+    fused = _fused_program_for(f, registry)
+    if fused is None:
+        return per_node
+    # The program itself runs only where no memo is open, so a shared `f` needs no wrapper of its own.
+    return _compile_fused_program(f, fused, per_node, checks_memo=sharing or shared)
+
+
+def _compile_fused_program(  # noqa: C901 (one flat loop over the program, every arity inline)
+    f: "Factory[typing.Any]",
+    fused: "_FusedProgram",
+    per_node: "typing.Callable[[Container], typing.Any]",
+    *,
+    checks_memo: bool,
+) -> "typing.Callable[[Container], typing.Any]":
+    steps, reserved = fused
+    scope = f.scope
+    resolution_step = f._resolution_step
+
+    def resolve_fused(container: "Container") -> typing.Any:  # noqa: C901, PLR0912
+        overrides = container.overrides_registry
+        if overrides.has_overrides or (checks_memo and _SHARED.get() is not None):
+            return per_node(container)  # an override to check at each node, or a memo to share through
+        target = container if container.scope == scope else _navigate(container, scope, resolution_step)
+        if target.closed:
+            target._prepare()
+        # `top` is the top of the value stack, kept out of the list so a chain never touches it. The
+        # first `reserved` entries are the shared nodes' slots, below anything the program pops.
+        stack: list[typing.Any] = [None] * reserved
+        top = None
+        try:
+            for fn, argc, info in steps:  # noqa: B007 - the handlers read `info` of the step that raised
+                if argc == 1:
+                    top = fn(top)
+                elif argc == 0:
+                    stack.append(top)
+                    top = fn()
+                elif argc < 0:
+                    if argc == -1:
+                        stack.append(top)
+                        top = fn(target)
+                    elif argc == -2:  # noqa: PLR2004
+                        stack[fn] = top  # store a shared node's value
+                    else:
+                        stack.append(top)
+                        top = stack[fn]  # load it at a later use
+                else:
+                    cut = len(stack) - argc + 1
+                    args = stack[cut:]
+                    del stack[cut:]
+                    args.append(top)
+                    top = fn(*args)
+        except _STEP_ERRORS as exc:
+            for step in info[0]:
+                exc.prepend_step(step())
+            raise
+        except TypeError as exc:
+            ancestors, owner = info
+            if owner is None:
+                raise  # a resolver step's own TypeError passes through, as on the per-node path
+            error = exceptions.CreatorCallError.from_type_error(creator=fn, exc=exc, resolution_step=owner)
+            if error is None:
+                raise
+            for step in ancestors:
+                error.prepend_step(step())
+            raise error from exc
+        return top
+
+    return resolve_fused
+
+
+def _compile_cached_factory(  # noqa: C901, PLR0915 (pinned, slotted and plain warm-hit closures, each flat)
     f: "Factory[typing.Any]", registry: "ProvidersRegistry"
 ) -> "typing.Callable[[Container], typing.Any]":
     plan = registry.plan_for(f, f._parsed_kwargs, f._kwargs)
     if plan.unwireable:
         return _compile_unwireable_factory(f, plan)
-    prov: _ProvResolvers = tuple((name, registry.resolver_for(p)) for name, p in plan.provider_kwargs.items())
-    static = plan.static_kwargs
-    ctx: _CtxBindings = tuple(
-        (name, cp.provider_id, cp.scope, cp.context_type, absent_disposition(item), item)
-        for name, (cp, item) in plan.context_kwargs.items()
-    )
-    pure = plan.pure_provider
     scope = f.scope
     pid = f.provider_id
     resolution_step = f._resolution_step
+    build_cold, create_cold = _compile_cold_builders(f, plan, registry)
+
+    pin_root = registry._pin_root() if registry._pin_root is not None else None
+    if pin_root is not None and scope == pin_root.scope:
+        # Pinned (opt-in): one registry belongs to one root, so a root-scope singleton's CacheItem
+        # is fixed and the warm hit is one cell read -- no navigation, no `_items` lookup. Only the
+        # item is captured, never the root: the registry reaches its root through a weakref.
+        item = pin_root.cache_registry.fetch_cache_item(f)
+
+        def unpin() -> None:
+            nonlocal item
+            item = _UNPINNED
+
+        registry.add_unpin_hook(pid, unpin)
+
+        def resolve_pinned(container: "Container") -> typing.Any:
+            nonlocal item
+            overrides = container.overrides_registry
+            if overrides.has_overrides:
+                override = overrides.fetch_override(pid)
+                if override is not types.UNSET:
+                    return override
+            cached = item.cache
+            if cached is not types.UNSET:
+                return cached
+            # Not created yet, or unpinned by a root close: the full path, which warns and reopens.
+            target = container if container.scope == scope else _navigate(container, scope, resolution_step)
+            if target.closed:
+                target._prepare()
+            cache_registry = target.cache_registry
+            cache_item = item = cache_registry.fetch_cache_item(f)  # re-bind; the cold path pays the method
+            cached = cache_item.cache
+            if cached is not types.UNSET:
+                return cached
+            value, created = cache_item.get_or_create(
+                target._lock,
+                resolve=functools.partial(build_cold, target),  # never a lambda -- see `resolve` below
+                create=create_cold,
+            )
+            if created:
+                cache_registry.mark_created(cache_item)
+            return value
+
+        return resolve_pinned
+
+    slot = registry._cache_slots.get(pid)
+    if slot is not None:
+        # Frozen registry: the warm hit indexes this container's dense slot list instead of `_items`.
+        # The list mirrors `_items` -- `fetch_cache_item` still settles which CacheItem is shared.
+        def resolve_slotted(container: "Container") -> typing.Any:
+            overrides = container.overrides_registry
+            if overrides.has_overrides:
+                override = overrides.fetch_override(pid)
+                if override is not types.UNSET:
+                    return override
+            target = container if container.scope == scope else _navigate(container, scope, resolution_step)
+            if target.closed:
+                target._prepare()
+            cache_registry = target.cache_registry
+            try:
+                cache_item = cache_registry._slots[slot]
+            except IndexError:  # built before `freeze()` sized this scope's slots
+                cache_item = None
+            if cache_item is None:
+                cache_item = cache_registry.fetch_cache_item(f)
+                cache_registry.mirror_slot(slot, cache_item)
+            cached = cache_item.cache
+            if cached is not types.UNSET:
+                return cached
+            value, created = cache_item.get_or_create(
+                target._lock,
+                resolve=functools.partial(build_cold, target),  # never a lambda -- see `resolve` below
+                create=create_cold,
+            )
+            if created:
+                cache_registry.mark_created(cache_item)
+            return value
+
+        return resolve_slotted
+
+    def resolve(container: "Container") -> typing.Any:
+        overrides = container.overrides_registry
+        if overrides.has_overrides:
+            override = overrides.fetch_override(pid)
+            if override is not types.UNSET:
+                return override
+        target = container if container.scope == scope else _navigate(container, scope, resolution_step)
+        if target.closed:
+            target._prepare()
+        # Inlined memo hit; the method is called only on a miss, where its `setdefault` makes
+        # concurrent first-resolvers share one CacheItem. See architecture/performance.md.
+        cache_registry = target.cache_registry
+        cache_item = cache_registry._items.get(pid)
+        if cache_item is None:
+            cache_item = cache_registry.fetch_cache_item(f)
+        cached = cache_item.cache
+        if cached is not types.UNSET:
+            return cached
+        value, created = cache_item.get_or_create(
+            target._lock,
+            # `partial`, never a lambda closing over `target`: a closure promotes `target` to a cell,
+            # so MAKE_CELL runs in this resolver's prologue on every warm hit too. See
+            # architecture/performance.md.
+            resolve=functools.partial(build_cold, target),
+            create=create_cold,
+        )
+        if created:
+            target.cache_registry.mark_created(cache_item)
+        return value
+
+    return resolve
+
+
+def _compile_in_scope_transient(  # noqa: C901, PLR0915 (the arity ladder, each rung flat to hold the per-node frame at 1)
+    f: "Factory[typing.Any]", plan: "WiringPlan", registry: "ProvidersRegistry"
+) -> "typing.Callable[[Container], typing.Any]":
+    """Compile `_compile_transient_factory`'s positional closures without the navigation and `closed` check."""
+    pos = tuple(_dependency_resolver(p, f.scope, registry) for p in plan.provider_kwargs.values())
+    pid = f.provider_id
+    resolution_step = f._resolution_step
+    creator = f._creator
+
+    if len(pos) == 0:
+
+        def resolve_in_scope_arity0(target: "Container") -> typing.Any:
+            overrides = target.overrides_registry
+            if overrides.has_overrides:
+                override = overrides.fetch_override(pid)
+                if override is not types.UNSET:
+                    return override
+            try:
+                return creator()
+            except TypeError as exc:
+                error = exceptions.CreatorCallError.from_type_error(
+                    creator=creator, exc=exc, resolution_step=resolution_step
+                )
+                if error is None:
+                    raise
+                raise error from exc
+
+        return resolve_in_scope_arity0
+
+    if len(pos) == 1:
+        (r0,) = pos
+
+        def resolve_in_scope_arity1(target: "Container") -> typing.Any:
+            overrides = target.overrides_registry
+            if overrides.has_overrides:
+                override = overrides.fetch_override(pid)
+                if override is not types.UNSET:
+                    return override
+            try:
+                a0 = r0(target)
+            except _STEP_ERRORS as exc:
+                exc.prepend_step(resolution_step())
+                raise
+            try:
+                return creator(a0)
+            except TypeError as exc:
+                error = exceptions.CreatorCallError.from_type_error(
+                    creator=creator, exc=exc, resolution_step=resolution_step
+                )
+                if error is None:
+                    raise
+                raise error from exc
+
+        return resolve_in_scope_arity1
+
+    def resolve_in_scope_positional(target: "Container") -> typing.Any:
+        overrides = target.overrides_registry
+        if overrides.has_overrides:
+            override = overrides.fetch_override(pid)
+            if override is not types.UNSET:
+                return override
+        try:
+            args = [r(target) for r in pos]
+        except _STEP_ERRORS as exc:
+            exc.prepend_step(resolution_step())
+            raise
+        try:
+            return creator(*args)
+        except TypeError as exc:
+            error = exceptions.CreatorCallError.from_type_error(
+                creator=creator, exc=exc, resolution_step=resolution_step
+            )
+            if error is None:
+                raise
+            raise error from exc
+
+    return resolve_in_scope_positional
+
+
+def _compile_in_scope_cached(
+    f: "Factory[typing.Any]", plan: "WiringPlan", registry: "ProvidersRegistry"
+) -> "typing.Callable[[Container], typing.Any]":
+    """Compile `_compile_cached_factory`'s plain closure without the navigation and `closed` check."""
+    pid = f.provider_id
+    build_cold, create_cold = _compile_cold_builders(f, plan, registry)
+
+    def resolve_in_scope(target: "Container") -> typing.Any:
+        overrides = target.overrides_registry
+        if overrides.has_overrides:
+            override = overrides.fetch_override(pid)
+            if override is not types.UNSET:
+                return override
+        cache_registry = target.cache_registry
+        cache_item = cache_registry._items.get(pid)
+        if cache_item is None:
+            cache_item = cache_registry.fetch_cache_item(f)
+        cached = cache_item.cache
+        if cached is not types.UNSET:
+            return cached
+        value, created = cache_item.get_or_create(
+            target._lock,
+            resolve=functools.partial(build_cold, target),  # never a lambda -- see `_compile_cached_factory`
+            create=create_cold,
+        )
+        if created:
+            cache_registry.mark_created(cache_item)
+        return value
+
+    return resolve_in_scope
+
+
+def _compile_cold_builders(  # noqa: C901, PLR0915 (positional + kwargs builders, each flat to hold the per-node frame at 1)
+    f: "Factory[typing.Any]", plan: "WiringPlan", registry: "ProvidersRegistry"
+) -> "tuple[typing.Callable[[Container], typing.Any], typing.Callable[[typing.Any], typing.Any]]":
+    """Compile a cached Factory's cold-miss builder and creator call, positional or kwargs.
+
+    Shared by its full resolver and its in-scope one: the two differ only on the warm path.
+    """
+    prov: _ProvResolvers = tuple(
+        (name, _dependency_resolver(p, f.scope, registry)) for name, p in plan.provider_kwargs.items()
+    )
+    static, ctx, folded = _context_bindings(plan, registry)
+    pure = plan.pure_provider
+    resolution_step = f._resolution_step
     build_arg_error = f._argument_resolution_error
     creator = f._creator  # cold-miss only (not hot)
     call_creator = f._call_creator  # cold-miss only; reused (not hot)
@@ -279,14 +880,19 @@ def _compile_cached_factory(  # noqa: C901, PLR0915 (cold-miss builder pair: pos
         create_cold = create_positional
     else:
 
-        def build_kwargs(target: "Container") -> dict[str, typing.Any]:
+        def build_kwargs(target: "Container") -> dict[str, typing.Any]:  # noqa: C901, PLR0912
             try:
                 kwargs = {name: r(target) for name, r in prov}
                 if not pure:
                     kwargs.update(static)
                     overrides = target.overrides_registry
+                    if overrides.has_overrides:
+                        for name, cpid in folded:  # as in the transient copy above
+                            override = overrides.fetch_override(cpid)
+                            if override is not types.UNSET:
+                                kwargs[name] = override
                     # `find_container`, never `_navigate` -- see the transient copy above.
-                    for name, cpid, cscope, ctype, disp, item in ctx:
+                    for name, cpid, cscope, slot, slot_types, disp, item in ctx:
                         if overrides.has_overrides:
                             override = overrides.fetch_override(cpid)
                             if override is not types.UNSET:
@@ -295,7 +901,10 @@ def _compile_cached_factory(  # noqa: C901, PLR0915 (cold-miss builder pair: pos
                         holder = target if target.scope == cscope else target.find_container(cscope)
                         if holder.closed:
                             holder._prepare()
-                        value = holder.context_registry.find_context(ctype)
+                        try:  # as in the transient copy above
+                            value = holder.context_registry.values[slot]
+                        except IndexError:
+                            value = holder.context_registry.refill(slot_types)[slot]
                         if value is not types.UNSET:
                             kwargs[name] = value
                         elif disp is _Absent.NULL:
@@ -310,38 +919,11 @@ def _compile_cached_factory(  # noqa: C901, PLR0915 (cold-miss builder pair: pos
         build_cold = build_kwargs
         create_cold = call_creator
 
-    def resolve(container: "Container") -> typing.Any:
-        overrides = container.overrides_registry
-        if overrides.has_overrides:
-            override = overrides.fetch_override(pid)
-            if override is not types.UNSET:
-                return override
-        target = container if container.scope == scope else _navigate(container, scope, resolution_step)
-        if target.closed:
-            target._prepare()
-        # Inlined memo hit; the method is called only on a miss, where its `setdefault` makes
-        # concurrent first-resolvers share one CacheItem. See architecture/performance.md.
-        cache_registry = target.cache_registry
-        cache_item = cache_registry._items.get(pid)
-        if cache_item is None:
-            cache_item = cache_registry.fetch_cache_item(f)
-        cached = cache_item.cache
-        if cached is not types.UNSET:
-            return cached
-        value, created = cache_item.get_or_create(
-            target._lock,
-            # `partial`, never a lambda closing over `target`: a closure promotes `target` to a cell,
-            # so MAKE_CELL runs in this resolver's prologue on every warm hit too. See
-            # architecture/performance.md.
-            resolve=functools.partial(build_cold, target),
-            # positional/kwargs builders have distinct arg types; get_or_create feeds each its own.
-            create=typing.cast("typing.Callable[[typing.Any], typing.Any]", create_cold),
-        )
-        if created:
-            target.cache_registry.mark_created(cache_item)
-        return value
+    if any(_reaches_shared(p, registry) for p in plan.provider_kwargs.values()):
+        build_cold = _open_sharing(build_cold)  # the cold miss is a resolution of its own subgraph
 
-    return resolve
+    # positional/kwargs builders have distinct arg types; get_or_create feeds each its own.
+    return build_cold, typing.cast("typing.Callable[[typing.Any], typing.Any]", create_cold)
 
 
 def _compile_unwireable_factory(
@@ -376,18 +958,41 @@ def _compile_unwireable_factory(
     return resolve
 
 
-def _compile_alias(a: "Alias[typing.Any]") -> "typing.Callable[[Container], typing.Any]":
+def _compile_alias(  # noqa: C901 (two hot-path closures: bound on a frozen registry, looked up otherwise)
+    a: "Alias[typing.Any]", registry: "ProvidersRegistry"
+) -> "typing.Callable[[Container], typing.Any]":
     """Call the source's compiled resolver directly, wrapping scope/resolution errors with its own step.
 
     The source lookup and its resolver memo read are inlined, and nothing is cached: a source
     registered later is picked up on the next resolve. A single try/except covers the
     dangling-source lookup and the forwarded resolve, so both carry this alias's resolution step.
+    A frozen registry can never register that source later, so there the source's resolver is bound
+    at compile time instead (see planning/decisions/2026-08-03-alias-binds-nothing.md).
     """
     pid = a.provider_id
     source_type = a._source_type
     resolution_step = a._resolution_step
     find_source = a._find_source
 
+    bound_source = registry._providers.get(source_type) if registry._frozen else None
+    if bound_source is not None:
+        registry._note_dependency(pid, bound_source.provider_id)
+        source_resolver = registry.resolver_for(bound_source)
+
+        def resolve_bound(container: "Container") -> typing.Any:
+            overrides = container.overrides_registry
+            if overrides.has_overrides:
+                override = overrides.fetch_override(pid)
+                if override is not types.UNSET:
+                    return override
+            try:
+                return source_resolver(container)
+            except _STEP_ERRORS as exc:
+                exc.prepend_step(resolution_step())
+                raise
+
+        return resolve_bound
+
     def resolve(container: "Container") -> typing.Any:
         overrides = container.overrides_registry
         if overrides.has_overrides:
@@ -410,6 +1015,23 @@ def _compile_alias(a: "Alias[typing.Any]") -> "typing.Callable[[Container], typi
     return resolve
 
 
+def _compile_overridden(pid: int, value: object) -> "typing.Callable[[Container], typing.Any]":
+    """Return a tree-wide override's value, compiled in; a local override layer over it still wins.
+
+    No navigation, as on the guarded path: an override resolves from whichever container asks.
+    """
+
+    def resolve_overridden(container: "Container") -> typing.Any:
+        overrides = container.overrides_registry
+        if overrides.has_overrides:
+            override = overrides.fetch_override(pid)
+            if override is not types.UNSET:
+                return override
+        return value
+
+    return resolve_overridden
+
+
 def _compile_container_provider() -> "typing.Callable[[Container], typing.Any]":
     """Resolve to the resolving container itself — no scope navigation."""
     pid = container_provider.provider_id
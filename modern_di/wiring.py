@@ -61,6 +61,23 @@ def find_dep_provider(
     return None
 
 
+def lookup_types(parsed_kwargs: dict[str, SignatureItem], kwargs: dict[str, typing.Any] | None) -> set[type]:
+    """Return every type ``find_dep_provider`` may look up while wiring *parsed_kwargs* by type.
+
+    Misses included, and every union member rather than only those before the first hit: a type
+    registered later can change the plan only if it is one of these.
+    """
+    types: set[type] = set()
+    for name, item in parsed_kwargs.items():
+        if kwargs and name in kwargs:
+            continue
+        if item.arg_type is not None:
+            types.add(item.arg_type)
+        else:
+            types.update(item.args)
+    return types
+
+
 @dataclasses.dataclass(frozen=True, slots=True)
 class WiringPlan:
     """Immutable result of partitioning a creator's parameters.
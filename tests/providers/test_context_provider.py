@@ -553,31 +553,47 @@ class _CachedRequired:
     ctx: _CachedCtx
 
 
-def test_cached_factory_context_kwarg_uses_override() -> None:
-    class G(Group):
-        ctx = providers.ContextProvider(_CachedCtx, scope=Scope.APP)
-        svc = providers.Factory(creator=_CachedNullable, scope=Scope.APP, cache=True)
+# A tree-wide override of a ContextProvider is folded into the dependent's static kwargs at compile
+# time; a local override layer is looked up on each resolve, and beats a folded tree-wide one.
+_CONTEXT_OVERRIDES = pytest.mark.parametrize(("tree_wide", "local"), [(True, False), (False, True), (True, True)])
 
-    container = Container(scope=Scope.APP, groups=[G])
-    container.open()
+
+def _override_context(
+    request: Container, ctx: "providers.ContextProvider[_CachedCtx]", *, tree_wide: bool, local: bool
+) -> _CachedCtx:
+    """Override `ctx` from `request` tree-wide, locally, or both; return the value a resolve must see."""
     sentinel = _CachedCtx()
-    container.override(G.ctx, sentinel)
-    assert container.resolve(_CachedNullable).ctx is sentinel
+    if tree_wide:
+        request.override(ctx, _CachedCtx() if local else sentinel)
+    if local:
+        request.override(ctx, sentinel, local=True)
+    return sentinel
+
+
+@_CONTEXT_OVERRIDES
+def test_cached_factory_context_kwarg_uses_override(tree_wide: bool, local: bool) -> None:
+    class G(Group):
+        ctx = providers.ContextProvider(_CachedCtx, scope=Scope.REQUEST)
+        svc = providers.Factory(creator=_CachedNullable, scope=Scope.REQUEST, cache=True)
 
+    request = Container(scope=Scope.APP, groups=[G]).build_child_container(scope=Scope.REQUEST)
+    sentinel = _override_context(request, G.ctx, tree_wide=tree_wide, local=local)
+    assert request.resolve(_CachedNullable).ctx is sentinel
 
-def test_transient_factory_context_kwarg_uses_override() -> None:
+
+@_CONTEXT_OVERRIDES
+def test_transient_factory_context_kwarg_uses_override(tree_wide: bool, local: bool) -> None:
     # Twin of the cached test above: the transient closure holds its own copy of the fold, and
     # its override branch must `continue`. The parameter is nullable with no default, so falling
     # through to the live lookup would overwrite the override with None.
     class G(Group):
-        ctx = providers.ContextProvider(_CachedCtx, scope=Scope.APP)
-        svc = providers.Factory(creator=_CachedNullable, scope=Scope.APP)
+        ctx = providers.ContextProvider(_CachedCtx, scope=Scope.REQUEST)
+        svc = providers.Factory(creator=_CachedNullable, scope=Scope.REQUEST)
 
-    container = Container(scope=Scope.APP, groups=[G])
-    container.open()
-    sentinel = _CachedCtx()
-    container.override(G.ctx, sentinel)
-    assert container.resolve(_CachedNullable).ctx is sentinel
+    request = Container(scope=Scope.APP, groups=[G]).build_child_container(scope=Scope.REQUEST)
+    assert request.resolve(_CachedNullable).ctx is None  # compiled before the override: it recompiles
+    sentinel = _override_context(request, G.ctx, tree_wide=tree_wide, local=local)
+    assert request.resolve(_CachedNullable).ctx is sentinel
 
 
 def test_cached_factory_context_kwarg_absent_and_nullable_injects_none() -> None:
@@ -630,3 +646,65 @@ def test_transient_factory_context_kwarg_through_closed_holder_warns() -> None:
 
     with pytest.warns(ContainerClosedWarning):
         assert request.resolve(_CachedNullable).ctx is value
+
+
+# Slot-indexed context: compiled resolvers read `context_registry.values[slot]`, a view of the
+# context dict that every write empties and the next read refills.
+
+
+class _OtherCtx: ...
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _TwoCtx:
+    first: _CachedCtx | None
+    second: _OtherCtx | None
+
+
+def test_set_contexts_is_seen_by_a_warm_resolver() -> None:
+    class G(Group):
+        ctx = providers.ContextProvider(_CachedCtx, scope=Scope.REQUEST)
+        other = providers.ContextProvider(_OtherCtx, scope=Scope.REQUEST)
+        svc = providers.Factory(creator=_TwoCtx, scope=Scope.REQUEST)
+
+    request = Container(scope=Scope.APP, groups=[G]).build_child_container(scope=Scope.REQUEST)
+    assert request.resolve(_TwoCtx) == _TwoCtx(first=None, second=None)
+
+    first, second = _CachedCtx(), _OtherCtx()
+    request.set_contexts({_CachedCtx: first, _OtherCtx: second})
+    assert request.resolve(_TwoCtx) == _TwoCtx(first=first, second=second)
+    assert request.context_registry.values == [first, second]
+
+
+def test_slot_numbered_after_the_values_were_filled_refills_them() -> None:
+    class G(Group):
+        ctx = providers.ContextProvider(_CachedCtx, scope=Scope.REQUEST)
+        other = providers.ContextProvider(_OtherCtx, scope=Scope.REQUEST)
+        nullable = providers.Factory(creator=_CachedNullable, scope=Scope.REQUEST, cache=True)
+        both = providers.Factory(creator=_TwoCtx, scope=Scope.REQUEST, cache=True)
+
+    first, second = _CachedCtx(), _OtherCtx()
+    request = Container(scope=Scope.APP, groups=[G]).build_child_container(
+        scope=Scope.REQUEST, context={_CachedCtx: first, _OtherCtx: second}
+    )
+    assert request.resolve(_CachedNullable).ctx is first
+    assert request.context_registry.values == [first]  # only `_CachedCtx` had a slot yet
+
+    assert request.resolve(_TwoCtx) == _TwoCtx(first=first, second=second)
+    assert request.context_registry.values == [first, second]
+
+
+def test_pooled_child_does_not_read_the_previous_requests_context() -> None:
+    class G(Group):
+        ctx = providers.ContextProvider(_CachedCtx, scope=Scope.REQUEST)
+        svc = providers.Factory(creator=_CachedNullable, scope=Scope.REQUEST)
+
+    app = Container(scope=Scope.APP, groups=[G], child_pool_size=1)
+    value = _CachedCtx()
+    request = app.build_child_container(scope=Scope.REQUEST, context={_CachedCtx: value})
+    assert request.resolve(_CachedNullable).ctx is value
+    request.close_sync()
+
+    again = app.build_child_container(scope=Scope.REQUEST)
+    assert again is request
+    assert again.resolve(_CachedNullable).ctx is None
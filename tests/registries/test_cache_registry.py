@@ -1,7 +1,13 @@
+import asyncio
 import threading
+import time
 import typing
 
-from modern_di.registries.cache_registry import CacheItem
+import pytest
+
+from modern_di import exceptions
+from modern_di.providers import CacheSettings
+from modern_di.registries.cache_registry import CacheItem, CacheRegistry
 
 
 def _item() -> CacheItem:
@@ -83,3 +89,184 @@ def test_get_or_create_releases_lock_and_fast_path_on_second_call() -> None:
     # The lock was released by the first call's finally (not left held).
     assert lock.acquire(blocking=False)
     lock.release()
+
+
+def test_get_or_create_locks_each_item_on_its_own() -> None:
+    # With one lock per container, `a`'s creator would hold it while waiting for `b`'s creator to
+    # start, and `b` could never start. Per-item locks let unrelated items create in parallel.
+    container_lock = threading.RLock()
+    a, b = _item(), _item()
+    b_creating = threading.Event()
+
+    def create_a(_: object) -> str:
+        assert b_creating.wait(timeout=5), "b's creation was blocked behind a's"
+        return "a"
+
+    def create_b(_: object) -> str:
+        b_creating.set()
+        return "b"
+
+    thread = threading.Thread(target=a.get_or_create, args=(container_lock, lambda: 0, create_a))
+    thread.start()
+    assert b.get_or_create(container_lock, resolve=lambda: 0, create=create_b) == ("b", True)
+    thread.join()
+    assert a.cache == "a"
+    assert a._lock is not b._lock
+    assert (a.lock_waits, b.lock_waits) == (0, 0)
+
+
+def test_get_or_create_counts_a_wait_for_the_same_item() -> None:
+    container_lock = threading.RLock()
+    item = _item()
+    creating = threading.Event()
+    release = threading.Event()
+
+    def create_slowly(_: object) -> str:
+        creating.set()
+        assert release.wait(timeout=5)
+        return "first"
+
+    def create_never(_: object) -> str:  # pragma: no cover
+        msg = "the waiter must find the first creator's value"
+        raise AssertionError(msg)
+
+    first = threading.Thread(target=item.get_or_create, args=(container_lock, lambda: 0, create_slowly))
+    first.start()
+    assert creating.wait(timeout=5)
+    waiter_result: list[tuple[object, bool]] = []
+    waiter = threading.Thread(
+        target=lambda: waiter_result.append(item.get_or_create(container_lock, lambda: 0, create_never))
+    )
+    waiter.start()
+    time.sleep(0.05)  # let the waiter block on the item's lock
+    release.set()
+    first.join()
+    waiter.join()
+
+    assert waiter_result == [("first", False)]
+    assert item.lock_waits == 1
+    assert item.lock_wait_ns > 0
+
+
+def test_get_or_create_item_lock_is_reentrant() -> None:
+    item = _item()
+    inner: list[tuple[object, bool]] = []
+
+    def create(_: object) -> str:
+        inner.append(item.get_or_create(threading.RLock(), resolve=lambda: 0, create=lambda _: "inner"))
+        return "outer"
+
+    assert item.get_or_create(threading.RLock(), resolve=lambda: 0, create=create) == ("outer", True)
+    assert inner == [("inner", True)]
+
+
+def test_finalization_batches_close_unleveled_items_first_then_levels_top_down() -> None:
+    registry = CacheRegistry()
+    low, high, loose = (CacheItem(settings=CacheSettings(finalizer=print)) for _ in range(3))
+    registry._items.update({1: low, 2: high, 3: loose})
+    for item in (low, high, loose):
+        registry.mark_created(item)
+    registry._items[4] = _item()  # fetched but never created: nothing to finalize
+
+    assert registry._finalization_batches([[1, 4], [2]]) == [[loose], [high], [low]]
+
+
+async def test_concurrent_close_reraises_a_finalizer_cancellation() -> None:
+    # A cancellation is not a finalizer error: the sequential close lets it through, and so does the
+    # concurrent one instead of folding it into FinalizerError.
+    async def _cancelled(_: object) -> None:
+        raise asyncio.CancelledError
+
+    registry = CacheRegistry()
+    for pid in (1, 2):
+        item = CacheItem(settings=CacheSettings(finalizer=_cancelled))
+        item.cache = object()
+        registry._items[pid] = item
+        registry.mark_created(item)
+
+    with pytest.raises(asyncio.CancelledError):
+        await registry.close_async(levels=[[1, 2]])
+
+
+@pytest.mark.parametrize("concurrently", [False, True])
+async def test_close_cancelled_midway_keeps_the_finalizer_errors_collected_so_far(concurrently: bool) -> None:
+    async def _fails(_: object) -> None:
+        msg = "pool already gone"
+        raise RuntimeError(msg)
+
+    async def _cancelled(_: object) -> None:
+        raise asyncio.CancelledError
+
+    registry = CacheRegistry()
+    # Closed LIFO, one level each: the failing finalizers run before the cancelled one.
+    for pid, finalizer in ((1, _cancelled), (2, _fails), (3, _fails)):
+        item = CacheItem(settings=CacheSettings(finalizer=finalizer))
+        item.cache = object()
+        registry._items[pid] = item
+        registry.mark_created(item)
+
+    with pytest.raises(asyncio.CancelledError) as exc_info:
+        await registry.close_async(levels=[[1], [2, 3]] if concurrently else None)
+    cause = exc_info.value.__cause__
+    assert isinstance(cause, exceptions.FinalizerError)
+    assert [str(error) for error in cause.finalizer_errors] == ["pool already gone", "pool already gone"]
+
+
+async def test_close_async_offloads_a_sync_finalizer_to_a_worker_thread() -> None:
+    threads: list[threading.Thread] = []
+    item = CacheItem(
+        settings=CacheSettings(finalizer=lambda _: threads.append(threading.current_thread()), offload_finalizer=True)
+    )
+    item.cache = object()
+
+    await item.close_async()
+
+    assert len(threads) == 1
+    assert threads[0] is not threading.current_thread()
+
+
+async def test_close_async_keeps_an_async_finalizer_on_the_loop_when_offload_is_set() -> None:
+    threads: list[threading.Thread] = []
+
+    async def _finalize(_: object) -> None:
+        threads.append(threading.current_thread())
+
+    item = CacheItem(settings=CacheSettings(finalizer=_finalize, offload_finalizer=True))
+    item.cache = object()
+
+    await item.close_async()
+
+    assert threads == [threading.current_thread()]
+
+
+def test_detach_moves_created_items_and_keeps_the_uncleared_ones() -> None:
+    registry = CacheRegistry()
+    registry.size_slots(2)
+    cleared = CacheItem(settings=CacheSettings())
+    kept = CacheItem(settings=CacheSettings(clear_cache=False, finalizer=print))
+    registry._items.update({1: cleared, 2: kept})
+    registry._slots[:] = [cleared, kept]
+    for item in (cleared, kept):
+        item.cache = object()
+        registry.mark_created(item)
+
+    detached = registry.detach()
+
+    assert detached._creation_order == [kept]
+    assert detached._clear_only == [cleared]
+    assert registry._items == {2: kept}
+    assert registry._creation_order == []
+    assert registry._slots == [None, None]
+
+
+async def test_an_item_without_settings_is_left_out_of_the_close_plan() -> None:
+    registry = CacheRegistry()
+    item = _item()
+    value = item.cache = object()
+
+    registry.mark_created(item)
+    item.close_sync()
+    await item.close_async()
+
+    assert registry._creation_order == registry._clear_only == []
+    assert item.cache is value
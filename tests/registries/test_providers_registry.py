@@ -1,3 +1,4 @@
+import dataclasses
 import sys
 import threading
 import typing
@@ -40,21 +41,48 @@ def test_mutation_clears_validated() -> None:
     assert registry.is_validated() is False
 
 
-def test_mutation_clears_the_resolver_and_plan_memos() -> None:
+def test_mutation_keeps_the_memos_no_added_type_can_change() -> None:
     class _Dep: ...
 
     registry = ProvidersRegistry()
     dep_factory = providers.Factory(scope=Scope.APP, creator=_Dep, bound_type=_Dep)
     registry.add_providers(dep_factory)
-    registry.resolver_for(dep_factory)  # populates _resolvers (and _plans via compile)
-    assert registry._resolvers
-    assert registry._plans
+    resolver = registry.resolver_for(dep_factory)
+    plans = dict(registry._plans)
+    generation = registry._generation
 
     class _Other: ...
 
     registry.add_providers(providers.Factory(scope=Scope.APP, creator=_Other, bound_type=_Other))
-    assert registry._resolvers == {}  # mutation cleared the memos
-    assert registry._plans == {}
+    assert registry._resolvers == {dep_factory.provider_id: resolver}  # `_Dep` looks nothing up
+    assert registry._plans == plans
+    assert registry._generation > generation  # handles and injectors still rebind
+
+
+def test_mutation_drops_the_plans_that_looked_up_an_added_type_and_their_dependents() -> None:
+    class _Missing: ...
+
+    @dataclasses.dataclass(kw_only=True, slots=True)
+    class _Leaf:
+        missing: _Missing | None = None
+
+    @dataclasses.dataclass(kw_only=True, slots=True)
+    class _Root:
+        leaf: _Leaf
+
+    class _Bystander: ...
+
+    registry = ProvidersRegistry()
+    leaf = providers.Factory(scope=Scope.APP, creator=_Leaf)
+    root = providers.Factory(scope=Scope.APP, creator=_Root)
+    bystander = providers.Factory(scope=Scope.APP, creator=_Bystander)
+    registry.add_providers(leaf, root, bystander)
+    for provider in (root, bystander):
+        registry.resolver_for(provider)
+
+    registry.add_providers(providers.Factory(scope=Scope.APP, creator=_Missing))
+    assert set(registry._resolvers) == {bystander.provider_id}  # `_Leaf` missed `_Missing`; `_Root` calls it
+    assert set(registry._plans) == {root.provider_id, bystander.provider_id}  # `_Root`'s own lookups are unchanged
 
 
 def test_providers_registry_add_provider_duplicates() -> None:
@@ -1,8 +1,12 @@
+import asyncio
+import concurrent.futures
 import copy
 import dataclasses
 import gc
 import inspect
 import os
+import threading
+import time
 import typing
 import warnings
 import weakref
@@ -11,6 +15,7 @@ import pytest
 
 from modern_di import Container, Group, Scope, exceptions, providers, suggester
 from modern_di import container as container_module
+from modern_di.dependency_graph import DependencyGraph
 from modern_di.exceptions import (
     ArgumentResolutionError,
     ChildContainerRegistrationError,
@@ -28,6 +33,7 @@ from modern_di.exceptions import (
     ValidationFailedError,
 )
 from modern_di.providers.abstract import AbstractProvider
+from modern_di.registries import providers_registry as providers_registry_module
 
 
 def test_container_prevent_copy() -> None:
@@ -181,6 +187,34 @@ def test_validate_passes_for_valid_graph() -> None:
     container.validate()  # should not raise
 
 
+def test_validate_production_switches_the_profile_until_the_next_mutation() -> None:
+    class Extra:
+        pass
+
+    container = Container(groups=[_WarmGroup])
+    registry = container.providers_registry
+    container.validate()
+    assert not registry.is_production()
+
+    container.validate(production=True)  # already validated: no re-walk, the profile still switches on
+    assert registry.is_production()
+    assert registry.is_validated()
+    assert isinstance(container.build_child_container(scope=Scope.REQUEST).resolve(_WarmRoot), _WarmRoot)
+
+    registry.add_providers(providers.Factory(creator=Extra))
+    assert not registry.is_production()
+    assert not registry.is_validated()
+
+
+def test_validate_production_leaves_an_invalid_graph_unprofiled() -> None:
+    container = Container(groups=[CycleGroup])
+    with pytest.raises(ValidationFailedError):
+        container.validate(production=True)
+    assert not container.providers_registry.is_production()
+    container.providers_registry.use_production_profile()  # refused: the graph is not validated
+    assert not container.providers_registry.is_production()
+
+
 def test_validate_memoizes_diamond() -> None:
     @dataclasses.dataclass(kw_only=True, slots=True)
     class Bottom:
@@ -877,6 +911,218 @@ def test_resolve_dependency_works_on_child_container_for_both_arms() -> None:
     assert request_container.resolve_dependency(G.request_factory) == "value"
 
 
+def test_resolver_handle_resolves_from_its_container_by_type_and_by_provider() -> None:
+    class G(Group):
+        cached = providers.Factory(scope=Scope.REQUEST, creator=lambda: "value", bound_type=str, cache=True)
+
+    request = Container(groups=[G]).build_child_container(scope=Scope.REQUEST)
+    by_type = request.resolver(str)
+    by_provider = request.resolver(G.cached)
+
+    assert by_type() is by_provider() is request.resolve(str)
+
+
+def test_resolver_handle_rebinds_when_the_registry_changes() -> None:
+    @dataclasses.dataclass(kw_only=True, slots=True)
+    class Inner:
+        pass
+
+    @dataclasses.dataclass(kw_only=True, slots=True)
+    class Outer:
+        inner: Inner | None = None
+
+    class G(Group):
+        outer = providers.Factory(creator=Outer)
+
+    container = Container(groups=[G])
+    handle = container.resolver(Outer)
+    assert handle().inner is None
+
+    container.add_providers(providers.Factory(creator=Inner))
+    assert isinstance(handle().inner, Inner)
+
+    replacement = Outer()
+    with container.override(G.outer, replacement):
+        assert handle() is replacement
+    assert handle() is not replacement
+
+
+def test_resolver_handle_for_an_unregistered_type_raises_at_creation() -> None:
+    with pytest.raises(ProviderNotRegisteredError):
+        Container().resolver(str)
+
+
+def test_resolver_handle_reopens_a_closed_container() -> None:
+    class G(Group):
+        factory = providers.Factory(creator=lambda: "value", bound_type=str)
+
+    container = Container(groups=[G])
+    handle = container.resolver(str)
+    container.close_sync()
+
+    with pytest.warns(ContainerClosedWarning):
+        assert handle() == "value"
+    assert container.closed is False
+
+
+def test_resolver_handle_lets_a_recursion_error_that_is_not_a_cycle_propagate(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def _recurse() -> str:
+        raise RecursionError
+
+    class G(Group):
+        factory = providers.Factory(creator=_recurse, bound_type=str)
+
+    container = Container(groups=[G])
+    with pytest.raises(RecursionError):
+        container.resolver(str)()
+
+    handle = container.resolver(str)
+    monkeypatch.setattr(providers_registry_module.ProvidersRegistry, "resolver_for", lambda *_: _recurse())
+    with pytest.raises(RecursionError):
+        container.resolver(str)  # while compiling
+
+    handled: list[RecursionError] = []
+    handle_recursion_error = container_module._handle_recursion_error
+
+    def _spy(provider: AbstractProvider[typing.Any], owner: Container, exc: RecursionError) -> typing.NoReturn:
+        handled.append(exc)
+        handle_recursion_error(provider, owner, exc)
+
+    monkeypatch.setattr(container_module, "_handle_recursion_error", _spy)
+    container.add_providers(providers.Factory(creator=lambda: 1, bound_type=int))
+    with pytest.raises(RecursionError):
+        handle()  # while recompiling after the generation moved
+    assert len(handled) == 1
+
+
+class _SnapshotGroup(Group):
+    settings = providers.Factory(creator=lambda: "settings", bound_type=str, cache=True)
+    port = providers.Factory(creator=lambda: 8000, bound_type=int, cache=True)
+    session = providers.Factory(scope=Scope.REQUEST, creator=lambda: 1.5, bound_type=float, cache=True)
+
+
+def test_singleton_snapshot_holds_this_containers_created_instances() -> None:
+    app = Container(groups=[_SnapshotGroup])
+    app.resolve(str)
+    request = app.build_child_container(scope=Scope.REQUEST)
+    request.resolve(float)
+
+    singletons = app.snapshot_singletons()
+    assert dict(singletons) == {str: "settings"}  # `int` was never created
+    assert dict(request.snapshot_singletons()) == {float: 1.5}  # nothing its parent cached
+    with pytest.raises(KeyError):
+        singletons[int]
+    with pytest.raises(TypeError):
+        singletons[int] = 1  # type: ignore[index]
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda app: app.override(_SnapshotGroup.port, 1),
+        lambda app: app.build_child_container().override_many({_SnapshotGroup.port: 1}, local=True),
+        lambda app: app.override_context({_SnapshotGroup.port: 1}).__enter__(),
+    ],
+)
+def test_singleton_snapshot_goes_stale_on_any_override(change: typing.Callable[[Container], object]) -> None:
+    app = Container(groups=[_SnapshotGroup])
+    app.resolve(str)
+    singletons = app.snapshot_singletons()
+
+    change(app)
+    with pytest.raises(exceptions.SnapshotStaleError) as exc_info:
+        singletons[str]
+    assert "override" in exc_info.value.reason
+
+
+async def test_singleton_snapshot_goes_stale_when_its_own_container_closes() -> None:
+    app = Container(groups=[_SnapshotGroup])
+    app.resolve(str)
+    app_singletons = app.snapshot_singletons()
+    request = app.build_child_container(scope=Scope.REQUEST)
+    request.resolve(float)
+    request_singletons = request.snapshot_singletons()
+    request.snapshot_singletons()  # collected at once: closing skips it
+    gc.collect()
+
+    await request.close_async()
+    assert app_singletons[str] == "settings"
+    with pytest.raises(exceptions.SnapshotStaleError, match="its container was closed"):
+        request_singletons[float]
+
+    app.close_sync()
+    with pytest.raises(exceptions.SnapshotStaleError):
+        app_singletons[str]
+
+
+def test_singleton_snapshot_goes_stale_when_a_context_created_before_it_is_entered() -> None:
+    app = Container(groups=[_SnapshotGroup])
+    app.resolve(str)
+    context = app.override_context({_SnapshotGroup.port: 1})
+    singletons = app.snapshot_singletons()
+    assert singletons[str] == "settings"  # created, not entered: nothing is overridden yet
+
+    with context, pytest.raises(exceptions.SnapshotStaleError, match="override context was entered"):
+        singletons[str]
+
+
+def test_singleton_snapshot_is_taken_once_a_childs_local_overrides_are_reset() -> None:
+    app = Container(groups=[_SnapshotGroup])
+    child = app.build_child_container()
+    child.override(_SnapshotGroup.port, 1, local=True)
+    with pytest.raises(exceptions.SnapshotStaleError, match="override"):
+        child.snapshot_singletons()
+
+    child.reset_override(_SnapshotGroup.port, local=True)
+    assert dict(child.snapshot_singletons()) == {}  # the emptied layer is no longer an override
+
+
+def test_singleton_snapshots_are_forgotten_once_collected() -> None:
+    app = Container(groups=[_SnapshotGroup])
+    app.resolve(str)
+    for _ in range(100):
+        app.snapshot_singletons()
+    kept = app.snapshot_singletons()
+    gc.collect()
+    app.snapshot_singletons()
+
+    owned = app.providers_registry._snapshots
+    assert [len(refs) for refs in owned.values()] == [2]  # `kept` and the one just taken
+    assert kept[str] == "settings"
+
+
+def test_singleton_snapshot_outlives_its_container_without_passing_to_a_new_one() -> None:
+    app = Container(groups=[_SnapshotGroup])
+    request = app.build_child_container(scope=Scope.REQUEST)
+    request.resolve(float)
+    orphan = request.snapshot_singletons()
+    del request
+    gc.collect()
+
+    # Held open together, the new containers soon land at the collected one's address and id.
+    newcomers = [app.build_child_container(scope=Scope.REQUEST) for _ in range(100)]
+    for newcomer in newcomers:
+        newcomer.close_sync()
+    assert orphan[float] == 1.5  # noqa: PLR2004
+    app.override(_SnapshotGroup.port, 1)
+    with pytest.raises(exceptions.SnapshotStaleError, match="override"):
+        orphan[float]
+
+
+def test_singleton_snapshot_is_refused_while_overridden_or_closed() -> None:
+    app = Container(groups=[_SnapshotGroup])
+    with app.override(_SnapshotGroup.port, 1), pytest.raises(exceptions.SnapshotStaleError, match="override"):
+        app.snapshot_singletons()
+    with app.override_context({_SnapshotGroup.port: 1}), pytest.raises(exceptions.SnapshotStaleError):
+        app.snapshot_singletons()
+
+    app.close_sync()
+    with pytest.raises(exceptions.SnapshotStaleError, match="the container is closed"):
+        app.snapshot_singletons()
+
+
 class _OverrideSvc: ...
 
 
@@ -942,6 +1188,156 @@ def test_override_context_manager_exit_restores_snapshot_after_inner_reset() ->
     assert container.resolve(_OverrideSvc) is first  # exit restores the snapshot taken at override() time
 
 
+class _LayerClient: ...
+
+
+@dataclasses.dataclass
+class _LayerHandler:
+    client: _LayerClient
+
+
+@dataclasses.dataclass
+class _LayerCache:
+    client: _LayerClient
+
+
+class _LayerGroup(Group):
+    client = providers.Factory(_LayerClient)
+    handler = providers.Factory(_LayerHandler, scope=Scope.REQUEST)
+    cache = providers.Factory(_LayerCache, cache=True)
+
+
+def test_local_override_is_seen_only_inside_the_childs_subtree() -> None:
+    app = Container(groups=[_LayerGroup])
+    canary = app.build_child_container(scope=Scope.SESSION)
+    sibling = app.build_child_container(scope=Scope.SESSION)
+    canary_client = _LayerClient()
+    canary.override(_LayerGroup.client, canary_client, local=True)
+    request = canary.build_child_container(scope=Scope.REQUEST)
+
+    assert request.resolve(_LayerHandler).client is canary_client
+    assert sibling.build_child_container(scope=Scope.REQUEST).resolve(_LayerHandler).client is not canary_client
+    assert app.resolve(_LayerClient) is not canary_client
+    assert sibling.overrides_registry is app.overrides_registry  # an unlayered child pays nothing
+    # An APP singleton resolves its own dependencies at APP, so it never captures a layer's override.
+    assert canary.resolve(_LayerCache).client is not canary_client
+
+    global_client = _LayerClient()
+    app.override(_LayerGroup.client, global_client)  # added after the layer; still seen through it
+    canary.reset_override(_LayerGroup.client, local=True)
+    assert request.resolve(_LayerHandler).client is global_client
+
+    canary.close_sync()
+    assert canary.overrides_registry is app.overrides_registry  # closing drops the layer
+
+
+def test_local_override_handle_and_reset_touch_only_the_layer() -> None:
+    app = Container(groups=[_LayerGroup])
+    outer = app.build_child_container(scope=Scope.SESSION)
+    inner = outer.build_child_container(scope=Scope.REQUEST)  # built before outer's layer exists
+    global_client, local_client = _LayerClient(), _LayerClient()
+    app.override(_LayerGroup.client, global_client)
+    outer.reset_override(local=True)  # no layer yet: nothing to reset
+    with outer.override(_LayerGroup.client, local_client, local=True):
+        assert outer.resolve(_LayerClient) is local_client
+        assert inner.resolve(_LayerClient) is global_client
+
+    assert outer.resolve(_LayerClient) is global_client  # the handle restored the layer, not the global
+
+    inner.override(_LayerGroup.client, local_client, local=True)
+    assert inner.resolve(_LayerClient) is local_client
+    assert app.resolve(_LayerClient) is global_client  # inner installed its own layer
+    inner.reset_override(local=True)
+    assert inner.resolve(_LayerClient) is global_client
+
+    app.override(_LayerGroup.client, local_client, local=True)  # a root's local override is tree-wide
+    assert outer.resolve(_LayerClient) is local_client
+
+
+@pytest.mark.parametrize("depth", [1, 2])
+def test_tree_wide_override_and_reset_pass_through_a_layer(depth: int) -> None:
+    app = Container(groups=[_LayerGroup])
+    layered = app.build_child_container(scope=Scope.SESSION)
+    local_handler = _LayerHandler(_LayerClient())
+    layered.override(_LayerGroup.handler, local_handler, local=True)
+    caller = layered if depth == 1 else layered.build_child_container(scope=Scope.REQUEST)  # inherits the layer
+    sibling = app.build_child_container(scope=Scope.SESSION).build_child_container(scope=Scope.REQUEST)
+    tree_client = _LayerClient()
+
+    caller.override(_LayerGroup.client, tree_client)
+    assert sibling.resolve(_LayerHandler).client is tree_client
+    caller.reset_override()
+    assert sibling.resolve(_LayerClient) is not tree_client
+
+    caller.override_many({_LayerGroup.client: tree_client})
+    assert app.resolve(_LayerClient) is tree_client
+    caller.reset_override(_LayerGroup.client)
+    assert app.resolve(_LayerClient) is not tree_client
+    assert caller.resolve(_LayerHandler) is local_handler  # the layer's own override is untouched
+
+
+async def test_close_async_drops_a_childs_override_layer() -> None:
+    app = Container(groups=[_LayerGroup])
+    request = app.build_child_container(scope=Scope.REQUEST)
+    request.override(_LayerGroup.client, _LayerClient(), local=True)
+    await request.close_async()
+    assert request.overrides_registry is app.overrides_registry
+
+
+async def test_override_context_is_seen_only_by_the_task_that_entered_it() -> None:
+    app = Container(groups=[_LayerGroup])
+    app.build_child_container(scope=Scope.REQUEST).resolve(_LayerHandler)  # warm: both tasks share its resolvers
+    both_entered = asyncio.Event()
+    entered = 0
+
+    async def run_test(client: _LayerClient) -> _LayerClient:
+        nonlocal entered
+        with app.override_context({_LayerGroup.client: client}):
+            entered += 1
+            if entered == 2:  # noqa: PLR2004
+                both_entered.set()
+            await both_entered.wait()  # both contexts are entered while either resolves
+            return app.build_child_container(scope=Scope.REQUEST).resolve(_LayerHandler).client
+
+    first, second = _LayerClient(), _LayerClient()
+    assert await asyncio.gather(run_test(first), run_test(second)) == [first, second]
+    assert app.resolve(_LayerClient) not in (first, second)
+    assert not app.overrides_registry.has_overrides  # every context exited: the guard is off again
+
+
+def test_override_context_is_seen_only_by_the_thread_that_entered_it() -> None:
+    app = Container(groups=[_LayerGroup])
+    barrier = threading.Barrier(2)
+
+    def run_test(client: _LayerClient) -> _LayerClient:
+        with app.override_context({_LayerGroup.client: client}):
+            barrier.wait()
+            resolved = app.resolve(_LayerClient)
+            barrier.wait()
+        return resolved
+
+    clients = [_LayerClient(), _LayerClient()]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as pool:
+        assert list(pool.map(run_test, clients)) == clients
+
+
+def test_override_context_nests_over_tree_wide_and_under_local_overrides() -> None:
+    app = Container(groups=[_LayerGroup])
+    global_client, outer_client, inner_client, local_client = (_LayerClient() for _ in range(4))
+    app.override(_LayerGroup.client, global_client)
+    request = app.build_child_container(scope=Scope.REQUEST)
+    with app.override_context({_LayerGroup.client: outer_client}):
+        assert request.resolve(_LayerHandler).client is outer_client
+        with request.override_context({_LayerGroup.client: inner_client}):
+            assert request.resolve(_LayerHandler).client is inner_client
+            request.override(_LayerGroup.client, local_client, local=True)
+            assert request.resolve(_LayerHandler).client is local_client
+            with request.override_context({}):  # entered through the layer: it applies to the whole tree
+                assert app.resolve(_LayerClient) is inner_client
+        assert app.resolve(_LayerClient) is outer_client
+    assert app.resolve(_LayerClient) is global_client
+
+
 def test_resolve_provider_raises_for_unhandled_provider_type() -> None:
     # Every real provider type compiles; an unknown AbstractProvider subclass hits compile_resolver's
     # final explicit raise (the single place a new, unregistered provider type is rejected).
@@ -1065,3 +1461,710 @@ def test_add_providers_completed_graph_resolves_without_an_explicit_open() -> No
     request = container.build_child_container(scope=Scope.REQUEST)
     assert isinstance(request.resolve(_DeferReqDependent), _DeferReqDependent)  # no explicit open()
     assert container.closed is False
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _WarmLeaf:
+    pass
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _WarmRoot:
+    leaf: _WarmLeaf
+
+
+_warm_referenced = providers.Factory(creator=_WarmLeaf, bound_type=None)
+
+
+class _WarmGroup(Group):
+    leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.APP, cache=True)
+    root = providers.Factory(creator=_WarmRoot, scope=Scope.REQUEST, kwargs={"leaf": _warm_referenced})
+
+
+def test_compile_all_fills_every_resolver_before_the_first_resolve(monkeypatch: pytest.MonkeyPatch) -> None:
+    container = Container(groups=[_WarmGroup])
+
+    report = container.compile_all()
+
+    registry = container.providers_registry
+    expected = {p.provider_id for p in registry} | {_warm_referenced.provider_id}
+    assert report.providers == len(expected)
+    assert report.seconds >= 0
+    assert set(registry._resolvers) == expected
+    # Warm: a live resolve after compile_all never reaches the compiler.
+    monkeypatch.setattr(providers_registry_module, "compile_resolver", None)
+    request = container.build_child_container(scope=Scope.REQUEST)
+    assert isinstance(request.resolve(_WarmRoot).leaf, _WarmLeaf)
+    assert isinstance(request.resolve(_WarmLeaf), _WarmLeaf)
+
+
+def test_compile_all_creates_nothing_and_reruns_after_mutation() -> None:
+    container = Container(groups=[_WarmGroup])
+    container.compile_all()
+    assert container.cache_registry.cached_count() == 0
+    compiled = set(container.providers_registry._resolvers)
+
+    container.add_providers(providers.Factory(creator=lambda: "added", bound_type=str))
+    assert set(container.providers_registry._resolvers) == compiled  # nothing looks `str` up
+
+    assert container.compile_all().providers == len(container.providers_registry) + 1
+
+
+def test_compile_all_compiles_a_broken_graph_without_raising() -> None:
+    container = Container(scope=Scope.APP, groups=[CycleGroup, _DeferBrokenGroup])
+    container.compile_all()  # no raise: compiling is not validating
+    with pytest.raises(ArgumentResolutionError):
+        container.resolve(_DeferBrokenService)
+    with pytest.raises(CircularDependencyError):
+        container.resolve(CycleA)
+
+
+class _FrozenIface: ...
+
+
+class _FrozenGroup(Group):
+    leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.APP, cache=True)
+    root = providers.Factory(creator=_WarmRoot, scope=Scope.REQUEST, cache=True)
+    iface = providers.Alias(source_type=_WarmLeaf, bound_type=_FrozenIface)
+
+
+def test_freeze_rejects_every_later_registration() -> None:
+    container = Container(groups=[_FrozenGroup])
+    container.freeze()
+
+    with pytest.raises(exceptions.RegistryFrozenError) as exc:
+        container.add_providers(providers.Factory(creator=lambda: "late", bound_type=str))
+    assert isinstance(exc.value, exceptions.RegistrationError)
+    assert exc.value.provider_types == [str]
+    assert "freeze()" in str(exc.value)
+
+    with pytest.raises(exceptions.RegistryFrozenError, match="reference-only providers"):
+        container.add_providers(providers.Factory(creator=lambda: "late", bound_type=None))
+    with pytest.raises(exceptions.RegistryFrozenError):
+        container.providers_registry.register(int, providers.Factory(creator=int))
+    assert container.providers_registry.find_provider(str) is None
+
+
+def test_freeze_keeps_singletons_and_sizes_slots_per_scope() -> None:
+    container = Container(groups=[_FrozenGroup])
+    leaf = container.resolve(_WarmLeaf)  # created before the freeze: lives only in `_items`
+    before = container.build_child_container(scope=Scope.REQUEST)
+    container.validate()
+
+    report = container.freeze()
+
+    registry = container.providers_registry
+    assert registry.is_frozen()
+    assert registry.is_validated()  # freezing changes what is compiled, not the graph
+    assert report.providers == len(registry)
+    assert container.cache_registry._slots == [None]  # sized now; mirrored on the next miss
+    assert container.resolve(_WarmLeaf) is leaf
+    assert container.cache_registry._slots == [container.cache_registry._items[_FrozenGroup.leaf.provider_id]]
+
+    after = container.build_child_container(scope=Scope.REQUEST)
+    assert len(after.cache_registry._slots) == 1  # REQUEST has one cached provider of its own
+    assert after.resolve(_WarmRoot) is after.resolve(_WarmRoot)
+    assert after.resolve(_WarmRoot).leaf is leaf
+    # A child built before the freeze has no slot list; it falls back to `_items` and still caches.
+    assert before.cache_registry._slots == []
+    assert before.resolve(_WarmRoot) is before.resolve(_WarmRoot)
+    assert before.resolve(_WarmRoot) is not after.resolve(_WarmRoot)
+
+    container.freeze()  # a repeat call only recompiles
+    assert container.resolve(_FrozenIface) is leaf
+
+
+def test_frozen_alias_binds_its_source_and_still_honours_overrides() -> None:
+    container = Container(groups=[_FrozenGroup])
+    container.freeze()
+    registry = container.providers_registry
+
+    resolver = typing.cast("typing.Any", registry._resolvers[_FrozenGroup.iface.provider_id])
+    assert resolver.__name__ == "resolve_bound"
+    assert registry._resolvers[_FrozenGroup.leaf.provider_id] in [c.cell_contents for c in resolver.__closure__]
+    assert container.resolve(_FrozenIface) is container.resolve(_WarmLeaf)
+
+    mock = _WarmLeaf()
+    with container.override(_FrozenGroup.iface, mock):
+        assert container.resolve(_FrozenIface) is mock
+    with container.override(_FrozenGroup.leaf, mock):
+        assert container.resolve(_FrozenIface) is mock
+        assert container.build_child_container(scope=Scope.REQUEST).resolve(_WarmRoot).leaf is mock
+
+
+def test_frozen_alias_with_a_missing_source_still_raises() -> None:
+    class _Missing: ...
+
+    class _G(Group):
+        iface = providers.Alias(source_type=_Missing, bound_type=_FrozenIface)
+
+    container = Container(groups=[_G])
+    container.freeze()
+    with pytest.raises(exceptions.AliasSourceNotRegisteredError):
+        container.resolve(_FrozenIface)
+
+
+def test_frozen_resolvers_reopen_a_closed_target_and_prepend_their_step() -> None:
+    class _G(Group):
+        leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.REQUEST, cache=True)
+        iface = providers.Alias(source_type=_WarmLeaf, bound_type=_FrozenIface)
+
+    container = Container(groups=[_G])
+    container.freeze()
+    with pytest.raises(exceptions.ScopeNotInitializedError) as exc:
+        container.resolve(_FrozenIface)
+    assert next(step.name for step in exc.value.dependency_path) == _G.iface.display_name
+
+    request = container.build_child_container(scope=Scope.REQUEST)
+    request.close_sync()
+    with pytest.warns(ContainerClosedWarning):
+        assert request.providers_registry.resolver_for(_G.leaf)(request) is request.resolve(_WarmLeaf)
+
+
+class _PinnedGroup(Group):
+    leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.APP, cache=providers.CacheSettings(clear_cache=False))
+    root = providers.Factory(creator=_WarmRoot, scope=Scope.REQUEST, cache=True)
+    fresh = providers.Factory(creator=_WarmLeaf, scope=Scope.APP, bound_type=None, cache=True)
+
+
+def test_pinned_singleton_binds_the_root_item_and_never_the_container() -> None:
+    container = Container(groups=[_PinnedGroup], pin_singletons=True)
+    registry = container.providers_registry
+    resolver = typing.cast("typing.Any", registry.resolver_for(_PinnedGroup.leaf))
+
+    assert resolver.__name__ == "resolve_pinned"
+    captured = [cell.cell_contents for cell in resolver.__closure__]
+    assert container.cache_registry._items[_PinnedGroup.leaf.provider_id] in captured
+    assert not any(isinstance(obj, (Container, type(registry))) for obj in captured)
+    # Only the root's scope is pinned; a REQUEST singleton keeps the navigating resolver.
+    assert typing.cast("typing.Any", registry.resolver_for(_PinnedGroup.root)).__name__ == "resolve"
+
+    request = container.build_child_container(scope=Scope.REQUEST)
+    leaf = request.resolve(_WarmRoot).leaf
+    assert container.resolve(_WarmLeaf) is leaf
+    assert request.resolve(_WarmLeaf) is leaf
+
+    mock = _WarmLeaf()
+    with container.override(_PinnedGroup.leaf, mock):
+        assert request.resolve(_WarmLeaf) is mock
+    assert request.resolve(_WarmLeaf) is leaf
+
+
+def test_pinned_root_is_freed_without_the_cycle_collector() -> None:
+    freed = 0
+
+    def _count() -> None:
+        nonlocal freed
+        freed += 1
+
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        root = Container(groups=[_PinnedGroup], pin_singletons=True)
+        weakref.finalize(root, _count)
+        request = root.build_child_container(scope=Scope.REQUEST)
+        assert request.resolve(_WarmRoot).leaf is root.resolve(_WarmLeaf)
+        registry = root.providers_registry
+        del root, request
+        assert freed == 1
+        assert gc.collect() == 0
+        # An orphaned registry compiles the plain resolver: there is no root left to pin to.
+        registry._recompile()
+        assert typing.cast("typing.Any", registry.resolver_for(_PinnedGroup.leaf)).__name__ == "resolve"
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def test_pinned_singleton_still_warns_and_reopens_after_the_root_closes() -> None:
+    container = Container(groups=[_PinnedGroup], pin_singletons=True)
+    request = container.build_child_container(scope=Scope.REQUEST)
+    leaf = container.resolve(_WarmLeaf)
+    fresh = container.resolve_provider(_PinnedGroup.fresh)
+    container.close_sync()
+
+    with pytest.warns(ContainerClosedWarning):
+        assert request.resolve(_WarmLeaf) is leaf  # clear_cache=False: survives the close
+    assert container.closed is False
+    assert container.resolve_provider(_PinnedGroup.fresh) is not fresh  # clear_cache=True: rebuilt
+    assert container.resolve(_WarmLeaf) is leaf
+
+
+def test_pinned_resolvers_rebind_after_a_registry_mutation() -> None:
+    container = Container(groups=[_PinnedGroup], pin_singletons=True)
+    leaf = container.resolve(_WarmLeaf)
+    container.validate()
+
+    container.add_providers(providers.Factory(creator=lambda: "added", bound_type=str))
+
+    assert container.resolve(_WarmLeaf) is leaf
+    assert container.resolve(str) == "added"
+
+
+def test_pinned_resolvers_keep_one_unpin_hook_across_override_cycles() -> None:
+    container = Container(groups=[_PinnedGroup], pin_singletons=True)
+    registry = container.providers_registry
+    leaf = container.resolve(_WarmLeaf)
+    mock = _WarmLeaf()
+    for _ in range(100):
+        with container.override(_PinnedGroup.leaf, mock):
+            assert container.resolve(_WarmLeaf) is mock
+        assert container.resolve(_WarmLeaf) is leaf
+
+    assert {pid: len(hooks) for pid, hooks in registry._unpin_hooks.items()} == {_PinnedGroup.leaf.provider_id: 1}
+
+
+class _PooledGroup(Group):
+    leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.REQUEST, cache=True)
+
+
+def test_pooled_child_is_reused_and_reset_in_place() -> None:
+    app = Container(groups=[_PooledGroup], child_pool_size=2)
+    first = app.build_child_container(scope=Scope.REQUEST, context={int: 1})
+    leaf = first.resolve(_WarmLeaf)
+    first.close_sync()
+    assert first.context_registry.context == {}, "a pooled child must not keep the request's context alive"
+
+    again = app.build_child_container(scope=Scope.REQUEST)
+    assert again is first
+    assert again.closed is False
+    assert again.cache_registry.cached_count() == 0
+    assert again.resolve(_WarmLeaf) is not leaf
+    again.close_sync()
+    assert app.build_child_container(scope=Scope.REQUEST, context={int: 2}).context_registry.context == {int: 2}
+
+
+async def test_pooled_child_returns_on_close_async() -> None:
+    app = Container(groups=[_PooledGroup], child_pool_size=1)
+    async with app.build_child_container(scope=Scope.REQUEST) as request:
+        request.resolve(_WarmLeaf)
+    assert app.build_child_container(scope=Scope.REQUEST) is request
+
+
+def test_child_pool_is_bounded_and_keyed_by_scope() -> None:
+    app = Container(child_pool_size=1)
+    a = app.build_child_container(scope=Scope.REQUEST)
+    b = app.build_child_container(scope=Scope.REQUEST)
+    session = app.build_child_container(scope=Scope.SESSION)
+    for child in (a, b, session):
+        child.close_sync()
+
+    assert app.build_child_container(scope=Scope.REQUEST) is a  # b found the pool full
+    assert app.build_child_container(scope=Scope.REQUEST) is not b
+    assert app.build_child_container(scope=Scope.SESSION) is session
+
+
+def test_pooled_child_sees_a_layer_its_parent_installed_after_it_was_built() -> None:
+    app = Container(groups=[_LayerGroup], child_pool_size=1)
+    session = app.build_child_container(scope=Scope.SESSION)
+    request = session.build_child_container(scope=Scope.REQUEST)
+    request.close_sync()
+    local_client = _LayerClient()
+    session.override(_LayerGroup.client, local_client, local=True)
+
+    again = session.build_child_container(scope=Scope.REQUEST)
+    assert again is request
+    assert again.resolve(_LayerHandler).client is local_client
+
+
+def test_pooled_child_is_pooled_once_per_close() -> None:
+    app = Container(child_pool_size=2)
+    child = app.build_child_container(scope=Scope.REQUEST)
+    child.close_sync()
+    child.close_sync()
+    assert app.build_child_container(scope=Scope.REQUEST) is child
+    assert app.build_child_container(scope=Scope.REQUEST) is not child
+
+
+def test_pooled_child_whose_finalizer_failed_is_not_reused() -> None:
+    def _fail(_: object) -> None:
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    class G(Group):
+        leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.REQUEST, cache=providers.CacheSettings(finalizer=_fail))
+
+    app = Container(groups=[G], child_pool_size=1)
+    child = app.build_child_container(scope=Scope.REQUEST)
+    child.resolve(_WarmLeaf)
+    with pytest.raises(exceptions.FinalizerError):
+        child.close_sync()
+    assert app.build_child_container(scope=Scope.REQUEST) is not child
+
+
+def test_pooled_grandchildren_and_a_later_freeze() -> None:
+    app = Container(groups=[_PooledGroup], child_pool_size=1)
+    request = app.build_child_container(scope=Scope.REQUEST)
+    action = request.build_child_container(scope=Scope.ACTION)
+    action.close_sync()
+    assert request.build_child_container(scope=Scope.ACTION) is action
+    request.close_sync()
+
+    app.freeze()
+    reused = app.build_child_container(scope=Scope.REQUEST)
+    assert reused is request
+    assert len(reused.cache_registry._slots) == 1  # sized to the frozen scope's slots on reuse
+    assert reused.resolve(_WarmLeaf) is reused.resolve(_WarmLeaf)
+    reused.close_sync()
+    assert app.build_child_container(scope=Scope.REQUEST).cache_registry._slots == [None]
+
+
+def test_closing_a_pooling_root_drains_it_so_it_is_freed_without_the_cycle_collector() -> None:
+    freed = 0
+
+    def _count() -> None:
+        nonlocal freed
+        freed += 1
+
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        root = Container(child_pool_size=4)
+        weakref.finalize(root, _count)
+        for _ in range(3):
+            root.build_child_container(scope=Scope.REQUEST).close_sync()
+        root.close_sync()
+        del root
+        assert freed == 1
+        assert gc.collect() == 0
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def test_child_pool_never_hands_one_child_to_two_threads() -> None:
+    pool_size = 4
+    app = Container(child_pool_size=pool_size)
+    owners: dict[int, int] = {}
+    clashes: list[bool] = []
+    guard = threading.Lock()
+    barrier = threading.Barrier(8)
+
+    def worker(n: int) -> None:
+        barrier.wait()
+        for _ in range(200):
+            child = app.build_child_container(scope=Scope.REQUEST)
+            with guard:
+                clashes.append(id(child) in owners)
+                owners[id(child)] = n
+            with guard:
+                del owners[id(child)]
+            child.close_sync()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not any(clashes)
+    assert app._child_pools is not None
+    assert len(app._child_pools[Scope.REQUEST]._free) <= pool_size
+
+
+def test_creation_lock_waits_reports_threads_that_created_the_same_provider() -> None:
+    creating = threading.Event()
+    release = threading.Event()
+
+    def _slow_leaf() -> _WarmLeaf:
+        creating.set()
+        assert release.wait(timeout=5)
+        return _WarmLeaf()
+
+    class G(Group):
+        leaf = providers.Factory(creator=_slow_leaf, scope=Scope.APP, cache=True)
+
+    app = Container(groups=[G])
+    assert app.creation_lock_waits() == container_module.LockWaitReport(waits=0, seconds=0.0)
+    results: list[_WarmLeaf] = []
+    first = threading.Thread(target=lambda: results.append(app.resolve(_WarmLeaf)))
+    first.start()
+    assert creating.wait(timeout=5)
+    second = threading.Thread(target=lambda: results.append(app.resolve(_WarmLeaf)))
+    second.start()
+    time.sleep(0.05)  # let the second thread block on the provider's creation lock
+    release.set()
+    first.join()
+    second.join()
+
+    assert results[0] is results[1]
+    report = app.creation_lock_waits()
+    assert report.waits == 1
+    assert report.seconds > 0
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _WarmPair:
+    leaf: _WarmLeaf
+    root: _WarmRoot
+
+
+def test_warm_up_creates_the_scope_s_cached_providers_level_by_level() -> None:
+    created: list[str] = []
+
+    def _leaf() -> _WarmLeaf:
+        created.append("leaf")
+        return _WarmLeaf()
+
+    def _root(leaf: _WarmLeaf) -> _WarmRoot:
+        created.append("root")
+        return _WarmRoot(leaf=leaf)
+
+    def _pair(leaf: _WarmLeaf, root: _WarmRoot) -> _WarmPair:
+        created.append("pair")
+        return _WarmPair(leaf=leaf, root=root)
+
+    class G(Group):
+        pair = providers.Factory(creator=_pair, scope=Scope.APP, cache=True)
+        root = providers.Factory(creator=_root, scope=Scope.APP)  # transient: not warmed, passed through
+        leaf = providers.Factory(creator=_leaf, scope=Scope.APP, cache=True)
+        request_leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.REQUEST, bound_type=None, cache=True)
+
+    app = Container(groups=[G])
+    report = app.warm_up()
+    assert (report.providers, report.levels) == (2, 2)
+    assert report.seconds >= 0
+    assert created == ["leaf", "root", "pair"]
+    assert app.cache_registry.cached_count() == report.providers  # REQUEST waits for its own container
+    assert app.resolve(_WarmPair).leaf is app.resolve(_WarmLeaf)
+
+
+def test_warm_up_runs_a_level_concurrently_on_the_executor() -> None:
+    # Two independent singletons that each wait for the other to start: only a concurrent level
+    # finishes. Their dependent is created after both, in the next level.
+    both_started = threading.Barrier(2, timeout=5)
+
+    def _leaf() -> _WarmLeaf:
+        both_started.wait()
+        return _WarmLeaf()
+
+    def _root() -> _WarmRoot:
+        both_started.wait()
+        return _WarmRoot(leaf=_WarmLeaf())
+
+    class G(Group):
+        leaf = providers.Factory(creator=_leaf, scope=Scope.APP, cache=True)
+        root = providers.Factory(creator=_root, scope=Scope.APP, cache=True)
+        pair = providers.Factory(creator=_WarmPair, scope=Scope.APP, cache=True)
+
+    app = Container(groups=[G])
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        report = app.warm_up(executor=executor)
+    assert (report.providers, report.levels) == (3, 2)
+    assert app.resolve(_WarmPair).root is app.resolve(_WarmRoot)
+
+
+def test_warm_up_reaches_ancestor_scopes_and_rejects_unreachable_ones() -> None:
+    class G(Group):
+        app_leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.APP, cache=True)
+        request_root = providers.Factory(creator=_WarmRoot, scope=Scope.REQUEST, cache=True)
+
+    app = Container(groups=[G])
+    request = app.build_child_container(scope=Scope.REQUEST)
+    assert request.warm_up(scopes=[Scope.APP, Scope.REQUEST]).providers == len(G.get_providers())
+    assert app.cache_registry.cached_count() == 1
+    assert request.cache_registry.cached_count() == 1
+
+    with pytest.raises(exceptions.ScopeNotInitializedError):
+        app.warm_up(scopes=[Scope.REQUEST])
+    with pytest.raises(ScopeSkippedError):
+        request.warm_up(scopes=[Scope.SESSION])
+
+
+def test_warm_up_propagates_a_creator_error_and_stops() -> None:
+    def _fail() -> _WarmLeaf:
+        msg = "artifact missing"
+        raise RuntimeError(msg)
+
+    class G(Group):
+        leaf = providers.Factory(creator=_fail, scope=Scope.APP, cache=True)
+        pair = providers.Factory(creator=_WarmRoot, scope=Scope.APP, cache=True)
+
+    app = Container(groups=[G])
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor, pytest.raises(RuntimeError):
+        app.warm_up(executor=executor)
+    assert app.cache_registry.cached_count() == 0
+
+
+def test_warm_up_targets_a_cached_factory_subclass_as_eager_creation_does() -> None:
+    class _SubFactory(providers.Factory[_WarmLeaf]): ...
+
+    class G(Group):
+        leaf = _SubFactory(creator=_WarmLeaf, scope=Scope.APP, cache=True)
+
+    app = Container(groups=[G])
+    with pytest.raises(TypeError, match="_SubFactory") as resolved:
+        app.resolve(_WarmLeaf)
+    with pytest.raises(TypeError) as warmed:
+        app.warm_up()  # not skipped: it fails exactly as resolving it does
+    assert str(warmed.value) == str(resolved.value)
+
+
+async def test_close_async_concurrently_finalizes_a_level_together_and_dependents_first() -> None:
+    closed: list[str] = []
+    # Each of the two independent finalizers waits for the other to start: only a concurrent
+    # level finishes.
+    leaf_closing, other_closing = asyncio.Event(), asyncio.Event()
+
+    async def _close_leaf(_: _WarmLeaf) -> None:
+        leaf_closing.set()
+        await asyncio.wait_for(other_closing.wait(), timeout=5)
+        closed.append("leaf")
+
+    async def _close_other(_: _WarmRoot) -> None:
+        other_closing.set()
+        await asyncio.wait_for(leaf_closing.wait(), timeout=5)
+        closed.append("other")
+
+    async def _close_pair(_: _WarmPair) -> None:
+        closed.append("pair")
+
+    def _other() -> _WarmRoot:
+        return _WarmRoot(leaf=_WarmLeaf())
+
+    class G(Group):
+        leaf = providers.Factory(
+            creator=_WarmLeaf, scope=Scope.APP, cache=providers.CacheSettings(finalizer=_close_leaf)
+        )
+        other = providers.Factory(
+            creator=_other, scope=Scope.APP, cache=providers.CacheSettings(finalizer=_close_other)
+        )
+        pair = providers.Factory(
+            creator=_WarmPair, scope=Scope.APP, cache=providers.CacheSettings(finalizer=_close_pair)
+        )
+
+    app = Container(groups=[G])
+    app.resolve(_WarmPair)
+    await app.close_async(concurrently=True)
+    assert closed[0] == "pair"
+    assert sorted(closed[1:]) == ["leaf", "other"]
+    assert app.closed
+
+
+async def test_close_async_concurrently_groups_levels_once_per_registry_generation(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    grouped = 0
+    levels = DependencyGraph.levels
+
+    def _counting_levels(self: DependencyGraph, *args: typing.Any) -> typing.Any:  # noqa: ANN401
+        nonlocal grouped
+        grouped += 1
+        return levels(self, *args)
+
+    monkeypatch.setattr(DependencyGraph, "levels", _counting_levels)
+    app = Container(groups=[_PooledGroup])
+    for _ in range(3):
+        request = app.build_child_container(scope=Scope.REQUEST)
+        request.resolve(_WarmLeaf)
+        await request.close_async(concurrently=True)
+    assert grouped == 1
+
+    app.add_providers(providers.Factory(creator=lambda: "added", bound_type=str))
+    await app.build_child_container(scope=Scope.REQUEST).close_async(concurrently=True)
+    assert grouped == 2  # noqa: PLR2004  # the registry changed: its levels are grouped afresh
+
+
+async def test_close_async_times_out_a_finalizer_and_collects_every_error() -> None:
+    async def _hang(_: object) -> None:
+        await asyncio.sleep(10)
+
+    async def _fail(_: object) -> None:
+        msg = "pool already gone"
+        raise RuntimeError(msg)
+
+    class G(Group):
+        leaf = providers.Factory(creator=_WarmLeaf, scope=Scope.APP, cache=providers.CacheSettings(finalizer=_hang))
+        other = providers.Factory(
+            creator=_WarmPair, scope=Scope.APP, bound_type=None, cache=providers.CacheSettings(finalizer=_fail)
+        )
+        root = providers.Factory(creator=_WarmRoot, scope=Scope.APP, cache=True)
+
+    for concurrently in (False, True):
+        app = Container(groups=[G])
+        app.resolve(_WarmLeaf)
+        app.resolve_provider(G.other)
+        with pytest.raises(exceptions.FinalizerError) as exc:
+            await app.close_async(concurrently=concurrently, finalizer_timeout=0.01)
+        kinds = sorted(type(e).__name__ for e in exc.value.finalizer_errors)
+        assert kinds == sorted([asyncio.TimeoutError.__name__, "RuntimeError"])
+        assert app.closed
+
+
+@dataclasses.dataclass
+class _EagerConfig:
+    pass
+
+
+@dataclasses.dataclass
+class _EagerPool:
+    config: _EagerConfig
+
+
+@dataclasses.dataclass
+class _EagerSession:
+    pool: _EagerPool
+    user: int
+
+
+_eager_created: list[type] = []
+
+
+def _eager_config() -> _EagerConfig:
+    _eager_created.append(_EagerConfig)
+    return _EagerConfig()
+
+
+def _eager_pool(config: _EagerConfig) -> _EagerPool:
+    _eager_created.append(_EagerPool)
+    return _EagerPool(config)
+
+
+def _eager_session(pool: _EagerPool, user: int) -> _EagerSession:
+    _eager_created.append(_EagerSession)
+    return _EagerSession(pool, user)
+
+
+class _EagerGroup(Group):
+    # The dependent is registered first; creation still follows the dependencies.
+    pool = providers.Factory(creator=_eager_pool, scope=Scope.APP, cache=providers.CacheSettings(eager=True))
+    config = providers.Factory(creator=_eager_config, scope=Scope.APP, cache=providers.CacheSettings(eager=True))
+    user = providers.ContextProvider(scope=Scope.REQUEST, context_type=int)
+    session = providers.Factory(creator=_eager_session, scope=Scope.REQUEST, cache=providers.CacheSettings(eager=True))
+    lazy = providers.Factory(creator=_WarmLeaf, scope=Scope.REQUEST, cache=True)
+
+
+def test_eager_providers_are_created_in_dependency_order_when_the_root_is_built() -> None:
+    _eager_created.clear()
+    app = Container(groups=[_EagerGroup])
+    assert _eager_created == [_EagerConfig, _EagerPool]
+    assert app.cache_registry.cached_count() == 2  # noqa: PLR2004
+
+
+def test_eager_request_providers_are_created_with_each_child_and_pooled_reuse() -> None:
+    app = Container(groups=[_EagerGroup], child_pool_size=1)
+    _eager_created.clear()
+    request = app.build_child_container(scope=Scope.REQUEST, context={int: 7})
+    assert _eager_created == [_EagerSession]
+    assert request.cache_registry.cached_count() == 1  # the lazy provider waits for its first resolve
+    assert request.resolve(_EagerSession).user == 7  # noqa: PLR2004
+    request.close_sync()
+
+    again = app.build_child_container(scope=Scope.REQUEST, context={int: 8})
+    assert again is request
+    assert again.resolve(_EagerSession).user == 8  # noqa: PLR2004
+    assert _eager_created == [_EagerSession, _EagerSession]
+
+
+def test_add_providers_creates_the_roots_new_eager_providers() -> None:
+    _eager_created.clear()
+    app = Container()
+    app.add_providers(*_EagerGroup.get_providers())
+    assert _eager_created == [_EagerConfig, _EagerPool]
+    app.add_providers(
+        providers.Factory(
+            creator=_WarmLeaf, scope=Scope.APP, bound_type=None, cache=providers.CacheSettings(eager=True)
+        )
+    )
+    assert app.cache_registry.cached_count() == 3  # noqa: PLR2004
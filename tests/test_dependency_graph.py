@@ -1,5 +1,7 @@
 """Event-stream tests for ``DependencyGraph.walk`` — the module's test surface is the event SEQUENCE."""
 
+import itertools
+
 from modern_di import Container, Scope
 from modern_di.dependency_graph import (
     Cycle,
@@ -184,6 +186,83 @@ def test_walk_dangling_dep_emits_dependencies_error() -> None:
     assert not any(isinstance(e, Edge) for e in events)
 
 
+# One strongly connected component holding two cycles that share `TriB` (A <-> B, B <-> C), and a
+# separate two-node cycle (D <-> E).
+class TriA:
+    def __init__(self, b: "TriB") -> None: ...
+
+
+class TriB:
+    def __init__(self, a: TriA, c: "TriC") -> None: ...
+
+
+class TriC:
+    def __init__(self, b: TriB) -> None: ...
+
+
+class PairD:
+    def __init__(self, e: "PairE") -> None: ...
+
+
+class PairE:
+    def __init__(self, d: PairD) -> None: ...
+
+
+def test_walk_reports_each_cyclic_component_once() -> None:
+    class G(Group):
+        a = Factory(scope=Scope.APP, creator=TriA)
+        b = Factory(scope=Scope.APP, creator=TriB)
+        c = Factory(scope=Scope.APP, creator=TriC)
+        d = Factory(scope=Scope.APP, creator=PairD)
+        e = Factory(scope=Scope.APP, creator=PairE)
+        leaf = Factory(scope=Scope.APP, creator=Leaf)
+
+    c = Container(scope=Scope.APP, groups=[G])
+    events = list(DependencyGraph().walk(c.providers_registry, c))
+    edges = {(e.parent.provider_id, e.dep.provider_id) for e in events if isinstance(e, Edge)}
+    cycles = [e.providers for e in events if isinstance(e, Cycle)]
+
+    assert [{p.display_name for p in ring} for ring in cycles] == [{"TriA", "TriB"}, {"PairD", "PairE"}]
+    for ring in cycles:  # each ring is a real closed path through the graph's edges
+        assert ring[0] is ring[-1]
+        assert all((x.provider_id, y.provider_id) in edges for x, y in itertools.pairwise(ring))
+
+
+def test_walk_reports_a_provider_depending_on_itself() -> None:
+    class Itself: ...
+
+    class G(Group):
+        alias = Alias(source_type=Itself, bound_type=Itself)
+
+    c = Container(scope=Scope.APP, groups=[G])
+    assert DependencyGraph().find_cycle_from(G.alias, c) == [G.alias, G.alias]
+
+
+def test_terminal_scope_memo_follows_each_chain_once() -> None:
+    class Terminal: ...
+
+    class Mid: ...
+
+    class Top: ...
+
+    class G(Group):
+        terminal = Factory(scope=Scope.REQUEST, creator=Terminal)
+        mid = Alias(source_type=Terminal, bound_type=Mid)
+        top = Alias(source_type=Mid, bound_type=Top)
+
+    c = Container(scope=Scope.APP, groups=[G])
+    graph = DependencyGraph()
+    memo: dict[int, Scope] = {}
+    assert graph.terminal_scope(G.mid, c, memo) == Scope.REQUEST
+    assert graph.terminal_scope(G.top, c, memo) == Scope.REQUEST  # stops at the memoized `mid`
+    assert memo == {
+        G.terminal.provider_id: Scope.REQUEST,
+        G.mid.provider_id: Scope.REQUEST,
+        G.top.provider_id: Scope.REQUEST,
+    }
+    assert graph.terminal_scope(G.top, c, memo) == Scope.REQUEST
+
+
 # A cycle that closes through the declaration-time `kwargs=` overlay.
 # It needs one type-matched edge to forward-reference: a `kwargs=` value is always a
 # backward reference to an already-built provider, so a pure-`kwargs=` cycle cannot
@@ -229,3 +308,44 @@ def test_build_cycle_error_rotates_to_minimum_provider_id() -> None:
 
     # Rotated to the minimum-provider_id node (`first`), not left seeded at `second`.
     assert error.cycle_path == ["RingFirst", "RingSecond", "RingFirst"]
+
+
+class Mid:
+    def __init__(self, leaf: Leaf) -> None: ...
+
+
+class Top:
+    def __init__(self, root: Root, mid: Mid) -> None: ...
+
+
+def test_levels_group_selected_providers_by_their_longest_selected_chain() -> None:
+    class G(Group):
+        top = Factory(scope=Scope.APP, creator=Top, cache=True)
+        root = Factory(scope=Scope.APP, creator=Root)  # unselected: passed through
+        mid = Factory(scope=Scope.APP, creator=Mid, cache=True)
+        leaf = Factory(scope=Scope.APP, creator=Leaf, cache=True)
+
+    c = Container(scope=Scope.APP, groups=[G])
+    levels = DependencyGraph().levels([G.top], c, lambda p: isinstance(p, Factory) and p.cache_settings is not None)
+    assert levels == [[G.leaf], [G.mid], [G.top]]
+
+
+def test_levels_put_independent_providers_together_and_skip_empty_selections() -> None:
+    class G(Group):
+        root = Factory(scope=Scope.APP, creator=Root)
+        mid = Factory(scope=Scope.APP, creator=Mid)
+        leaf = Factory(scope=Scope.APP, creator=Leaf)
+
+    c = Container(scope=Scope.APP, groups=[G])
+    graph = DependencyGraph()
+    assert graph.levels([G.root, G.mid], c, lambda p: p is not G.leaf) == [[G.root, G.mid]]
+    assert graph.levels([G.root], c, lambda _: False) == []
+
+
+def test_levels_ignore_a_cycle_back_edge() -> None:
+    class G(Group):
+        a = Factory(scope=Scope.APP, creator=CycA)
+        b = Factory(scope=Scope.APP, creator=CycB)
+
+    c = Container(scope=Scope.APP, groups=[G])
+    assert DependencyGraph().levels([G.a], c, lambda _: True) == [[G.b], [G.a]]
@@ -5,6 +5,9 @@ had their own walk to keep in sync. PR #308 unified them; there is no second imp
 to be at parity with.)
 """
 
+import dataclasses
+import typing
+
 import pytest
 
 from modern_di import Container, Scope, dependency_graph, exceptions
@@ -76,6 +79,77 @@ def test_validate_is_free_when_already_validated(monkeypatch: pytest.MonkeyPatch
     container.validate()  # short-circuited on the registry's validated flag -> no walk
 
 
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _Optional:
+    pass
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _Leaf:
+    optional: _Optional | None = None
+
+
+@dataclasses.dataclass(kw_only=True, slots=True)
+class _Root:
+    leaf: _Leaf
+
+
+class _Bystander: ...
+
+
+class _IncrementalGroup(Group):
+    leaf = Factory(scope=Scope.APP, creator=_Leaf)
+    root = Factory(scope=Scope.APP, creator=_Root)
+    bystander = Factory(scope=Scope.APP, creator=_Bystander)
+
+
+def _validate_recording_walk(container: Container, monkeypatch: pytest.MonkeyPatch) -> set[str]:
+    entered: set[str] = set()
+    walk = dependency_graph.DependencyGraph.walk
+
+    def _recording(*args: typing.Any) -> typing.Iterator[dependency_graph.Event]:  # noqa: ANN401
+        for event in walk(*args):
+            if isinstance(event, dependency_graph.NodeEntered) and isinstance(event.provider, Factory):
+                entered.add(event.provider.display_name)
+            yield event
+
+    with monkeypatch.context() as patch:
+        patch.setattr(dependency_graph.DependencyGraph, "walk", _recording)
+        container.validate()
+    return entered
+
+
+def test_validate_after_a_registration_walks_only_what_it_changed(monkeypatch: pytest.MonkeyPatch) -> None:
+    class _Late: ...
+
+    container = Container(scope=Scope.APP, groups=[_IncrementalGroup])
+    assert _validate_recording_walk(container, monkeypatch) == {"_Leaf", "_Root", "_Bystander"}
+
+    container.add_providers(Factory(scope=Scope.APP, creator=_Late))
+    assert _validate_recording_walk(container, monkeypatch) == {"_Late"}
+
+    container.add_providers(Factory(scope=Scope.APP, creator=_Optional))  # `_Leaf` looked it up and missed
+    assert _validate_recording_walk(container, monkeypatch) == {"_Optional", "_Leaf"}
+
+
+def test_validate_after_a_registration_reports_what_a_full_walk_would() -> None:
+    deeper = Factory(scope=Scope.REQUEST, creator=_Optional)  # wires into the APP-scoped `_Leaf`
+    container = Container(scope=Scope.APP, groups=[_IncrementalGroup])
+    container.validate()
+    container.add_providers(deeper)
+    with pytest.raises(exceptions.ValidationFailedError) as incremental:
+        container.validate()
+
+    fresh = Container(scope=Scope.APP, groups=[_IncrementalGroup])
+    fresh.add_providers(deeper)
+    with pytest.raises(exceptions.ValidationFailedError) as full:
+        fresh.validate()
+    assert str(incremental.value) == str(full.value)
+    assert [type(e) for e in incremental.value.errors] == [exceptions.InvalidScopeDependencyError]
+    # Nothing clean to build on after a failed walk: the next one covers the whole graph again.
+    assert container.providers_registry.changed_since_validation() is None
+
+
 def test_runtime_guard_converts_unvalidated_cycle() -> None:
     class G(Group):
         a = Factory(scope=Scope.APP, creator=_A)
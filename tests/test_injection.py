@@ -0,0 +1,143 @@
+import contextvars
+import inspect
+import typing
+
+import pytest
+
+from modern_di import Container, Group, Scope, exceptions, inject, providers
+from modern_di.integrations import from_di, is_injected
+
+
+class _Settings:
+    pass
+
+
+class _Session:
+    pass
+
+
+class _Deps(Group):
+    settings = providers.Factory(creator=_Settings, scope=Scope.APP, cache=True)
+    session = providers.Factory(creator=_Session, scope=Scope.REQUEST)
+
+
+def test_inject_resolves_marked_parameters_positionally() -> None:
+    app = Container(groups=[_Deps])
+
+    @inject(app)
+    def job(name: str, settings: typing.Annotated[_Settings, from_di(_Settings)]) -> tuple[str, _Settings]:
+        return name, settings
+
+    assert job("nightly") == ("nightly", app.resolve(_Settings))
+    assert list(inspect.signature(job).parameters) == ["name"]
+    assert is_injected(job)
+
+
+def test_inject_by_keyword_keeps_arguments_the_caller_passed() -> None:
+    app = Container(groups=[_Deps])
+
+    @inject(app)
+    def job(
+        settings: typing.Annotated[_Settings, from_di(_Settings)],
+        *,
+        name: str,
+        other: typing.Annotated[_Settings, from_di(_Deps.settings)],
+    ) -> tuple[_Settings, str, _Settings]:
+        return settings, name, other
+
+    explicit = _Settings()
+    resolved = app.resolve(_Settings)
+    assert job(name="a") == (resolved, "a", resolved)
+    assert job(settings=explicit, name="b") == (explicit, "b", resolved)
+    assert job(name="c", other=explicit) == (resolved, "c", explicit)
+
+
+def test_inject_maps_positional_arguments_past_a_leading_marker() -> None:
+    app = Container(groups=[_Deps])
+
+    @inject(app)
+    def job(
+        settings: typing.Annotated[_Settings, from_di(_Settings)], name: str, *rest: str, retries: int = 0
+    ) -> tuple[_Settings, str, tuple[str, ...], int]:
+        return settings, name, rest, retries
+
+    resolved, explicit = app.resolve(_Settings), _Settings()
+    assert list(inspect.signature(job).parameters) == ["name", "rest", "retries"]
+    assert job("nightly") == (resolved, "nightly", (), 0)
+    assert job("nightly", "a", "b", retries=2) == (resolved, "nightly", ("a", "b"), 2)
+    assert job("nightly", settings=explicit) == (explicit, "nightly", (), 0)
+    assert job(name="weekly") == (resolved, "weekly", (), 0)
+
+
+async def test_inject_wraps_a_coroutine_function_from_a_container_getter() -> None:
+    current: contextvars.ContextVar[Container] = contextvars.ContextVar("current")
+    app = Container(groups=[_Deps])
+
+    @inject(current.get)
+    async def handle(session: typing.Annotated[_Session, from_di(_Deps.session)]) -> _Session:
+        return session
+
+    assert inspect.iscoroutinefunction(handle)
+    for _ in range(2):
+        request = app.build_child_container(scope=Scope.REQUEST)
+        current.set(request)
+        first, second = await handle(), await handle()
+        assert isinstance(first, _Session)
+        assert first is not second
+
+
+def test_inject_rebinds_after_a_tree_wide_override() -> None:
+    app = Container(groups=[_Deps])
+
+    @inject(app)
+    def job(settings: typing.Annotated[_Settings, from_di(_Settings)]) -> _Settings:
+        return settings
+
+    job()
+    replacement = _Settings()
+    app.override(_Deps.settings, replacement)
+    assert job() is replacement
+
+
+def test_inject_raises_for_an_unregistered_type() -> None:
+    @inject(Container())
+    def job(settings: typing.Annotated[_Settings, from_di(_Settings)]) -> None:
+        pass  # pragma: no cover
+
+    with pytest.raises(exceptions.ProviderNotRegisteredError):
+        job()
+
+
+def test_inject_reopens_a_closed_container() -> None:
+    app = Container(groups=[_Deps])
+
+    @inject(app)
+    def job(settings: typing.Annotated[_Settings, from_di(_Settings)]) -> _Settings:
+        return settings
+
+    app.open()
+    app.close_sync()
+    with pytest.warns(exceptions.ContainerClosedWarning):
+        assert isinstance(job(), _Settings)
+
+
+def _recurse() -> _Settings:
+    raise RecursionError
+
+
+def test_inject_lets_a_recursion_error_that_is_not_a_cycle_propagate() -> None:
+    class G(Group):
+        settings = providers.Factory(creator=_recurse)
+
+    @inject(Container(groups=[G]))
+    def job(settings: typing.Annotated[_Settings, from_di(_Settings)]) -> None:
+        pass  # pragma: no cover
+
+    @inject(Container(groups=[G]))
+    def leading(settings: typing.Annotated[_Settings, from_di(_Settings)], name: str) -> None:
+        pass  # pragma: no cover
+
+    with pytest.raises(RecursionError):
+        job()
+    with pytest.raises(RecursionError):
+        leading("nightly")
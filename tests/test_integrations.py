@@ -2,9 +2,12 @@ import subprocess
 import sys
 import typing
 
-from modern_di import Container, Group, Scope, providers
+import pytest
+
+from modern_di import Container, Group, Scope, exceptions, providers
 from modern_di.integrations import (
     ConnectionMatch,
+    Injector,
     Marker,
     bind,
     classify_connection,
@@ -14,6 +17,7 @@ from modern_di.integrations import (
     parse_markers,
     resolve_markers,
 )
+from modern_di.registries.providers_registry import ProvidersRegistry
 
 
 class _Request:
@@ -172,3 +176,94 @@ def test_parse_markers_ignores_annotated_metadata_that_is_not_a_marker() -> None
         pass  # pragma: no cover
 
     assert parse_markers(handler) == {}
+
+
+class _Handle:
+    pass
+
+
+class _Injected(Group):
+    service = providers.Factory(creator=_Service, scope=Scope.APP, cache=True)
+    handle = providers.Factory(creator=_Handle, scope=Scope.REQUEST)
+
+
+def _handler(
+    service: typing.Annotated[_Service, Marker(_Service)],
+    handle: typing.Annotated[_Handle, Marker(_Injected.handle)],
+) -> None:
+    pass  # pragma: no cover
+
+
+def test_parse_markers_returns_an_injector_bound_once_per_registry_generation() -> None:
+    injector = parse_markers(_handler)
+    assert isinstance(injector, Injector)
+    app = Container(groups=[_Injected])
+    request = app.build_child_container(scope=Scope.REQUEST)
+
+    first = resolve_markers(request, injector)
+    binding = injector._binding
+    second = injector.resolve(request)
+
+    assert injector._binding is binding
+    assert first["service"] is second["service"] is app.resolve(_Service)
+    assert isinstance(first["handle"], _Handle)
+    assert first["handle"] is not second["handle"]
+
+    replacement = _Service()
+    app.override(_Injected.service, replacement)  # moves the generation: the injector rebinds
+    assert injector.resolve(request)["service"] is replacement
+    assert injector._binding is not binding
+
+
+def test_injector_rebinds_for_another_container_tree() -> None:
+    injector = parse_markers(_handler)
+    first = Container(groups=[_Injected])
+    second = Container(groups=[_Injected])
+
+    assert injector.resolve(first.build_child_container(scope=Scope.REQUEST))["service"] is first.resolve(_Service)
+    assert injector.resolve(second.build_child_container(scope=Scope.REQUEST))["service"] is second.resolve(_Service)
+
+
+def test_injector_sees_a_local_override_through_the_resolvers_guard() -> None:
+    injector = parse_markers(_handler)
+    request = Container(groups=[_Injected]).build_child_container(scope=Scope.REQUEST)
+    injector.resolve(request)
+
+    replacement = _Handle()
+    request.override(_Injected.handle, replacement, local=True)
+    assert injector.resolve(request)["handle"] is replacement
+
+
+def test_injector_with_an_unregistered_type_raises_resolves_own_error() -> None:
+    injector = parse_markers(_handler)
+
+    with pytest.raises(exceptions.ProviderNotRegisteredError):
+        injector.resolve(Container().build_child_container(scope=Scope.REQUEST))
+
+
+def test_injector_reopens_a_closed_container() -> None:
+    injector = parse_markers(_handler)
+    request = Container(groups=[_Injected]).build_child_container(scope=Scope.REQUEST)
+    request.close_sync()
+
+    with pytest.warns(exceptions.ContainerClosedWarning):
+        assert isinstance(injector.resolve(request)["handle"], _Handle)
+    assert not request.closed
+
+
+def _recurse() -> _Service:
+    raise RecursionError
+
+
+def test_injector_lets_a_recursion_error_that_is_not_a_cycle_propagate(monkeypatch: pytest.MonkeyPatch) -> None:
+    class G(Group):
+        service = providers.Factory(creator=_recurse)
+
+    injector = Injector({"service": Marker(_Service)})
+    container = Container(groups=[G])
+    with pytest.raises(RecursionError):
+        injector.resolve(container)
+
+    monkeypatch.setattr(ProvidersRegistry, "resolver_for", lambda *_: _recurse())
+    with pytest.raises(RecursionError):
+        Injector({"service": Marker(_Service)}).resolve(container)  # while compiling
@@ -0,0 +1,128 @@
+import asyncio
+import dataclasses
+import typing
+
+import pytest
+
+from modern_di import Container, Group, Reaper, Scope, exceptions, providers
+
+
+@dataclasses.dataclass
+class Session:
+    closed: bool = False
+
+
+_gate = asyncio.Event()
+
+
+async def _close_session(session: Session) -> None:
+    session.closed = True
+
+
+async def _close_after_gate(session: Session) -> None:
+    await _gate.wait()
+    session.closed = True
+
+
+def _fail(_: Session) -> None:
+    msg = "flush failed"
+    raise ValueError(msg)
+
+
+class RequestGroup(Group):
+    session = providers.Factory(
+        scope=Scope.REQUEST, creator=Session, cache=providers.CacheSettings(finalizer=_close_session)
+    )
+    gated = providers.Factory(
+        scope=Scope.REQUEST,
+        creator=Session,
+        cache=providers.CacheSettings(finalizer=_close_after_gate),
+        bound_type=None,
+    )
+    failing = providers.Factory(
+        scope=Scope.REQUEST, creator=Session, cache=providers.CacheSettings(finalizer=_fail), bound_type=None
+    )
+
+
+async def test_close_with_a_reaper_returns_before_the_finalizers_run() -> None:
+    app = Container(groups=[RequestGroup])
+    async with Reaper() as reaper:
+        request = app.build_child_container(scope=Scope.REQUEST)
+        session = request.resolve_provider(RequestGroup.session)
+
+        await request.close_async(reaper=reaper)
+
+        assert request.closed
+        assert request.cache_registry.cached_count() == 0
+        assert not session.closed
+    assert session.closed
+
+
+async def test_reaper_sends_finalizer_errors_to_the_sink_and_keeps_reaping() -> None:
+    errors: list[exceptions.FinalizerError] = []
+    app = Container(groups=[RequestGroup])
+    async with Reaper(error_sink=errors.append) as reaper:
+        failing = app.build_child_container(scope=Scope.REQUEST)
+        failing.resolve_provider(RequestGroup.failing)
+        healthy = app.build_child_container(scope=Scope.REQUEST)
+        session = healthy.resolve_provider(RequestGroup.session)
+
+        await failing.close_async(reaper=reaper)
+        await healthy.close_async(reaper=reaper)
+
+    assert [type(e) for e in errors[0].finalizer_errors] == [ValueError]
+    assert session.closed
+
+
+async def test_reaper_reports_to_the_loop_without_a_sink_and_survives_a_failing_sink() -> None:
+    reported: list[dict[str, typing.Any]] = []
+    asyncio.get_running_loop().set_exception_handler(lambda _, context: reported.append(context))
+
+    def _broken_sink(_: exceptions.FinalizerError) -> None:
+        msg = "sink down"
+        raise RuntimeError(msg)
+
+    app = Container(groups=[RequestGroup])
+    for sink in (None, _broken_sink):
+        reaper = Reaper(error_sink=sink)
+        request = app.build_child_container(scope=Scope.REQUEST)
+        request.resolve_provider(RequestGroup.failing)
+        await request.close_async(reaper=reaper)  # starts the reaper on first use
+        await reaper.aclose()
+
+    assert [type(context["exception"]) for context in reported] == [exceptions.FinalizerError, RuntimeError]
+
+
+async def test_a_full_reaper_makes_the_next_close_wait() -> None:
+    _gate.clear()
+    app = Container(groups=[RequestGroup])
+    reaper = Reaper(max_pending=1, batch_size=1)
+    requests = [app.build_child_container(scope=Scope.REQUEST) for _ in range(3)]
+    for request in requests:
+        request.resolve_provider(RequestGroup.gated)
+
+    await requests[0].close_async(reaper=reaper)  # taken by the background task, which blocks on the gate
+    await asyncio.sleep(0)
+    await requests[1].close_async(reaper=reaper)  # fills the queue
+    third = asyncio.ensure_future(requests[2].close_async(reaper=reaper))
+    await asyncio.sleep(0)
+    assert not third.done()
+
+    _gate.set()
+    await third
+    await reaper.aclose()
+    await reaper.aclose()  # stopped: a no-op
+
+
+async def test_reaper_finalizes_a_detached_cache_level_by_level() -> None:
+    app = Container(groups=[RequestGroup])
+    async with Reaper() as reaper:
+        request = app.build_child_container(scope=Scope.REQUEST)
+        session = request.resolve_provider(RequestGroup.session)
+        await request.close_async(reaper=reaper, concurrently=True, finalizer_timeout=1.0)
+    assert session.closed
+
+
+def test_reaper_needs_no_running_loop_to_construct() -> None:
+    with pytest.raises(RuntimeError):
+        Reaper().start()  # the background task needs one
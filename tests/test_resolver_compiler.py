@@ -15,10 +15,13 @@ import typing
 
 import pytest
 
-from modern_di import Container, Group, Scope, exceptions, providers
+from modern_di import Container, Group, Scope, exceptions, inject, providers
+from modern_di import resolver_compiler as resolver_compiler_module
+from modern_di.integrations import from_di
 from modern_di.providers import ContextProvider
+from modern_di.providers.abstract import AbstractProvider
 from modern_di.registries.providers_registry import ProvidersRegistry
-from modern_di.resolver_compiler import _can_call_positionally
+from modern_di.resolver_compiler import _can_call_positionally, compile_in_scope_resolver
 from modern_di.wiring import WiringPlan
 
 
@@ -125,11 +128,13 @@ _CHAIN: tuple[type, ...] = (_L0, _L1, _L2, _L3, _L4, _L5)
 _CALLS_PER_NODE = 2
 
 
-def _warm_chain(depth: int) -> "tuple[Container, providers.Factory[typing.Any]]":
+def _warm_chain(depth: int, *, production: bool = False) -> "tuple[Container, providers.Factory[typing.Any]]":
     """Build and warm a transient chain of ``depth`` nodes; return it and its root provider."""
     members = {f"p{i}": providers.Factory(creator=node, scope=Scope.APP) for i, node in enumerate(_CHAIN[:depth])}
     group = _pytypes.new_class(f"_Chain{depth}", (Group,), exec_body=lambda ns: ns.update(members))
     container = Container(scope=Scope.APP, groups=[group])
+    if production:
+        container.validate(production=True)
     root = members[f"p{depth - 1}"]
     container.resolve_provider(root)  # compile the whole graph before measuring
     return container, root
@@ -235,14 +240,25 @@ def _arity_group(
 # per rung and regresses independently. These parametrize over the rungs the ladder compiles.
 
 
+def _override_subject(container: Container, *, local: bool) -> Container:
+    """Return the container an override test overrides and resolves from: the root, or a layered child.
+
+    A tree-wide override is compiled into the resolvers, so only a REQUEST child's local override
+    layer still runs each closure's own front-guard.
+    """
+    return container.build_child_container(scope=Scope.REQUEST) if local else container
+
+
+@pytest.mark.parametrize("local", [False, True])
 @pytest.mark.parametrize("arity", [0, 1, 2])
-def test_arity_rung_front_guards_the_override(arity: int) -> None:
+def test_arity_rung_front_guards_the_override(arity: int, local: bool) -> None:
     group = _arity_group(arity)
     container = Container(scope=Scope.APP, groups=[group])
     container.open()
     sentinel = object()
-    container.override(group.target, sentinel)
-    assert container.resolve_provider(group.target) is sentinel
+    subject = _override_subject(container, local=local)
+    subject.override(group.target, sentinel, local=local)
+    assert subject.resolve_provider(group.target) is sentinel
 
 
 @pytest.mark.parametrize("arity", [0, 1, 2])
@@ -458,7 +474,8 @@ def test_first_resolve_does_not_reintrospect_creator(monkeypatch: pytest.MonkeyP
 # ---------------------------------------------------------------------------
 
 
-def test_resolve_costs_exactly_one_resolver_frame_per_node() -> None:
+@pytest.mark.parametrize("production", [False, True])
+def test_resolve_costs_exactly_one_resolver_frame_per_node(production: bool) -> None:
     # Every compiled resolver front-guards its own override, navigates its own scope and
     # inlines its own kwargs build + creator call. That duplication is deliberate: any of it
     # extracted into a shared helper would cost one Python frame *per resolved node*, which
@@ -466,8 +483,9 @@ def test_resolve_costs_exactly_one_resolver_frame_per_node() -> None:
     #
     # Measured as a difference between two chain depths, so the fixed cost of the harness
     # and of `resolve_provider` itself cancels and only the per-node slope is asserted.
-    shallow_container, shallow_root = _warm_chain(2)
-    deep_container, deep_root = _warm_chain(6)
+    # The production profile's in-scope resolvers are copies too, and must hold the same budget.
+    shallow_container, shallow_root = _warm_chain(2, production=production)
+    deep_container, deep_root = _warm_chain(6, production=production)
 
     shallow = _count_python_calls(lambda: shallow_container.resolve_provider(shallow_root))
     deep = _count_python_calls(lambda: deep_container.resolve_provider(deep_root))
@@ -479,10 +497,58 @@ def test_resolve_costs_exactly_one_resolver_frame_per_node() -> None:
     )
 
 
-def test_alias_hop_costs_exactly_one_resolver_frame() -> None:
+class _InjectedLeaf: ...
+
+
+class _InjectedLeaves(Group):
+    leaf = providers.Factory(creator=_InjectedLeaf, scope=Scope.APP)
+
+
+def test_inject_costs_two_frames_plus_one_resolver_frame_per_parameter() -> None:
+    # `inject`'s wrapper hands the call to `_Injection.arguments`, which checks the binding
+    # inline and calls each parameter's compiled resolver directly -- no `Injector.resolve`,
+    # `resolve_dependency` or `resolve`/`resolve_provider` frame per parameter. The leaf's
+    # creator is a class without a Python `__init__`, so its resolver is exactly one frame.
+    container = Container(scope=Scope.APP, groups=[_InjectedLeaves])
+
+    def plain(a: _InjectedLeaf, b: _InjectedLeaf, c: _InjectedLeaf) -> None: ...
+
+    @inject(container)
+    def injected(
+        a: typing.Annotated[_InjectedLeaf, from_di(_InjectedLeaf)],
+        b: typing.Annotated[_InjectedLeaf, from_di(_InjectedLeaf)],
+        c: typing.Annotated[_InjectedLeaf, from_di(_InjectedLeaves.leaf)],
+    ) -> None: ...
+
+    injected()  # bind and compile before measuring
+    leaf = _InjectedLeaf()
+    baseline = _count_python_calls(lambda: plain(leaf, leaf, leaf))
+    calls = _count_python_calls(lambda: injected())  # noqa: PLW0108 - one lambda frame, as in the baseline
+
+    assert calls - baseline == 2 + 3, (
+        f"`inject` costs {calls - baseline} Python calls for three parameters, expected 5 "
+        f"on Python {sys.version_info.major}.{sys.version_info.minor}. A helper between the wrapper "
+        f"and the resolvers costs one frame per call or per parameter -- see architecture/performance.md."
+    )
+
+
+def test_resolver_handle_costs_one_frame_in_front_of_the_resolver() -> None:
+    # `Container.resolver` returns a closure that checks the generation and `closed`, then calls
+    # the compiled resolver it holds: `resolve`'s lookups are paid once, at creation.
+    container = Container(scope=Scope.APP, groups=[_InjectedLeaves])
+    handle = container.resolver(_InjectedLeaf)
+    resolver = container.providers_registry.resolver_for(_InjectedLeaves.leaf)
+    handle()
+
+    assert _count_python_calls(handle) == _count_python_calls(lambda: resolver(container))
+
+
+@pytest.mark.parametrize("frozen", [False, True])
+def test_alias_hop_costs_exactly_one_resolver_frame(frozen: bool) -> None:
     # An alias forwards to its source's compiled resolver by direct reference, like every
     # Factory dependency. Routing through `_find_source` + `find_provider` +
     # `resolve_provider` instead costs four frames per hop -- see architecture/performance.md.
+    # A frozen registry binds the source at compile time; that variant must hold the same budget.
     class _Source: ...
 
     class _Iface: ...
@@ -496,6 +562,9 @@ def test_alias_hop_costs_exactly_one_resolver_frame() -> None:
 
     direct = Container(scope=Scope.APP, groups=[_Direct])
     aliased = Container(scope=Scope.APP, groups=[_Aliased])
+    if frozen:
+        direct.freeze()
+        aliased.freeze()
     direct.resolve_provider(_Direct.source)  # compile before measuring
     aliased.resolve_provider(_Aliased.iface)
 
@@ -527,10 +596,11 @@ def test_overridden_alias_compiles_nothing_of_its_source() -> None:
     assert list(container.providers_registry._resolvers) == [_G.iface.provider_id]
 
 
-def test_no_compiled_resolver_closes_over_its_registry() -> None:
+@pytest.mark.parametrize("frozen", [False, True])
+def test_no_compiled_resolver_closes_over_its_registry(frozen: bool) -> None:
     # A resolver that captures its registry forms a cycle with the memo holding it, so the
     # registry is reclaimable only by cyclic GC. Every closure reads its registries off the
-    # container argument instead.
+    # container argument instead -- frozen variants included.
     class _Src: ...
 
     class _Iface: ...
@@ -540,6 +610,8 @@ def test_no_compiled_resolver_closes_over_its_registry() -> None:
         iface = providers.Alias(source_type=_Src, bound_type=_Iface)
 
     container = Container(scope=Scope.APP, groups=[_G])
+    if frozen:
+        container.freeze()
     container.resolve(_Iface)
     registry = container.providers_registry
 
@@ -568,7 +640,11 @@ def test_positional_path_selects_the_arity_specialised_closure(arity: int, expec
     assert typing.cast("_pytypes.FunctionType", resolver).__code__.co_name == expected
 
 
-def test_cached_resolver_has_no_cell_on_the_warm_path() -> None:
+@pytest.mark.parametrize(
+    ("frozen", "pinned", "in_scope"),
+    [(False, False, False), (True, False, False), (False, True, False), (False, False, True)],
+)
+def test_cached_resolver_has_no_cell_on_the_warm_path(frozen: bool, pinned: bool, in_scope: bool) -> None:
     # The cold-miss thunk must not close over `target`: a closure promotes it to a cell, so
     # MAKE_CELL runs in the resolver's prologue on every call -- including the warm hit that
     # returns early, and the override hit that never reaches `target` at all. Measured at ~18 ns
@@ -576,11 +652,888 @@ def test_cached_resolver_has_no_cell_on_the_warm_path() -> None:
     class G(Group):
         cached = providers.Factory(creator=_A, scope=Scope.APP, cache=True)
 
-    container = Container(scope=Scope.APP, groups=[G])
-    resolver = container.providers_registry.resolver_for(G.cached)
+    container = Container(scope=Scope.APP, groups=[G], pin_singletons=pinned)
+    if frozen:
+        container.freeze()
+    if in_scope:
+        container.validate(production=True)
+    registry = container.providers_registry
+    resolver = registry.in_scope_resolver_for(G.cached) if in_scope else registry.resolver_for(G.cached)
     code = typing.cast("_pytypes.FunctionType", resolver).__code__
 
     assert code.co_cellvars == (), (
         f"the cached-factory resolver grew cell variables {code.co_cellvars}; "
         f"a MAKE_CELL now runs on every warm hit -- see architecture/performance.md"
     )
+
+
+# ---------------------------------------------------------------------------
+# Production profile — in-scope resolvers for same-scope dependencies
+# ---------------------------------------------------------------------------
+
+
+@dataclasses.dataclass(slots=True)
+class _CycX:
+    y: "_CycY"
+
+
+@dataclasses.dataclass(slots=True)
+class _CycY:
+    x: _CycX
+
+
+def _in_scope_resolver(group: typing.Any) -> "typing.Callable[[Container], typing.Any]":  # noqa: ANN401 - a runtime-built Group
+    """Return ``group.target``'s in-scope resolver from an open container under the production profile."""
+    container = Container(scope=Scope.APP, groups=[group])
+    container.validate(production=True)
+    return container.providers_registry.in_scope_resolver_for(group.target)
+
+
+@pytest.mark.parametrize(
+    ("arity", "expected"),
+    [(0, "resolve_in_scope_arity0"), (1, "resolve_in_scope_arity1"), (2, "resolve_in_scope_positional")],
+)
+def test_production_profile_hands_same_scope_dependencies_their_in_scope_resolver(arity: int, expected: str) -> None:
+    class _Holder:
+        def __init__(self, bag: _Bag) -> None:
+            self.bag = bag
+
+    group = _arity_group(arity)
+    holder = providers.Factory(creator=_Holder, scope=Scope.APP)
+    container = Container(scope=Scope.APP, groups=[group])
+    container.providers_registry.add_providers(holder)
+    container.validate(production=True)
+
+    assert isinstance(container.resolve_provider(holder).bag, _Bag)
+    resolver = container.providers_registry._in_scope_resolvers[group.target.provider_id]
+    assert container.providers_registry.in_scope_resolver_for(group.target) is resolver  # memoized
+    assert typing.cast("_pytypes.FunctionType", resolver).__code__.co_name == expected
+
+
+@pytest.mark.parametrize("local", [False, True])
+@pytest.mark.parametrize("arity", [0, 1, 2])
+def test_in_scope_rung_front_guards_the_override(arity: int, local: bool) -> None:
+    group = _arity_group(arity)
+    container = Container(scope=Scope.APP, groups=[group])
+    container.validate(production=True)
+    sentinel = object()
+    subject = _override_subject(container, local=local)
+    subject.override(group.target, sentinel, local=local)
+    assert container.providers_registry.in_scope_resolver_for(group.target)(subject) is sentinel
+
+
+@pytest.mark.parametrize("arity", [0, 1, 2])
+def test_in_scope_rung_raises_the_same_creator_call_error(arity: int) -> None:
+    # Same binding-failure creator as `test_arity_rung_wraps_a_creator_type_error`; the in-scope
+    # copy keeps the handler, so the rendered error must match the full resolver's word for word.
+    def _needs_one_more(*args: object, extra: object) -> _Bag:  # noqa: ARG001  # pragma: no cover
+        msg = "unreachable - binding fails before the body runs; that is the point"
+        raise AssertionError(msg)
+
+    params = [
+        inspect.Parameter(f"p{i}", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=t)
+        for i, t in enumerate([_P0, _P1, _P2][:arity])
+    ]
+    _needs_one_more.__signature__ = inspect.Signature(params, return_annotation=_Bag)  # ty: ignore[unresolved-attribute]
+    _needs_one_more.__annotations__ = {f"p{i}": t for i, t in enumerate([_P0, _P1, _P2][:arity])} | {"return": _Bag}
+
+    group = _arity_group(arity, creator=_needs_one_more)
+    container = Container(scope=Scope.APP, groups=[group])
+    with pytest.raises(exceptions.CreatorCallError) as full:
+        container.resolve_provider(group.target)
+    container.validate(production=True)
+    with pytest.raises(exceptions.CreatorCallError) as in_scope:
+        container.providers_registry.in_scope_resolver_for(group.target)(container)
+
+    assert str(in_scope.value) == str(full.value)
+
+
+@pytest.mark.parametrize("arity", [0, 1, 2])
+def test_in_scope_rung_reraises_a_type_error_from_inside_the_creator(arity: int) -> None:
+    params = ", ".join(f"p{i}: _P{i}" for i in range(arity))
+    ns: dict[str, typing.Any] = {"_P0": _P0, "_P1": _P1, "_P2": _P2, "_Bag": _Bag}
+    exec(f"def _c({params}) -> _Bag:\n    raise TypeError('from inside')", ns)  # noqa: S102
+
+    resolver = _in_scope_resolver(_arity_group(arity, creator=ns["_c"]))
+    with pytest.raises(TypeError, match="from inside") as exc:
+        resolver(Container(scope=Scope.APP))
+    assert not isinstance(exc.value, exceptions.CreatorCallError)
+
+
+@pytest.mark.parametrize("arity", [1, 2])
+def test_in_scope_rung_prepends_its_step_to_a_dependency_error(arity: int) -> None:
+    # A validated graph can still raise at runtime: a dependency's context value may be unset.
+    class _Ctx: ...
+
+    ns: dict[str, typing.Any] = {"_Ctx": _Ctx, "_Bag": _Bag}
+    deps = [f"_D{i}" for i in range(arity)]
+    for name in deps:
+        exec(f"class {name}:\n    def __init__(self, ctx: _Ctx) -> None: ...", ns)  # noqa: S102
+    params = ", ".join(f"p{i}: {name}" for i, name in enumerate(deps))
+    exec(f"def _c({params}) -> _Bag:\n    return _Bag(values=())", ns)  # noqa: S102
+    members: dict[str, typing.Any] = {
+        name.lower(): providers.Factory(creator=ns[name], scope=Scope.APP) for name in deps
+    }
+    members["ctx"] = providers.ContextProvider(scope=Scope.APP, context_type=_Ctx)
+    members["target"] = providers.Factory(creator=ns["_c"], scope=Scope.APP, bound_type=_Bag)
+    group = _pytypes.new_class(f"_CtxDeps{arity}", (Group,), exec_body=lambda gns: gns.update(members))
+
+    container = Container(scope=Scope.APP, groups=[group])
+    with pytest.raises(exceptions.ArgumentResolutionError) as full:
+        container.resolve_provider(group.target)
+    container.validate(production=True)
+    with pytest.raises(exceptions.ArgumentResolutionError) as in_scope:
+        container.providers_registry.in_scope_resolver_for(group.target)(container)
+
+    assert str(in_scope.value) == str(full.value)
+
+
+def test_in_scope_cached_resolver_shares_the_container_cache() -> None:
+    class _Holder:
+        def __init__(self, a: _A) -> None:
+            self.a = a
+
+    class G(Group):
+        cached = providers.Factory(creator=_A, scope=Scope.APP, cache=True)
+        holder = providers.Factory(creator=_Holder, scope=Scope.APP)
+
+    container = Container(scope=Scope.APP, groups=[G])
+    container.validate(production=True)
+    sentinel = object()
+    container.override(G.cached, sentinel)
+    assert container.resolve_provider(G.holder).a is sentinel
+    container.reset_override()
+    request = _override_subject(container, local=True)
+    request.override(G.cached, sentinel, local=True)
+    assert container.providers_registry.in_scope_resolver_for(G.cached)(request) is sentinel
+
+    first = container.resolve_provider(G.holder).a  # cold: the in-scope resolver creates it
+    assert container.resolve_provider(G.holder).a is first  # warm hit
+    assert container.resolve_provider(G.cached) is first  # the full resolver reads the same item
+
+
+def test_in_scope_resolver_is_not_compiled_where_it_saves_nothing() -> None:
+    class _Kw:
+        def __init__(self, *, a: _A) -> None: ...
+
+    class _Missing: ...
+
+    class _Broken:
+        def __init__(self, missing: _Missing) -> None: ...
+
+    class G(Group):
+        a = providers.Factory(creator=_A, scope=Scope.APP)
+        kw = providers.Factory(creator=_Kw, scope=Scope.APP)
+        pinned = providers.Factory(creator=_B, scope=Scope.APP, cache=True)
+        broken = providers.Factory(creator=_Broken, scope=Scope.APP)
+        iface = providers.Alias(source_type=_A, bound_type=_C)
+
+    container = Container(scope=Scope.APP, groups=[G], pin_singletons=True)
+    registry = container.providers_registry
+    for provider in (G.kw, G.pinned, G.broken, G.iface):
+        assert compile_in_scope_resolver(provider, registry) is None
+    registry._production = True
+    assert registry.in_scope_resolver_for(G.kw) is registry.resolver_for(G.kw)
+
+
+def test_in_scope_resolver_routes_a_back_edge_through_the_runtime() -> None:
+    # Unreachable on a validated graph; forced here, a cycle must still end in the usual error.
+    class G(Group):
+        x = providers.Factory(creator=_CycX, scope=Scope.APP)
+        y = providers.Factory(creator=_CycY, scope=Scope.APP)
+
+    container = Container(scope=Scope.APP, groups=[G])
+    container.providers_registry._production = True
+    with pytest.raises(exceptions.CircularDependencyError):
+        container.resolve_provider(G.x)
+
+
+# ---------------------------------------------------------------------------
+# Fused hot subgraphs — one resolver frame for a whole transient subgraph
+# ---------------------------------------------------------------------------
+
+
+@dataclasses.dataclass(slots=True)
+class _Bottom:
+    pass
+
+
+@dataclasses.dataclass(slots=True)
+class _Left:
+    bottom: _Bottom
+
+
+@dataclasses.dataclass(slots=True)
+class _Right:
+    bottom: _Bottom
+
+
+@dataclasses.dataclass(slots=True)
+class _Top:
+    left: _Left
+    right: _Right
+
+
+def _diamond(*, hot: bool, top_scope: Scope = Scope.APP, shared: bool = False) -> typing.Any:  # noqa: ANN401
+    members = {
+        "bottom": providers.Factory(creator=_Bottom, scope=top_scope, shared=shared),
+        "left": providers.Factory(creator=_Left, scope=top_scope),
+        "right": providers.Factory(creator=_Right, scope=top_scope),
+        "top": providers.Factory(creator=_Top, scope=top_scope, hot=hot),
+    }
+    return _pytypes.new_class("_Diamond", (Group,), exec_body=lambda ns: ns.update(members))
+
+
+def _hot_chain(depth: int) -> "tuple[Container, providers.Factory[typing.Any]]":
+    """`_warm_chain` with only its root marked hot."""
+    members = {
+        f"p{i}": providers.Factory(creator=node, scope=Scope.APP, hot=i == depth - 1)
+        for i, node in enumerate(_CHAIN[:depth])
+    }
+    group = _pytypes.new_class(f"_HotChain{depth}", (Group,), exec_body=lambda ns: ns.update(members))
+    container = Container(scope=Scope.APP, groups=[group])
+    root = members[f"p{depth - 1}"]
+    container.resolve_provider(root)
+    return container, root
+
+
+def test_fused_subgraph_costs_only_its_creators() -> None:
+    shallow_container, shallow_root = _hot_chain(2)
+    deep_container, deep_root = _hot_chain(6)
+
+    shallow = _count_python_calls(lambda: shallow_container.resolve_provider(shallow_root))
+    deep = _count_python_calls(lambda: deep_container.resolve_provider(deep_root))
+
+    resolver = deep_container.providers_registry.resolver_for(deep_root)
+    assert typing.cast("_pytypes.FunctionType", resolver).__code__.co_name == "resolve_fused"
+    assert (deep - shallow) == (6 - 2) * (_CALLS_PER_NODE - 1), "a fused node must cost its creator and nothing else"
+
+
+def test_fused_subgraph_creates_a_transient_diamond_once_per_use() -> None:
+    top = Container(scope=Scope.APP, groups=[_diamond(hot=True)]).resolve(_Top)
+    assert isinstance(top.left.bottom, _Bottom)
+    assert top.left.bottom is not top.right.bottom
+
+
+@pytest.mark.parametrize("local", [False, True])
+def test_fused_subgraph_honours_an_override_of_a_fused_node(local: bool) -> None:
+    # Compiled first: a tree-wide override must recompile the program that inlined the node, and a
+    # local layer must send the resolve down the per-node path.
+    group = _diamond(hot=True, top_scope=Scope.REQUEST)
+    request = Container(scope=Scope.APP, groups=[group]).build_child_container(scope=Scope.REQUEST)
+    request.resolve(_Top)
+    sentinel = _Bottom()
+    request.override(group.bottom, sentinel, local=local)
+    top = request.resolve(_Top)
+    assert top.left.bottom is sentinel
+    assert top.right.bottom is sentinel
+
+
+def test_fused_subgraph_navigates_and_reopens_its_target() -> None:
+    group = _diamond(hot=True)
+    app = Container(scope=Scope.APP, groups=[group])
+    request = app.build_child_container(scope=Scope.REQUEST)
+    app.close_sync()
+    with pytest.warns(exceptions.ContainerClosedWarning):
+        assert isinstance(request.resolve_provider(group.top), _Top)
+
+
+def test_fused_subgraph_calls_unfusable_dependencies_through_their_resolver() -> None:
+    class G(Group):
+        bottom = providers.Factory(creator=_Bottom, scope=Scope.APP, cache=True)
+        left = providers.Factory(creator=_Left, scope=Scope.APP)
+        right = providers.Factory(creator=_Right, scope=Scope.REQUEST)
+        top = providers.Factory(creator=_Top, scope=Scope.REQUEST, hot=True)
+
+    request = Container(scope=Scope.APP, groups=[G]).build_child_container(scope=Scope.REQUEST)
+    top = request.resolve(_Top)
+    assert top.left.bottom is top.right.bottom  # the cached bottom, through its own resolver
+    resolver = request.providers_registry.resolver_for(G.top)
+    assert typing.cast("_pytypes.FunctionType", resolver).__code__.co_name == "resolve_fused"
+
+
+def _one_more_than_parsed(*parsed: type) -> typing.Callable[..., typing.Any]:
+    """Build a creator whose parsed signature takes `parsed`, but whose real one also needs `extra`."""
+
+    def creator(*args: object, extra: object) -> object:  # noqa: ARG001  # pragma: no cover
+        msg = "unreachable - binding fails before the body runs"
+        raise AssertionError(msg)
+
+    params = [
+        inspect.Parameter(f"p{i}", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=t) for i, t in enumerate(parsed)
+    ]
+    creator.__signature__ = inspect.Signature(params)  # ty: ignore[unresolved-attribute]
+    creator.__annotations__ = {f"p{i}": t for i, t in enumerate(parsed)}
+    return creator
+
+
+@pytest.mark.parametrize("failing", ["bottom", "left", "top"])
+def test_fused_subgraph_raises_the_per_node_creator_call_error(failing: str) -> None:
+    parsed = {"bottom": (), "left": (_Bottom,), "top": (_Left, _Right)}[failing]
+
+    def build(*, hot: bool, shared: bool = False) -> Container:
+        group = _diamond(hot=hot, shared=shared)
+        provider = getattr(group, failing)
+        broken = providers.Factory(
+            creator=_one_more_than_parsed(*parsed),
+            scope=Scope.APP,
+            bound_type=provider.bound_type,
+            shared=provider.shared,
+        )
+        setattr(group, failing, broken)
+        container = Container(scope=Scope.APP)
+        container.providers_registry.add_providers(*(getattr(group, n) for n in ("bottom", "left", "right", "top")))
+        return container
+
+    with pytest.raises(exceptions.CreatorCallError) as per_node:
+        build(hot=False).resolve(_Top)
+    with pytest.raises(exceptions.CreatorCallError) as fused:
+        build(hot=True).resolve(_Top)
+    with pytest.raises(exceptions.CreatorCallError) as shared:
+        build(hot=False, shared=True).resolve(_Top)
+    overridden = build(hot=False, shared=True).build_child_container(scope=Scope.REQUEST)
+    overridden.override(providers.Factory(creator=_A), _A(), local=True)  # a layer: the per-node path, in the memo
+    with pytest.raises(exceptions.CreatorCallError) as tree:
+        overridden.resolve(_Top)
+
+    assert str(fused.value) == str(per_node.value)
+    assert str(shared.value) == str(per_node.value)
+    assert str(tree.value) == str(per_node.value)
+
+
+def test_fused_subgraph_prepends_its_ancestors_to_a_dependency_error() -> None:
+    class _Ctx: ...
+
+    @dataclasses.dataclass(slots=True)
+    class _NeedsCtx:
+        ctx: _Ctx
+
+    @dataclasses.dataclass(slots=True)
+    class _Mid:
+        needs: _NeedsCtx
+
+    @dataclasses.dataclass(slots=True)
+    class _Outer:
+        mid: _Mid
+
+    def build(*, hot: bool) -> Container:
+        class G(Group):
+            ctx = providers.ContextProvider(scope=Scope.APP, context_type=_Ctx)
+            needs = providers.Factory(creator=_NeedsCtx, scope=Scope.APP)  # kwargs path: a resolver step
+            mid = providers.Factory(creator=_Mid, scope=Scope.APP)
+            outer = providers.Factory(creator=_Outer, scope=Scope.APP, hot=hot)
+
+        return Container(scope=Scope.APP, groups=[G])
+
+    with pytest.raises(exceptions.ArgumentResolutionError) as per_node:
+        build(hot=False).resolve(_Outer)
+    with pytest.raises(exceptions.ArgumentResolutionError) as fused:
+        build(hot=True).resolve(_Outer)
+
+    assert str(fused.value) == str(per_node.value)
+    assert "_Outer" in str(fused.value)
+
+
+def test_fused_subgraph_lets_a_type_error_from_inside_a_creator_through() -> None:
+    def _raising_bottom() -> _Bottom:
+        msg = "from inside"
+        raise TypeError(msg)
+
+    def _raising_cached(bottom: _Bottom) -> _Left:  # noqa: ARG001
+        msg = "from inside a resolver step"
+        raise TypeError(msg)
+
+    class Inner(Group):
+        bottom = providers.Factory(creator=_raising_bottom, scope=Scope.APP)
+        left = providers.Factory(creator=_Left, scope=Scope.APP)
+        right = providers.Factory(creator=_Right, scope=Scope.APP)
+        top = providers.Factory(creator=_Top, scope=Scope.APP, hot=True)
+
+    with pytest.raises(TypeError, match="from inside") as exc:
+        Container(scope=Scope.APP, groups=[Inner]).resolve(_Top)
+    assert not isinstance(exc.value, exceptions.CreatorCallError)
+
+    class Step(Group):
+        bottom = providers.Factory(creator=_Bottom, scope=Scope.APP)
+        left = providers.Factory(creator=_raising_cached, scope=Scope.APP, cache=True)
+        right = providers.Factory(creator=_Right, scope=Scope.APP)
+        top = providers.Factory(creator=_Top, scope=Scope.APP, hot=True)
+
+    with pytest.raises(TypeError, match="from inside a resolver step") as exc:
+        Container(scope=Scope.APP, groups=[Step]).resolve(_Top)
+    assert not isinstance(exc.value, exceptions.CreatorCallError)
+
+
+def test_hot_factory_keeps_the_per_node_resolver_when_nothing_fuses() -> None:
+    class _Kw:
+        def __init__(self, *, bottom: _Bottom) -> None: ...
+
+    class G(Group):
+        bottom = providers.Factory(creator=_Bottom, scope=Scope.APP, cache=True)
+        left = providers.Factory(creator=_Left, scope=Scope.APP, hot=True)  # its one dependency is cached
+        kw = providers.Factory(creator=_Kw, scope=Scope.APP, hot=True)  # not positional
+
+    registry = Container(scope=Scope.APP, groups=[G]).providers_registry
+    names = {
+        name: typing.cast("_pytypes.FunctionType", registry.resolver_for(p)).__code__.co_name
+        for name, p in (("left", G.left), ("kw", G.kw))
+    }
+    assert names == {"left": "resolve_arity1", "kw": "resolve"}
+
+
+def test_hot_factory_leaves_a_cycle_to_the_per_node_path() -> None:
+    class G(Group):
+        x = providers.Factory(creator=_CycX, scope=Scope.APP, hot=True)
+        y = providers.Factory(creator=_CycY, scope=Scope.APP)
+
+    with pytest.raises(exceptions.CircularDependencyError):
+        Container(scope=Scope.APP, groups=[G]).resolve_provider(G.x)
+
+
+def test_hot_factory_stops_fusing_past_the_step_cap() -> None:
+    # Each level doubles the transient diamond's expansion; depth 7 is 2**8 - 1 = 255 creator calls.
+    depth = 7
+    ns: dict[str, typing.Any] = {"dataclasses": dataclasses}
+    exec("@dataclasses.dataclass(slots=True)\nclass _D0:\n    pass", ns)  # noqa: S102
+    for i in range(1, depth + 1):
+        exec(f"@dataclasses.dataclass(slots=True)\nclass _D{i}:\n    a: _D{i - 1}\n    b: _D{i - 1}", ns)  # noqa: S102
+    members = {
+        f"d{i}": providers.Factory(creator=ns[f"_D{i}"], scope=Scope.APP, hot=i == depth) for i in range(depth + 1)
+    }
+    group = _pytypes.new_class("_Doubling", (Group,), exec_body=lambda gns: gns.update(members))
+
+    container = Container(scope=Scope.APP, groups=[group])
+    assert isinstance(container.resolve_provider(members["d7"]), ns["_D7"])
+    resolver = container.providers_registry.resolver_for(members["d7"])
+    assert typing.cast("_pytypes.FunctionType", resolver).__code__.co_name == "resolve_positional"
+
+
+def _long_chain(depth: int, *, hot_root: bool) -> "list[providers.Factory[typing.Any]]":
+    nodes = [dataclasses.make_dataclass("_N0", [], slots=True)]
+    for i in range(1, depth):
+        nodes.append(dataclasses.make_dataclass(f"_N{i}", [("prev", nodes[-1])], slots=True))
+    return [
+        providers.Factory(creator=node, scope=Scope.APP, hot=hot_root and i == depth - 1)
+        for i, node in enumerate(nodes)
+    ]
+
+
+@pytest.mark.parametrize("production", [False, True])
+def test_cold_compile_walks_a_program_only_for_a_hot_or_sharing_factory(
+    monkeypatch: pytest.MonkeyPatch, production: bool
+) -> None:
+    walked: list[int] = []
+    fuse_program = resolver_compiler_module._fuse_program
+
+    def _spy(f: "providers.Factory[typing.Any]", registry: ProvidersRegistry) -> typing.Any:  # noqa: ANN401
+        walked.append(f.provider_id)
+        return fuse_program(f, registry)
+
+    monkeypatch.setattr(resolver_compiler_module, "_fuse_program", _spy)
+    chain = _long_chain(8, hot_root=True)
+    group = _pytypes.new_class(
+        "_LongChain", (Group,), exec_body=lambda ns: ns.update({f"p{i}": p for i, p in enumerate(chain)})
+    )
+    container = Container(scope=Scope.APP, groups=[group])
+    if production:
+        container.validate(production=True)
+    for provider in chain:
+        container.resolve_provider(provider)
+    container.providers_registry.in_scope_resolver_for(chain[-1])
+
+    assert walked == [chain[-1].provider_id]  # once, for both of the hot root's resolvers
+
+
+def test_fuse_program_stops_walking_at_the_step_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    chain = _long_chain(300, hot_root=True)
+    group = _pytypes.new_class(
+        "_DeepChain", (Group,), exec_body=lambda ns: ns.update({f"p{i}": p for i, p in enumerate(chain)})
+    )
+    registry = Container(scope=Scope.APP, groups=[group]).providers_registry
+    visited = 0
+    can_call_positionally = resolver_compiler_module._can_call_positionally
+
+    def _spy(f: "providers.Factory[typing.Any]", plan: WiringPlan) -> bool:
+        nonlocal visited
+        visited += 1
+        return can_call_positionally(f, plan)
+
+    monkeypatch.setattr(resolver_compiler_module, "_can_call_positionally", _spy)
+    assert resolver_compiler_module._fuse_program(chain[-1], registry) is None
+    assert visited <= resolver_compiler_module._FUSE_MAX_STEPS + 1
+
+
+# ---------------------------------------------------------------------------
+# Resolution-scoped sharing — a transient built at most once per top-level resolve
+# ---------------------------------------------------------------------------
+
+
+def _fused_name(container: Container, provider: "providers.Factory[typing.Any]") -> str:
+    return typing.cast("_pytypes.FunctionType", container.providers_registry.resolver_for(provider)).__code__.co_name
+
+
+def test_shared_factory_is_built_once_per_resolution() -> None:
+    group = _diamond(hot=False, shared=True)
+    container = Container(scope=Scope.APP, groups=[group])
+    first = container.resolve(_Top)
+    second = container.resolve(_Top)
+    assert first.left.bottom is first.right.bottom
+    assert second.left.bottom is not first.left.bottom, "sharing spans one resolution, not the container"
+    assert _fused_name(container, group.top) == "resolve_fused"
+    assert isinstance(container.resolve(_Bottom), _Bottom)  # reached on its own, it is an ordinary transient
+
+
+def test_share_transients_shares_every_transient_of_the_root() -> None:
+    group = _diamond(hot=False)
+    container = Container(scope=Scope.APP, groups=[group], share_transients=True)
+    top = container.resolve(_Top)
+    assert top.left.bottom is top.right.bottom
+    assert container.build_child_container().resolve(_Top).left.bottom is not top.left.bottom
+
+
+def test_unshared_diamond_keeps_the_per_node_resolver() -> None:
+    group = _diamond(hot=False)
+    container = Container(scope=Scope.APP, groups=[group])
+    assert _fused_name(container, group.top) == "resolve_positional"
+
+
+def test_sharing_collapses_a_doubling_graph_under_the_step_cap() -> None:
+    # Unshared, depth 7 expands to 255 creator calls; shared, each level is built once.
+    depth = 7
+    ns: dict[str, typing.Any] = {"dataclasses": dataclasses}
+    exec("@dataclasses.dataclass(slots=True)\nclass _D0:\n    pass", ns)  # noqa: S102
+    for i in range(1, depth + 1):
+        exec(f"@dataclasses.dataclass(slots=True)\nclass _D{i}:\n    a: _D{i - 1}\n    b: _D{i - 1}", ns)  # noqa: S102
+    members = {f"d{i}": providers.Factory(creator=ns[f"_D{i}"], scope=Scope.APP) for i in range(depth + 1)}
+    group = _pytypes.new_class("_SharedDoubling", (Group,), exec_body=lambda gns: gns.update(members))
+
+    container = Container(scope=Scope.APP, groups=[group], share_transients=True)
+    root = container.resolve_provider(members["d7"])
+    assert root.a is root.b
+    assert root.a.a.a.a.a.a is root.b.b.b.b.b.b
+    assert _fused_name(container, members["d7"]) == "resolve_fused"
+
+
+def test_hot_factory_counts_resolver_steps_against_the_step_cap() -> None:
+    # 33 fused creators stay under the cap, but each one's cached dependency is a step of its own.
+    depth = 33
+    ns: dict[str, typing.Any] = {"dataclasses": dataclasses, "_A": _A}
+    exec("@dataclasses.dataclass(slots=True)\nclass _E0:\n    a: _A", ns)  # noqa: S102
+    for i in range(1, depth):
+        exec(f"@dataclasses.dataclass(slots=True)\nclass _E{i}:\n    prev: _E{i - 1}\n    a: _A", ns)  # noqa: S102
+    members: dict[str, typing.Any] = {
+        f"e{i}": providers.Factory(creator=ns[f"_E{i}"], scope=Scope.APP, hot=i == depth - 1) for i in range(depth)
+    }
+    members["a"] = providers.Factory(creator=_A, scope=Scope.APP, cache=True)
+    group = _pytypes.new_class("_WideChain", (Group,), exec_body=lambda gns: gns.update(members))
+
+    container = Container(scope=Scope.APP, groups=[group])
+    assert isinstance(container.resolve_provider(members[f"e{depth - 1}"]), ns[f"_E{depth - 1}"])
+    assert _fused_name(container, members[f"e{depth - 1}"]) == "resolve_positional"
+
+
+@pytest.mark.parametrize("local", [False, True])
+def test_sharing_holds_under_an_override(local: bool) -> None:
+    group = _diamond(hot=False, shared=True, top_scope=Scope.REQUEST)
+    container = Container(scope=Scope.APP, groups=[group]).build_child_container(scope=Scope.REQUEST)
+    left = _Left(bottom=_Bottom())
+    with container.override(group.left, left, local=local):
+        top = container.resolve(_Top)
+    assert top.left is left
+    assert top.right.bottom is not left.bottom
+
+    with container.override(providers.Factory(creator=_A), _A(), local=local):
+        top = container.resolve(_Top)
+    assert top.left.bottom is top.right.bottom
+
+    bottom = _Bottom()
+    with container.override(group.bottom, bottom, local=local):
+        top = container.resolve(_Top)
+    assert top.left.bottom is bottom
+    assert top.right.bottom is bottom
+
+    with container.override(group.top, "whole", local=local):
+        assert container.resolve(_Top) == "whole"
+
+
+def test_sharing_under_an_override_calls_unfusable_dependencies_through_their_resolver() -> None:
+    @dataclasses.dataclass(slots=True)
+    class _Pair:
+        left: _Left
+        right: _Right
+        a: _A
+
+    class G(Group):
+        a = providers.Factory(creator=_A, scope=Scope.APP, cache=True)
+        bottom = providers.Factory(creator=_Bottom, scope=Scope.APP, shared=True)
+        left = providers.Factory(creator=_Left, scope=Scope.APP)
+        right = providers.Factory(creator=_Right, scope=Scope.APP)
+        pair = providers.Factory(creator=_Pair, scope=Scope.APP)
+
+    container = Container(scope=Scope.APP, groups=[G])
+    singleton = container.resolve(_A)
+    request = container.build_child_container(scope=Scope.REQUEST)
+    with request.override(providers.Factory(creator=_B), _B(), local=True):
+        pair = request.resolve(_Pair)
+    assert pair.a is singleton
+    assert pair.left.bottom is pair.right.bottom
+
+
+def test_sharing_under_an_override_prepends_ancestors_and_passes_inner_type_errors() -> None:
+    class _Ctx: ...
+
+    @dataclasses.dataclass(slots=True)
+    class _NeedsCtx:
+        ctx: _Ctx
+
+    @dataclasses.dataclass(slots=True)
+    class _Both:
+        left: _Left
+        right: _Right
+        needs: _NeedsCtx
+
+    def build(bottom_creator: typing.Callable[[], _Bottom], *, shared: bool) -> Container:
+        class G(Group):
+            ctx = providers.ContextProvider(scope=Scope.APP, context_type=_Ctx)
+            needs = providers.Factory(creator=_NeedsCtx, scope=Scope.APP)
+            bottom = providers.Factory(creator=bottom_creator, scope=Scope.APP, shared=shared, bound_type=_Bottom)
+            left = providers.Factory(creator=_Left, scope=Scope.APP)
+            right = providers.Factory(creator=_Right, scope=Scope.APP)
+            both = providers.Factory(creator=_Both, scope=Scope.APP)
+
+        request = Container(scope=Scope.APP, groups=[G]).build_child_container(scope=Scope.REQUEST)
+        request.override(providers.Factory(creator=_A), _A(), local=True)
+        return request
+
+    with pytest.raises(exceptions.ArgumentResolutionError) as per_node:
+        build(_Bottom, shared=False).resolve(_Both)
+    with pytest.raises(exceptions.ArgumentResolutionError) as tree:
+        build(_Bottom, shared=True).resolve(_Both)
+    assert str(tree.value) == str(per_node.value)
+
+    def _raising_bottom() -> _Bottom:
+        msg = "from inside"
+        raise TypeError(msg)
+
+    with pytest.raises(TypeError, match="from inside") as exc:
+        build(_raising_bottom, shared=True).resolve(_Both)
+    assert not isinstance(exc.value, exceptions.CreatorCallError)
+
+
+def _right_with_retries(bottom: _Bottom, retries: int = 1) -> _Right:  # noqa: ARG001
+    return _Right(bottom=bottom)
+
+
+@pytest.mark.parametrize("share_transients", [False, True])
+def test_sharing_reaches_through_a_dependency_called_with_kwargs(share_transients: bool) -> None:
+    class G(Group):
+        bottom = providers.Factory(creator=_Bottom, scope=Scope.APP, shared=not share_transients)
+        left = providers.Factory(creator=_Left, scope=Scope.APP)
+        right = providers.Factory(creator=_right_with_retries, scope=Scope.APP)  # a default: not fusable
+        top = providers.Factory(creator=_Top, scope=Scope.APP)
+
+    container = Container(scope=Scope.APP, groups=[G], share_transients=share_transients)
+    first, second = container.resolve(_Top), container.resolve(_Top)
+    assert first.left.bottom is first.right.bottom
+    assert second.left.bottom is not first.left.bottom
+
+
+def test_sharing_spans_a_cached_provider_built_in_the_same_resolve() -> None:
+    @dataclasses.dataclass(slots=True)
+    class _Holder:
+        top: _Top
+        bottom: _Bottom
+
+    group = _diamond(hot=False, shared=True)
+    holder = providers.Factory(creator=_Holder, scope=Scope.APP, cache=True)
+    container = Container(scope=Scope.APP, groups=[group])
+    container.providers_registry.add_providers(holder)
+    resolved = container.resolve(_Holder)
+    assert resolved.top.left.bottom is resolved.top.right.bottom is resolved.bottom
+
+    class CachedTop(Group):
+        bottom = providers.Factory(creator=_Bottom, scope=Scope.APP, shared=True)
+        left = providers.Factory(creator=_Left, scope=Scope.APP)
+        right = providers.Factory(creator=_Right, scope=Scope.APP)
+        top = providers.Factory(creator=_Top, scope=Scope.APP, cache=True)
+
+    top = Container(scope=Scope.APP, groups=[CachedTop]).resolve(_Top)
+    assert top.left.bottom is top.right.bottom
+
+
+def test_sharing_spans_scopes_and_aliases() -> None:
+    class _SharedBottom(_Bottom): ...
+
+    class G(Group):
+        bottom = providers.Factory(creator=_SharedBottom, scope=Scope.APP, shared=True)
+        alias = providers.Alias(source_type=_SharedBottom, bound_type=_Bottom)
+        left = providers.Factory(creator=_Left, scope=Scope.APP)
+        right = providers.Factory(creator=_Right, scope=Scope.REQUEST)
+        top = providers.Factory(creator=_Top, scope=Scope.REQUEST)
+
+    request = Container(scope=Scope.APP, groups=[G]).build_child_container(scope=Scope.REQUEST)
+    top = request.resolve(_Top)
+    assert isinstance(top.left.bottom, _SharedBottom)
+    assert top.left.bottom is top.right.bottom
+    assert request.resolve(_Top).left.bottom is not top.left.bottom
+
+
+def test_production_profile_keeps_a_shared_program_on_the_full_resolver() -> None:
+    @dataclasses.dataclass(slots=True)
+    class _Holder:
+        top: _Top
+
+    group = _diamond(hot=False, shared=True)
+    holder = providers.Factory(creator=_Holder, scope=Scope.APP, cache=True)
+    container = Container(scope=Scope.APP, groups=[group])
+    container.providers_registry.add_providers(holder)
+    container.validate(production=True)
+    registry = container.providers_registry
+    assert registry.in_scope_resolver_for(group.top) is registry.resolver_for(group.top)
+    top = container.resolve(_Holder).top
+    assert top.left.bottom is top.right.bottom
+
+    hot = _diamond(hot=True)
+    unshared = Container(scope=Scope.APP, groups=[hot])
+    unshared.validate(production=True)
+    registry = unshared.providers_registry
+    assert registry.in_scope_resolver_for(hot.top) is registry.resolver_for(hot.top)  # a hot program too
+
+
+# ---------------------------------------------------------------------------
+# Compiled overrides — a tree-wide override recompiles only what it reaches
+# ---------------------------------------------------------------------------
+
+
+class _AIface: ...
+
+
+@dataclasses.dataclass(slots=True)
+class _Valued:
+    value: int
+
+
+@dataclasses.dataclass(slots=True)
+class _NeedsReq:
+    req: _Req  # never registered: unwireable
+
+
+def _override_target(kind: str) -> "tuple[Container, AbstractProvider[typing.Any]]":
+    """Build a compiled root whose `kind` of closure resolves the returned provider."""
+    cached = providers.Factory(creator=_A, scope=Scope.APP, cache=True)
+    kwargs = providers.Factory(creator=_Valued, scope=Scope.APP, kwargs={"value": 1})
+    unwireable = providers.Factory(creator=_NeedsReq, scope=Scope.APP)
+    alias = providers.Alias(source_type=_A, bound_type=_AIface)
+    context = providers.ContextProvider(_C, scope=Scope.APP)
+    container = Container(scope=Scope.APP, pin_singletons=kind == "pinned")
+    container.providers_registry.add_providers(cached, kwargs, unwireable, alias, context)
+    if kind in {"slotted", "bound_alias"}:
+        container.freeze()
+    container.compile_all()
+    by_kind: dict[str, AbstractProvider[typing.Any]] = {
+        "kwargs": kwargs,
+        "unwireable": unwireable,
+        "alias": alias,
+        "bound_alias": alias,
+        "context": context,
+        "container": providers.container_provider,
+    }
+    return container, by_kind.get(kind, cached)  # cached, pinned and slotted resolve the cached factory
+
+
+@pytest.mark.parametrize("local", [False, True])
+@pytest.mark.parametrize(
+    "kind", ["kwargs", "cached", "pinned", "slotted", "unwireable", "alias", "bound_alias", "container", "context"]
+)
+def test_every_closure_returns_an_override_set_after_it_compiled(kind: str, local: bool) -> None:
+    # Tree-wide: the compiled resolver is swapped for the override. Local: each closure's own
+    # front-guard finds it in the layer.
+    container, provider = _override_target(kind)
+    subject = _override_subject(container, local=local)
+    sentinel = object()
+    subject.override(provider, sentinel, local=local)
+    assert subject.resolve_provider(provider) is sentinel
+
+
+@pytest.mark.parametrize("production", [False, True])
+def test_override_recompiles_only_the_overridden_provider_and_its_dependents(production: bool) -> None:
+    class G(Group):
+        a = providers.Factory(creator=_A, scope=Scope.APP)
+        b = providers.Factory(creator=_B, scope=Scope.APP)
+        c = providers.Factory(creator=_C, scope=Scope.APP)
+        ordered = providers.Factory(creator=_Ordered, scope=Scope.APP)
+        unrelated = providers.Factory(creator=_Req, scope=Scope.APP)
+
+    container = Container(scope=Scope.APP, groups=[G])
+    if production:
+        container.validate(production=True)
+    container.resolve(_Ordered)
+    container.resolve(_Req)
+    registry = container.providers_registry
+    memo = registry._in_scope_resolvers if production else registry._resolvers  # what `ordered` calls `b` by
+    kept = {
+        G.b.provider_id: memo[G.b.provider_id],
+        G.unrelated.provider_id: registry._resolvers[G.unrelated.provider_id],
+    }
+
+    sentinel = _A()
+    container.override(G.a, sentinel)
+    assert G.a.provider_id not in memo
+    assert G.ordered.provider_id not in registry._resolvers
+    assert not container.overrides_registry.has_overrides  # nothing else checks for it
+    assert container.resolve(_Ordered).a is sentinel
+    assert {pid: memo.get(pid) or registry._resolvers[pid] for pid in kept} == kept
+
+    container.reset_override(G.a)
+    assert isinstance(container.resolve(_Ordered).a, _A)
+    assert container.resolve(_Ordered).a is not sentinel
+    container.reset_override(G.a)  # nothing left to drop: no recompile
+    assert {pid: memo.get(pid) or registry._resolvers[pid] for pid in kept} == kept
+
+
+def test_override_recompiles_every_transitive_dependent() -> None:
+    container, root = _hot_chain(4)  # the fused program inlines every node below its root
+    members = list(container.providers_registry)
+    leaf = next(p for p in members if p.bound_type is _CHAIN[0])
+    middle = next(p for p in members if p.bound_type is _CHAIN[2])
+    container.resolve_provider(middle)
+    sentinel = _CHAIN[0]()
+    with container.override(leaf, sentinel):
+        assert container.resolve_provider(root).dep.dep.dep is sentinel
+        assert container.resolve_provider(middle).dep.dep is sentinel
+    assert container.resolve_provider(root).dep.dep.dep is not sentinel
+
+
+def test_frozen_alias_recompiles_around_an_overridden_source() -> None:
+    container, alias = _override_target("bound_alias")
+    container.resolve_provider(alias)
+    source = container.providers_registry.find_provider(_A)
+    assert source is not None
+    sentinel = object()
+    with container.override(source, sentinel):
+        assert container.resolve_provider(alias) is sentinel
+    assert isinstance(container.resolve_provider(alias), _A)
+
+
+def test_override_many_recompiles_once_for_the_whole_batch() -> None:
+    class G(Group):
+        a = providers.Factory(creator=_A, scope=Scope.APP)
+        b = providers.Factory(creator=_B, scope=Scope.APP)
+        c = providers.Factory(creator=_C, scope=Scope.APP)
+        ordered = providers.Factory(creator=_Ordered, scope=Scope.APP)
+
+    container = Container(scope=Scope.APP, groups=[G])
+    container.resolve(_Ordered)
+    registry = container.providers_registry
+    generation = registry._generation
+    a, b = _A(), _B()
+    container.override_many({G.a: a, G.b: b})
+    assert registry._generation == generation + 1
+    ordered = container.resolve(_Ordered)
+    assert (ordered.a, ordered.b) == (a, b)
+
+    request = container.build_child_container(scope=Scope.REQUEST)
+    c = _C()
+    request.override_many({G.c: c}, local=True)
+    assert request.resolve_provider(G.c) is c
+    assert container.resolve_provider(G.c) is not c